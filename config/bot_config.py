@@ -12,6 +12,15 @@ MAX_MONTHLY_WRITES = 500
 DEFAULT_CHECK_INTERVAL = 300  # 5 minutes
 MIN_CHECK_INTERVAL = 60  # 1 minute
 MAX_CHECK_INTERVAL = 3600  # 1 hour
+# Longest wait for an exhausted rate limit window (learned from the x-rate-limit-*
+# headers) before a request is dropped instead of being sent and rejected
+MAX_RATE_LIMIT_WAIT = 15 * 60
+
+# Adaptive Polling
+# Polls are spaced so the reads left last until the monthly reset
+POLL_BURST_POLLS = 3  # Fast polls after a poll that found mentions
+POLL_BURST_SPEEDUP = 0.25  # Planned interval multiplier during a burst
+POLL_MAX_BACKOFF = 4  # Largest planned interval multiplier when quiet (grows by BACKOFF_FACTOR)
 
 # Request Parameters
 MAX_RESULTS_PER_REQUEST = 5
@@ -25,7 +34,29 @@ TWEET_FIELDS = [
 USER_FIELDS = ['username', 'name']
 EXPANSIONS = ['author_id', 'referenced_tweets.id']
 
+# HTTP Connection Settings
+HTTP_POOL_CONNECTIONS = 1  # Hosts to keep pools for (all calls go to API_BASE_URL)
+HTTP_POOL_MAXSIZE = 4  # Connections per host; at least the number of threads making API calls
+HTTP_KEEP_ALIVE = True  # Reuse connections between calls instead of a new TCP+TLS handshake each
+
+# Model Settings
+# Inference backend: 'pytorch' (fp32), 'quantized' (int8 dynamic quantization, CPU)
+# or 'onnx' (ONNX Runtime, CPU; export with scripts/export_model.py)
+MODEL_BACKEND = "pytorch"
+MODEL_PATH = "models/fine_tuned_model"
+ONNX_MODEL_PATH = "models/onnx/model.onnx"
+MODEL_NUM_THREADS = None  # CPU threads for inference, None for the library default
+
+# Mention Pipeline Settings
+MENTION_QUEUE_SIZE = 50  # Mentions waiting for a response worker
+REPLY_QUEUE_SIZE = 50  # Replies waiting to be posted
+RESPONSE_WORKERS = 2
+REPLY_INTERVAL = 5  # Minimum seconds between two replies
+PIPELINE_SHUTDOWN_TIMEOUT = 30  # seconds
+PROCESSED_TWEET_RETENTION = 30 * 24 * 60 * 60  # Seconds processed tweet IDs are remembered
+
 # Response Settings
+MAX_TWEET_LENGTH = 280  # Replies are cut to fit a single tweet
 MAX_RETRIES = 3
 BACKOFF_FACTOR = 2
 JITTER_RANGE = (-30, 30)  # seconds
@@ -70,6 +70,7 @@ INDEXES = {
     'words_language_idx': 'CREATE INDEX IF NOT EXISTS words_language_idx ON words(language)',
     'words_confidence_idx': 'CREATE INDEX IF NOT EXISTS words_confidence_idx ON words(confidence_score)',
     'etymologies_root_idx': 'CREATE INDEX IF NOT EXISTS etymologies_root_idx ON etymologies(sanskrit_root)',
+    'etymologies_word_idx': 'CREATE INDEX IF NOT EXISTS etymologies_word_idx ON etymologies(word_id, sanskrit_root)',
     'verifications_llm_idx': 'CREATE INDEX IF NOT EXISTS verifications_llm_idx ON verifications(llm_name)'
 }
 
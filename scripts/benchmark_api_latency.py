@@ -0,0 +1,97 @@
+"""Benchmark per-call API latency with and without connection pooling.
+
+Compares a new connection per call (plain requests.get) with a session
+configured like the bot's (kept-alive connections from an HTTPAdapter pool).
+By default the calls go to a local stub server, where the saving is only the
+TCP handshake; pass --url to measure against a real HTTPS endpoint, where the
+TLS handshake is saved too.
+
+Usage:
+    python scripts/benchmark_api_latency.py [--calls 200] [--rounds 3] [--url URL]
+"""
+
+import argparse
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(project_root))
+
+from config import bot_config as cfg
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Answers every GET with an empty mentions response, keeping the connection open."""
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        # Without this, Nagle's algorithm stalls responses on kept-alive connections
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        payload = b'{"meta": {"result_count": 0}}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+def pooled_session() -> requests.Session:
+    """A session with the bot's connection pool settings."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=cfg.HTTP_POOL_CONNECTIONS, pool_maxsize=cfg.HTTP_POOL_MAXSIZE)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def mean_latency(get, url: str, calls: int, rounds: int) -> float:
+    """Best mean seconds per call over a few rounds."""
+    get(url)  # Warm-up
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(calls):
+            get(url)
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs unpooled API calls")
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--url", help="Endpoint to call instead of a local stub server")
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if not url:
+        server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/mentions"
+
+    try:
+        print(f"{args.calls} calls to {url}")
+        unpooled = mean_latency(requests.get, url, args.calls, args.rounds)
+        with pooled_session() as session:
+            pooled = mean_latency(session.get, url, args.calls, args.rounds)
+        print(f"  {'new connection per call':<24} {unpooled * 1000:>8.2f} ms/call")
+        print(f"  {'pooled keep-alive':<24} {pooled * 1000:>8.2f} ms/call   ({unpooled / pooled:.1f}x)")
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark single-word vs batched IndicBERT inference on CPU.
+
+Usage:
+    python scripts/benchmark_inference.py [--model models/fine_tuned_model]
+        [--labels data/sanskrit_roots.json] [--words 256] [--threads 4]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(project_root))
+
+import torch
+
+from src.models.indic_bert_handler import IndicBertHandler
+
+# Used when the labels file has fewer words than requested
+SAMPLE_WORDS = [
+    'धर्म', 'कर्म', 'विद्यालय', 'पुस्तक', 'समाचार', 'அன்பு', 'தர்மம்', 'விஞ்ஞானம்',
+    'ధర్మం', 'విద్య', 'ಧರ್ಮ', 'ವಿದ್ಯಾರ್ಥಿ', 'ധർമ്മം', 'വിദ്യാലയം', 'ধর্ম', 'বিদ্যালয়'
+]
+
+def load_words(labels_path: Path, count: int):
+    """Take benchmark words from the labels file, topped up with sample words."""
+    words = []
+    if labels_path.exists():
+        with open(labels_path, 'r', encoding='utf-8') as f:
+            words = list(json.load(f))[:count]
+    while len(words) < count:
+        words.append(SAMPLE_WORDS[len(words) % len(SAMPLE_WORDS)])
+    return words
+
+def words_per_second(fn, words, rounds: int) -> float:
+    """Best throughput over a few rounds."""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn(words)
+        best = min(best, time.perf_counter() - start)
+    return len(words) / best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark IndicBERT inference")
+    parser.add_argument("--model", default="models/fine_tuned_model", help="Model and tokenizer path")
+    parser.add_argument("--labels", type=Path, default=Path("data/sanskrit_roots.json"))
+    parser.add_argument("--words", type=int, default=256, help="Number of words to classify")
+    parser.add_argument("--threads", type=int, default=None, help="torch CPU threads")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    handler = IndicBertHandler(args.model, args.model, str(args.labels))
+    handler.model.to('cpu')
+    handler.device = torch.device('cpu')
+    words = load_words(args.labels, args.words)
+
+    # Warm up
+    handler.predict_batch(words[:8], 'devanagari')
+
+    print(f"{len(words)} words, {torch.get_num_threads()} CPU threads")
+    single = words_per_second(
+        lambda batch: [handler.predict(word, 'devanagari') for word in batch], words, args.rounds
+    )
+    print(f"  {'single':<18} {single:>9.1f} words/s")
+
+    for batch_size in (8, 16, 32, 64):
+        batched = words_per_second(
+            lambda batch: handler.predict_batch(batch, 'devanagari', max_batch_size=batch_size),
+            words, args.rounds
+        )
+        print(f"  {'batch ' + str(batch_size):<18} {batched:>9.1f} words/s ({batched / single:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark HTML parsing backends on saved scraper pages.
+
+Each page is parsed with every installed backend, once building the full
+tree and once with the scraper's targeted strainer. Pages are matched to
+a scraper by file name prefix (e.g. wiktionary_entry.html).
+
+Usage:
+    python scripts/benchmark_parsers.py [--pages DIR] [--repeat N]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(project_root))
+
+from src.data.scrapers.html_parsing import available_parsers, parse_html
+from src.data.scrapers.wiktionary_scraper import WiktionaryScraper
+from src.data.scrapers.ddsa_scraper import DDSAScraper
+from src.data.scrapers.sanskrit_dict_scraper import SanskritDictScraper
+from src.data.scrapers.wikisource_scraper import WikisourceScraper
+
+# File name prefix -> strainer the scraper uses for that kind of page
+STRAINERS = {
+    'wiktionary': WiktionaryScraper.ENTRY_PARSE_ONLY,
+    'ddsa': DDSAScraper.ENTRY_PARSE_ONLY,
+    'sanskrit_dict': SanskritDictScraper.ENTRY_PARSE_ONLY,
+    'wikisource': WikisourceScraper.CONTENT_PARSE_ONLY
+}
+
+def strainer_for(page: Path):
+    """Find the strainer for a page from its file name."""
+    for prefix, strainer in STRAINERS.items():
+        if page.name.startswith(prefix):
+            return strainer
+    return None
+
+def time_parse(markup: str, parser: str, parse_only, repeat: int) -> float:
+    """Return the best per-parse time in milliseconds."""
+    timer = timeit.Timer(lambda: parse_html(markup, parser, parse_only))
+    runs = timer.repeat(repeat=5, number=repeat)
+    return min(runs) / repeat * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML parsing backends")
+    parser.add_argument(
+        "--pages", type=Path, default=project_root / "tests" / "fixtures" / "html",
+        help="Directory of saved HTML pages"
+    )
+    parser.add_argument("--repeat", type=int, default=50, help="Parses per timing run")
+    args = parser.parse_args()
+
+    pages = sorted(args.pages.glob("*.html"))
+    if not pages:
+        print(f"No HTML pages found in {args.pages}")
+        return
+
+    backends = available_parsers()
+    print(f"Installed backends: {', '.join(backends)}")
+    print(f"{'page':<28} {'KiB':>6} {'backend':<12} {'full ms':>9} {'targeted ms':>12} {'speedup':>8}")
+
+    totals = {backend: [0.0, 0.0] for backend in backends}
+    for page in pages:
+        markup = page.read_text(encoding='utf-8')
+        strainer = strainer_for(page)
+        size = len(markup.encode('utf-8')) / 1024
+
+        for backend in backends:
+            full = time_parse(markup, backend, None, args.repeat)
+            targeted = time_parse(markup, backend, strainer, args.repeat) if strainer else full
+            totals[backend][0] += full
+            totals[backend][1] += targeted
+            print(f"{page.name:<28} {size:>6.1f} {backend:<12} {full:>9.3f} {targeted:>12.3f} {full / targeted:>7.1f}x")
+
+    print()
+    print("Mean parse time per page:")
+    baseline = totals['html.parser'][0] / len(pages)
+    for backend, (full, targeted) in totals.items():
+        full /= len(pages)
+        targeted /= len(pages)
+        print(
+            f"  {backend:<12} full {full:.3f} ms, targeted {targeted:.3f} ms "
+            f"({baseline / targeted:.1f}x faster than full html.parser)"
+        )
+
+if __name__ == "__main__":
+    main()
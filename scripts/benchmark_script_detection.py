@@ -0,0 +1,97 @@
+"""Benchmark script detection on tweet-length texts.
+
+Compares the single-pass ScriptClassifier used by QueryHandler._detect_script
+and ScriptUtils.get_script with the per-script regex scans and per-character
+range loops they replaced.
+
+Usage:
+    python scripts/benchmark_script_detection.py [--texts 2000] [--rounds 5]
+"""
+
+import argparse
+import random
+import re
+import sys
+import timeit
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(project_root))
+
+from src.bot.query_handler import QueryHandler
+from src.utils.script_utils import Script, ScriptUtils
+
+SAMPLE_TWEETS = [
+    "@sanskrit_bot धर्म का अर्थ क्या है?",
+    "@sanskrit_bot what is the meaning of karma?",
+    "@sanskrit_bot ধর্ম মানে কি #bangla",
+    "@sanskrit_bot அன்பு பொருள் என்ன",
+    "@sanskrit_bot ధర్మం అర్ధం ఏమిటి",
+    "@sanskrit_bot ಧರ್ಮ ಅರ್ಥ ಏನು 🙏",
+    "@sanskrit_bot വിദ്യാലയം അർത്ഥം എന്താണ്",
+    "@sanskrit_bot etymology of dharma? विद्या and विद्यालय",
+]
+
+# Old QueryHandler._detect_script: one regex scan per script
+SCRIPT_PATTERNS = {
+    script.value: re.compile('[{}-{}]'.format(*map(chr, ScriptUtils.SCRIPT_RANGES[script][0])))
+    for script in QueryHandler.INDIC_SCRIPTS
+}
+
+def regex_detect_script(text: str) -> str:
+    script_counts = {script: len(pattern.findall(text)) for script, pattern in SCRIPT_PATTERNS.items()}
+    if all(count == 0 for count in script_counts.values()):
+        return 'latin'
+    return max(script_counts.items(), key=lambda x: x[1])[0]
+
+# Old ScriptUtils.get_script: every character against every range
+def loop_get_script(text: str) -> Script:
+    script_counts = {script: 0 for script in Script}
+    for char in text:
+        char_code = ord(char)
+        for script, ranges in ScriptUtils.SCRIPT_RANGES.items():
+            if any(start <= char_code <= end for start, end in ranges):
+                script_counts[script] += 1
+                break
+    return max(script_counts.items(), key=lambda x: x[1])[0]
+
+def make_texts(count: int, length: int):
+    """Tweets of roughly the given length, built from the samples."""
+    random.seed(length)
+    texts = []
+    for _ in range(count):
+        text = ''
+        while len(text) < length:
+            text += random.choice(SAMPLE_TWEETS) + ' '
+        texts.append(text[:length])
+    return texts
+
+def best_time(fn, texts, rounds: int) -> float:
+    """Best microseconds per text over a few rounds."""
+    timer = timeit.Timer(lambda: [fn(text) for text in texts])
+    return min(timer.repeat(repeat=rounds, number=1)) / len(texts) * 1e6
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark script detection")
+    parser.add_argument("--texts", type=int, default=2000, help="Texts per length")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    detector = QueryHandler()
+    print(f"{'length':>6} {'regex us':>9} {'detect us':>10} {'speedup':>8} {'loop us':>8} {'get us':>7} {'speedup':>8}")
+    for length in (40, 140, 280):
+        texts = make_texts(args.texts, length)
+        for text in texts:
+            assert detector._detect_script(text) == regex_detect_script(text)
+            assert ScriptUtils.get_script(text) == loop_get_script(text)
+
+        regex = best_time(regex_detect_script, texts, args.rounds)
+        detect = best_time(detector._detect_script, texts, args.rounds)
+        loop = best_time(loop_get_script, texts, args.rounds)
+        get = best_time(ScriptUtils.get_script, texts, args.rounds)
+        print(f"{length:>6} {regex:>9.2f} {detect:>10.2f} {regex / detect:>7.1f}x "
+              f"{loop:>8.2f} {get:>7.2f} {loop / get:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
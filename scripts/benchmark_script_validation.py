@@ -0,0 +1,104 @@
+"""Benchmark ScriptUtils validation and cleaning over a 100k-word sample.
+
+Compares the precomputed character tables behind validate_script,
+clean_text and contains_script with the per-character range checks they
+replaced, and checks both give the same results.
+
+Usage:
+    python scripts/benchmark_script_validation.py [--words 100000] [--rounds 3]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(project_root))
+
+from src.utils.script_utils import Script, ScriptUtils
+
+SAMPLE_WORDS = [
+    'धर्म', 'कर्म', 'विद्यालय', 'संस्कृतम्', 'अंगुलि', 'ধর্ম', 'বিদ্যালয়', 'அன்பு', 'தர்மம்',
+    'ధర్మం', 'విద్య', 'ಧರ್ಮ', 'ವಿದ್ಯಾರ್ಥಿ', 'ധർമ്മം', 'ਧਰਮ', 'ધર્મ', 'ଧର୍ମ', 'dharma',
+    'dharmaḥ', 'vidyā', '१२३', 'धर्म-1', 'धर्म (n.)', 'कर्म '
+]
+
+def legacy_validate_script(text, expected_script, allow_numerals=True, allow_diacritics=True):
+    for char in text:
+        char_code = ord(char)
+        if char.isspace():
+            continue
+        if char.isnumeric():
+            if not allow_numerals:
+                return False
+            continue
+        if char_code in ScriptUtils.DIACRITICS:
+            if not allow_diacritics:
+                return False
+            continue
+        ranges = ScriptUtils.SCRIPT_RANGES[expected_script]
+        if not any(start <= char_code <= end for start, end in ranges):
+            return False
+    return True
+
+def legacy_clean_text(text, script):
+    cleaned = []
+    for char in text:
+        char_code = ord(char)
+        if char.isspace():
+            cleaned.append(char)
+            continue
+        if char_code in ScriptUtils.DIACRITICS:
+            cleaned.append(char)
+            continue
+        ranges = ScriptUtils.SCRIPT_RANGES[script]
+        if any(start <= char_code <= end for start, end in ranges):
+            cleaned.append(char)
+    return ''.join(cleaned)
+
+def legacy_contains_script(text, script):
+    ranges = ScriptUtils.SCRIPT_RANGES[script]
+    return any(any(start <= ord(char) <= end for start, end in ranges) for char in text)
+
+def best_time(fn, words, rounds: int) -> float:
+    """Best seconds for one pass over the words."""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for word in words:
+            fn(word)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ScriptUtils validation")
+    parser.add_argument("--words", type=int, default=100000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    random.seed(0)
+    words = [random.choice(SAMPLE_WORDS) for _ in range(args.words)]
+
+    # Build the tables before timing
+    ScriptUtils.validate_script('', Script.DEVANAGARI)
+    ScriptUtils.clean_text('', Script.DEVANAGARI)
+
+    cases = [
+        ('validate_script', legacy_validate_script, ScriptUtils.validate_script),
+        ('clean_text', legacy_clean_text, ScriptUtils.clean_text),
+        ('contains_script', legacy_contains_script, ScriptUtils.contains_script),
+    ]
+    print(f"{len(words)} words, Devanagari")
+    for name, legacy, current in cases:
+        for word in SAMPLE_WORDS:
+            assert legacy(word, Script.DEVANAGARI) == current(word, Script.DEVANAGARI), (name, word)
+
+        before = best_time(lambda word: legacy(word, Script.DEVANAGARI), words, args.rounds)
+        after = best_time(lambda word: current(word, Script.DEVANAGARI), words, args.rounds)
+        print(f"  {name:<16} {before * 1000:>8.1f} ms -> {after * 1000:>7.1f} ms ({before / after:.1f}x)")
+
+if __name__ == "__main__":
+    main()
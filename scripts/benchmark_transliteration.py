@@ -0,0 +1,74 @@
+"""Benchmark transliteration throughput.
+
+Measures words per second for IAST to each Brahmic script, each script back
+to IAST, and the old chained str.replace IAST-to-Devanagari conversion.
+
+Usage:
+    python scripts/benchmark_transliteration.py [--words 20000] [--rounds 3]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(project_root))
+
+from src.utils.script_utils import Script
+from src.utils.transliteration import BRAHMIC_SCRIPTS, get_transliterator
+
+SAMPLE_WORDS = [
+    'dharma', 'karma', 'kṛṣṇa', 'saṃskṛtam', 'vidyālaya', 'ātman', 'bhagavadgītā',
+    'aiśvarya', 'kauśalya', 'jñāna', 'praṇāma', 'rāmaḥ', 'saṅgha', 'upaniṣad', 'ahiṃsā'
+]
+
+# The mapping convert_iast_to_devanagari used before the transliteration engine
+OLD_IAST_TO_DEVANAGARI = {
+    'ā': 'आ', 'ī': 'ई', 'ū': 'ऊ', 'ṛ': 'ऋ', 'ṝ': 'ॠ',
+    'ḷ': 'ऌ', 'ḹ': 'ॡ', 'ṃ': 'ं', 'ḥ': 'ः',
+    'ś': 'श', 'ṣ': 'ष', 'ñ': 'ञ', 'ṅ': 'ङ', 'ṇ': 'ण',
+    'ṭ': 'ट', 'ḍ': 'ड', 'ṛh': 'ऋ', 'ṝh': 'ॠ'
+}
+
+def old_convert_iast_to_devanagari(text: str) -> str:
+    text = text.replace('ṛh', 'ऋ').replace('ṝh', 'ॠ')
+    for iast, dev in OLD_IAST_TO_DEVANAGARI.items():
+        text = text.replace(iast, dev)
+    return text
+
+def words_per_second(fn, words, rounds: int) -> float:
+    """Best throughput over a few rounds."""
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for word in words:
+            fn(word)
+        best = min(best, time.perf_counter() - start)
+    return len(words) / best
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark transliteration")
+    parser.add_argument("--words", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    random.seed(0)
+    words = [random.choice(SAMPLE_WORDS) for _ in range(args.words)]
+
+    print(f"{len(words)} words")
+    old = words_per_second(old_convert_iast_to_devanagari, words, args.rounds)
+    print(f"  {'old str.replace chain':<24} {old:>10.0f} words/s")
+
+    for script in BRAHMIC_SCRIPTS:
+        transliterator = get_transliterator(script)
+        converted = [transliterator.from_iast(word) for word in words]
+        from_iast = words_per_second(transliterator.from_iast, words, args.rounds)
+        to_iast = words_per_second(transliterator.to_iast, converted, args.rounds)
+        print(f"  {'iast -> ' + script.value:<24} {from_iast:>10.0f} words/s   "
+              f"{script.value + ' -> iast':<20} {to_iast:>10.0f} words/s")
+
+if __name__ == "__main__":
+    main()
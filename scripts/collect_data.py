@@ -1,5 +1,6 @@
 """Script to collect dictionary data for all supported languages."""
 
+import argparse
 import os
 import sys
 import sqlite3
@@ -11,6 +12,8 @@ sys.path.insert(0, str(project_root))
 
 from src.core.database import Database
 from src.data.data_collection import DataCollector
+from src.data.scrapers.http_cache import ResponseCache
+from src.data.scrapers.crawl_state import CRAWL_MODES, CrawlStateStore
 
 def init_database(db_path: Path):
     """Initialize the database with required tables."""
@@ -38,6 +41,14 @@ def init_database(db_path: Path):
     conn.close()
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--mode", choices=CRAWL_MODES, default="resume",
+        help="full: crawl from scratch; resume: continue an interrupted crawl; "
+             "delta: only process pages that changed since the last crawl"
+    )
+    args = parser.parse_args()
+    
     # Initialize database
     db_path = project_root / "data" / "dictionary_data.db"
     init_database(db_path)
@@ -47,12 +58,27 @@ def main():
     cache_dir = project_root / "data" / "cache"
     cache_dir.mkdir(parents=True, exist_ok=True)
     
-    # Initialize collector with all languages and scrapers
-    collector = DataCollector(db)
+    # Re-runs revalidate cached pages instead of downloading them again
+    response_cache = ResponseCache(cache_dir / "http_cache.db")
+    
+    # Checkpoints let an interrupted crawl pick up where it stopped
+    crawl_state = CrawlStateStore(cache_dir / "crawl_state.db")
+    
+    # Initialize collector with all languages and scrapers, running
+    # scrapers for different hosts concurrently
+    collector = DataCollector(
+        db,
+        max_workers=8,
+        response_cache=response_cache,
+        crawl_state=crawl_state,
+        crawl_mode=args.mode
+    )
     
     # Start collection
-    print("Starting dictionary data collection for all languages...")
+    print(f"Starting dictionary data collection for all languages ({args.mode} crawl)...")
     collector.collect_and_store(cache_dir=str(cache_dir))
+    response_cache.close()
+    crawl_state.close()
     print("Data collection completed!")
 
 if __name__ == "__main__":
@@ -0,0 +1,111 @@
+"""Compare accuracy and CPU latency of the IndicBERT inference backends.
+
+Runs the fp32 PyTorch model and each optimized backend over a labelled word
+set, and reports accuracy, agreement with fp32 predictions, per-word latency
+and batched throughput. The labelled set is the output of
+IndicBertHandler.prepare_training_data (a JSON list, or JSON lines, of
+{"text": ..., "label": 0|1}).
+
+Usage:
+    python scripts/compare_backends.py --data data/processed/words_test.json
+        [--model models/fine_tuned_model] [--onnx models/onnx/model.onnx]
+        [--onnx-int8 models/onnx/model.int8.onnx] [--threads 4] [--limit 1000]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(project_root))
+
+from src.models.indic_bert_handler import IndicBertHandler
+
+def load_examples(path: Path, limit: int):
+    """Load (word, label) pairs from a JSON list or JSON lines file."""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read().strip()
+    if text.startswith('['):
+        records = json.loads(text)
+    else:
+        records = [json.loads(line) for line in text.splitlines() if line.strip()]
+    examples = [(record['text'], int(record['label'])) for record in records]
+    return examples[:limit] if limit else examples
+
+def evaluate(handler: IndicBertHandler, words, batch_size: int):
+    """Classify every word singly (for latency) and in batches (for throughput)."""
+    # Warm up
+    handler.predict_batch(words[:8], 'devanagari')
+
+    # Classify one word at a time, keeping the raw class so words without
+    # root/meaning labels still count
+    predictions = []
+    latencies = []
+    for word in words:
+        start = time.perf_counter()
+        features = [handler.tokenizer(word, truncation=True, max_length=128)]
+        _, predicted_classes = handler._classify(features)
+        latencies.append((time.perf_counter() - start) * 1000)
+        predictions.append(int(predicted_classes[0]))
+
+    start = time.perf_counter()
+    handler.predict_batch(words, 'devanagari', max_batch_size=batch_size)
+    throughput = len(words) / (time.perf_counter() - start)
+
+    latencies.sort()
+    return {
+        'predictions': predictions,
+        'mean_ms': statistics.mean(latencies),
+        'p95_ms': latencies[int(len(latencies) * 0.95) - 1] if len(latencies) >= 20 else latencies[-1],
+        'throughput': throughput
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare IndicBERT inference backends")
+    parser.add_argument("--data", type=Path, required=True, help="Labelled words file")
+    parser.add_argument("--model", default="models/fine_tuned_model", help="Model and tokenizer path")
+    parser.add_argument("--labels", default="data/sanskrit_roots.json")
+    parser.add_argument("--onnx", type=Path, default=Path("models/onnx/model.onnx"))
+    parser.add_argument("--onnx-int8", type=Path, default=Path("models/onnx/model.int8.onnx"))
+    parser.add_argument("--threads", type=int, default=None, help="CPU threads per backend")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--limit", type=int, default=0, help="Only use the first N examples")
+    args = parser.parse_args()
+
+    examples = load_examples(args.data, args.limit)
+    words = [word for word, _ in examples]
+    labels = [label for _, label in examples]
+
+    backends = [('fp32', 'pytorch', None), ('int8', 'quantized', None)]
+    if args.onnx.exists():
+        backends.append(('onnx', 'onnx', args.onnx))
+    if args.onnx_int8.exists():
+        backends.append(('onnx-int8', 'onnx', args.onnx_int8))
+
+    print(f"{len(words)} labelled words, batch size {args.batch_size}")
+    print(f"  {'backend':<10} {'accuracy':>8} {'agree':>7} {'mean ms':>8} {'p95 ms':>7} {'words/s':>9}")
+
+    reference = None
+    for name, backend, onnx_path in backends:
+        handler = IndicBertHandler(
+            args.model, args.model, args.labels,
+            backend=backend,
+            onnx_path=str(onnx_path) if onnx_path else None,
+            num_threads=args.threads
+        )
+        result = evaluate(handler, words, args.batch_size)
+        predicted = result['predictions']
+        if reference is None:
+            reference = predicted
+
+        accuracy = sum(p == label for p, label in zip(predicted, labels)) / len(labels)
+        agreement = sum(p == r for p, r in zip(predicted, reference)) / len(reference)
+        print(f"  {name:<10} {accuracy:>8.3f} {agreement:>7.3f} {result['mean_ms']:>8.2f} "
+              f"{result['p95_ms']:>7.2f} {result['throughput']:>9.1f}")
+
+if __name__ == "__main__":
+    main()
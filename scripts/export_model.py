@@ -0,0 +1,69 @@
+"""Export the fine-tuned IndicBERT model to ONNX for CPU inference.
+
+Writes model.onnx (fp32) and, with --quantize, model.int8.onnx with int8
+dynamically quantized weights. Point ONNX_MODEL_PATH in config/bot_config.py
+at either file and set MODEL_BACKEND = "onnx".
+
+Usage:
+    python scripts/export_model.py [--model models/fine_tuned_model]
+        [--output models/onnx] [--opset 14] [--quantize]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(project_root))
+
+import torch
+from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+def export_onnx(model_path: str, output_path: Path, opset: int):
+    """Trace the model with a sample word and export it with dynamic batch and sequence axes."""
+    tokenizer = AutoTokenizer.from_pretrained(model_path)
+    model = AutoModelForSequenceClassification.from_pretrained(model_path)
+    model.eval()
+
+    sample = tokenizer(['धर्म', 'विद्यालय'], padding=True, return_tensors='pt')
+    input_names = [name for name in ('input_ids', 'attention_mask', 'token_type_ids') if name in sample]
+    dynamic_axes = {name: {0: 'batch', 1: 'sequence'} for name in input_names}
+    dynamic_axes['logits'] = {0: 'batch'}
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in input_names),
+            str(output_path),
+            input_names=input_names,
+            output_names=['logits'],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            do_constant_folding=True
+        )
+    print(f"Exported {output_path} ({output_path.stat().st_size / 1e6:.1f} MB)")
+
+def quantize_onnx(input_path: Path, output_path: Path):
+    """Quantize the exported model's weights to int8."""
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    quantize_dynamic(str(input_path), str(output_path), weight_type=QuantType.QInt8)
+    print(f"Quantized {output_path} ({output_path.stat().st_size / 1e6:.1f} MB)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Export IndicBERT to ONNX")
+    parser.add_argument("--model", default="models/fine_tuned_model", help="Model and tokenizer path")
+    parser.add_argument("--output", type=Path, default=Path("models/onnx"), help="Output directory")
+    parser.add_argument("--opset", type=int, default=14)
+    parser.add_argument("--quantize", action="store_true", help="Also write an int8 quantized model")
+    args = parser.parse_args()
+
+    onnx_path = args.output / "model.onnx"
+    export_onnx(args.model, onnx_path, args.opset)
+    if args.quantize:
+        quantize_onnx(onnx_path, args.output / "model.int8.onnx")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Report the bot's API quota usage from its state database.
+
+Prints this month's read and write usage with the projected exhaustion
+date, per-endpoint daily usage and the last rate limit windows reported by
+the API.
+
+Usage:
+    python scripts/quota_report.py [--db src/bot/bot_state.db] [--days 30]
+"""
+
+import argparse
+import sys
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent.absolute()
+sys.path.insert(0, str(project_root))
+
+from config import bot_config as cfg
+from src.bot.quota_tracker import QuotaTracker
+from src.bot.state_store import BotStateStore
+
+def main():
+    parser = argparse.ArgumentParser(description="Report API quota usage")
+    parser.add_argument("--db", default=str(project_root / "src" / "bot" / "bot_state.db"),
+                        help="Bot state database")
+    parser.add_argument("--days", type=int, default=30, help="Days of history to show")
+    args = parser.parse_args()
+
+    if not Path(args.db).exists():
+        print(f"No state database at {args.db}")
+        sys.exit(1)
+
+    store = BotStateStore(args.db)
+    quota = QuotaTracker(store, cfg.MAX_MONTHLY_READS, cfg.MAX_MONTHLY_WRITES)
+
+    print("This month:")
+    for kind, limit in quota.limits.items():
+        exhaustion = quota.projected_exhaustion(kind)
+        projection = exhaustion.strftime('%Y-%m-%d %H:%M UTC') if exhaustion else "lasts until the monthly reset"
+        print(f"  {kind:<7} {quota.used(kind):>5}/{limit:<5} projected exhaustion: {projection}")
+
+    history = quota.history(args.days)
+    print(f"\nUsage over the last {args.days} days:")
+    if not history:
+        print("  (none)")
+    by_endpoint = defaultdict(list)
+    for row in history:
+        by_endpoint[row['endpoint']].append(row)
+    for endpoint, rows in sorted(by_endpoint.items()):
+        print(f"  {endpoint} ({sum(row['count'] for row in rows)} requests)")
+        for row in rows:
+            print(f"    {row['day']}  {row['count']:>4} {row['kind']}")
+
+    windows = store.get_rate_limits()
+    if windows:
+        print("\nRate limit windows:")
+        for (endpoint, window), state in sorted(windows.items()):
+            reset = datetime.fromtimestamp(state['reset_at']).strftime('%Y-%m-%d %H:%M:%S')
+            print(f"  {endpoint} [{window}] {state['remaining']}/{state['limit']} left, resets {reset}")
+    store.close()
+
+if __name__ == "__main__":
+    main()
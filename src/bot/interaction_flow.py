@@ -1,52 +1,35 @@
-from typing import Optional, Dict
-import json
+from typing import Optional, Dict, List
+import datetime
 import logging
 from pathlib import Path
 from .response_gen import ResponseGenerator
-from .query_handler import QueryHandler
+from .state_store import BotStateStore
 
 logger = logging.getLogger(__name__)
 
 class InteractionFlow:
-    def __init__(self, state_file: str = "bot_state.json"):
-        self.state_file = Path(state_file)
-        self.response_gen = ResponseGenerator()
-        self.query_handler = QueryHandler()
-        self.state = self._load_state()
-        
-    def _load_state(self) -> Dict:
-        """Load bot state from file."""
-        try:
-            if self.state_file.exists():
-                with open(self.state_file, 'r') as f:
-                    return json.load(f)
-            return {'last_interaction': None, 'conversation_context': {}}
-        except Exception as e:
-            logger.error(f"Error loading state: {e}")
-            return {'last_interaction': None, 'conversation_context': {}}
+    def __init__(self, state_db: str = "bot_state.db", legacy_state_file: str = "bot_state.json"):
+        # Per-user context is updated row by row instead of rewriting a JSON file
+        self.store = BotStateStore(state_db)
+        self.store.import_json(Path(legacy_state_file))
+        # Serve dictionary-backed replies while the model loads in the background
+        self.response_gen = ResponseGenerator(warm_up=True)
+        self.query_handler = self.response_gen.query_handler
     
-    def _save_state(self):
-        """Save bot state to file."""
-        try:
-            with open(self.state_file, 'w') as f:
-                json.dump(self.state, f)
-        except Exception as e:
-            logger.error(f"Error saving state: {e}")
+    def get_context(self, user_id: str) -> List[Dict]:
+        """Get the recent conversation context for a user."""
+        return self.store.get_context(user_id)
     
     def _update_context(self, user_id: str, query_text: str, response: str):
         """Update conversation context for a user."""
-        if user_id not in self.state['conversation_context']:
-            self.state['conversation_context'][user_id] = []
-        
-        self.state['conversation_context'][user_id].append({
+        timestamp = str(datetime.datetime.now())
+        # Keep only last 5 interactions
+        self.store.append_context(user_id, {
             'query': query_text,
             'response': response,
-            'timestamp': str(datetime.datetime.now())
-        })
-        
-        # Keep only last 5 interactions
-        self.state['conversation_context'][user_id] = \
-            self.state['conversation_context'][user_id][-5:]
+            'timestamp': timestamp
+        }, keep=5)
+        self.store.set('last_interaction', timestamp)
     
     def handle_interaction(self, tweet_text: str, author_id: str, 
                          author_username: str) -> str:
@@ -60,9 +43,6 @@ class InteractionFlow:
             # Update conversation context
             self._update_context(author_id, tweet_text, response)
             
-            # Save updated state
-            self._save_state()
-            
             return response
             
         except Exception as e:
@@ -0,0 +1,208 @@
+from typing import Callable, Dict, Iterable, Optional
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# Queue sentinel telling a worker to exit
+_STOP = object()
+
+@dataclass
+class StageStats:
+    """Throughput and latency of one pipeline stage."""
+    processed: int = 0
+    failed: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    def record(self, elapsed: float, ok: bool = True):
+        """Record one item that took elapsed seconds."""
+        self.processed += 1
+        self.failed += int(not ok)
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+
+    @property
+    def avg_latency_ms(self) -> float:
+        return self.total_time * 1000 / self.processed if self.processed else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            'processed': self.processed,
+            'failed': self.failed,
+            'avg_latency_ms': self.avg_latency_ms,
+            'max_latency_ms': self.max_time * 1000,
+            'total_time': self.total_time
+        }
+
+class MentionPipeline:
+    """
+    Producer/consumer pipeline for mentions: poll -> respond -> post.
+
+    The polling loop submits mentions; response workers turn them into reply
+    texts; a single posting worker sends the replies, spaced by
+    reply_interval. Stages are connected by bounded queues, so a slow stage
+    applies backpressure instead of letting work pile up, and a slow reply
+    no longer holds up response generation for the mentions behind it.
+    """
+
+    def __init__(self, respond: Callable[[Dict], Optional[str]],
+                 post: Callable[[str, str], Optional[Dict]],
+                 mention_queue_size: int = 50, reply_queue_size: int = 50,
+                 response_workers: int = 1, reply_interval: float = 0.0,
+                 on_done: Optional[Callable[[Dict], None]] = None):
+        """
+        Args:
+            respond: Builds the reply text for a mention (None to skip it)
+            post: Posts a reply as post(tweet_id, text); returns None on failure
+            mention_queue_size: Mentions waiting for a response worker
+            reply_queue_size: Replies waiting to be posted
+            response_workers: Number of response generation threads
+            reply_interval: Minimum seconds between two posted replies
+            on_done: Called with each mention once it has been replied to,
+                skipped or given up on
+        """
+        self.respond = respond
+        self.post = post
+        self.on_done = on_done
+        self.response_workers = response_workers
+        self.reply_interval = reply_interval
+
+        self.mentions = queue.Queue(maxsize=mention_queue_size)
+        self.replies = queue.Queue(maxsize=reply_queue_size)
+        self.stats = {
+            'poll': StageStats(),
+            'respond': StageStats(),
+            'post': StageStats(),
+            'end_to_end': StageStats()
+        }
+        self._stats_lock = threading.Lock()
+        self._responders = []
+        self._poster = None
+        self._last_post = None
+
+    def start(self):
+        """Start the response and posting workers."""
+        self._responders = [
+            threading.Thread(target=self._respond_worker, name=f"mention-respond-{i}", daemon=True)
+            for i in range(self.response_workers)
+        ]
+        self._poster = threading.Thread(target=self._post_worker, name="mention-post", daemon=True)
+        for thread in self._responders + [self._poster]:
+            thread.start()
+        logger.info(f"Mention pipeline started with {self.response_workers} response workers")
+
+    def submit(self, mentions: Iterable[Dict], poll_time: float = 0.0):
+        """
+        Queue mentions from one poll.
+
+        Blocks while the mention queue is full.
+
+        Args:
+            mentions: Mentions returned by the API
+            poll_time: Seconds the poll took, recorded as the poll stage latency
+        """
+        self._record('poll', poll_time)
+        self._enqueue(mentions)
+
+    def requeue(self, mentions: Iterable[Dict]):
+        """Queue mentions left unanswered by an earlier run, without recording a poll."""
+        self._enqueue(mentions)
+
+    def _enqueue(self, mentions: Iterable[Dict]):
+        mentions = list(mentions)
+        for mention in mentions:
+            self.mentions.put((mention, time.perf_counter()))
+        logger.info(f"Queued {len(mentions)} mentions; queue depths: {self.queue_depths()}")
+
+    def _done(self, mention: Dict):
+        if self.on_done is None:
+            return
+        try:
+            self.on_done(mention)
+        except Exception as e:
+            logger.error(f"Error finishing mention {mention.get('id')}: {e}")
+
+    def _respond_worker(self):
+        while True:
+            item = self.mentions.get()
+            if item is _STOP:
+                break
+
+            mention, queued_at = item
+            start = time.perf_counter()
+            try:
+                reply = self.respond(mention)
+            except Exception as e:
+                logger.error(f"Error generating reply to {mention.get('id')}: {e}")
+                reply = None
+            self._record('respond', time.perf_counter() - start, ok=reply is not None)
+
+            if reply is not None:
+                self.replies.put((mention, reply, queued_at))
+            else:
+                self._done(mention)
+
+    def _post_worker(self):
+        while True:
+            item = self.replies.get()
+            if item is _STOP:
+                break
+
+            mention, reply, queued_at = item
+            # Space out replies without holding up the other stages
+            if self._last_post is not None:
+                wait = self.reply_interval - (time.perf_counter() - self._last_post)
+                if wait > 0:
+                    time.sleep(wait)
+
+            start = time.perf_counter()
+            try:
+                response = self.post(mention['id'], reply)
+            except Exception as e:
+                logger.error(f"Error posting reply to {mention.get('id')}: {e}")
+                response = None
+            self._last_post = time.perf_counter()
+            self._record('post', self._last_post - start, ok=response is not None)
+            self._record('end_to_end', self._last_post - queued_at, ok=response is not None)
+            self._done(mention)
+
+    def stop(self, timeout: Optional[float] = None):
+        """Finish the queued mentions and stop the workers."""
+        for _ in self._responders:
+            self.mentions.put(_STOP)
+        for thread in self._responders:
+            thread.join(timeout)
+        if self._poster:
+            self.replies.put(_STOP)
+            self._poster.join(timeout)
+        logger.info("Mention pipeline stopped")
+
+    def _record(self, stage: str, elapsed: float, ok: bool = True):
+        with self._stats_lock:
+            self.stats[stage].record(elapsed, ok)
+
+    def queue_depths(self) -> Dict[str, int]:
+        """Number of items waiting in each queue."""
+        return {'mentions': self.mentions.qsize(), 'replies': self.replies.qsize()}
+
+    def get_statistics(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage throughput and latency, plus the current queue depths."""
+        with self._stats_lock:
+            statistics = {stage: stats.as_dict() for stage, stats in self.stats.items()}
+        statistics['queues'] = self.queue_depths()
+        return statistics
+
+    def log_statistics(self):
+        """Log queue depths and per-stage latency."""
+        depths = self.queue_depths()
+        logger.info(f"Queue depths: {depths['mentions']} mentions, {depths['replies']} replies")
+        with self._stats_lock:
+            for stage, stats in self.stats.items():
+                logger.info(
+                    f"{stage}: {stats.processed} processed, {stats.failed} failed, "
+                    f"{stats.avg_latency_ms:.1f} ms avg, {stats.max_time * 1000:.1f} ms max"
+                )
@@ -0,0 +1,124 @@
+from typing import Dict, Optional
+import logging
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+def month_end(now: datetime) -> datetime:
+    """Start of the next month, when the monthly API quotas reset."""
+    if now.month == 12:
+        return now.replace(year=now.year + 1, month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
+    return now.replace(month=now.month + 1, day=1, hour=0, minute=0, second=0, microsecond=0)
+
+class PollScheduler:
+    """
+    Plans mention polls so the monthly read budget lasts the month.
+
+    The base interval spreads the reads left in the quota tracker over the
+    time left in the month. After a poll finds mentions the next few polls run faster, to
+    catch follow-ups while a conversation is active; each quiet poll after
+    that doubles the interval (up to max_backoff times the base), saving
+    reads that shorten the base interval later. Reads are counted only by
+    the quota tracker; the burst and backoff state is kept in the given
+    state dict so it survives restarts.
+    """
+
+    def __init__(self, state: Dict, quota, min_interval: float = 60,
+                 burst_polls: int = 3, burst_speedup: float = 0.25,
+                 backoff_factor: float = 2, max_backoff: float = 4):
+        """
+        Args:
+            state: Bot state; burst and backoff state is stored under 'poll_schedule'
+            quota: QuotaTracker holding the monthly read budget
+            min_interval: Shortest interval between two polls, in seconds
+            burst_polls: Number of fast polls after a poll that found mentions
+            burst_speedup: Base interval multiplier during a burst
+            backoff_factor: Interval multiplier per quiet poll
+            max_backoff: Largest base interval multiplier when quiet
+        """
+        self.quota = quota
+        self.min_interval = min_interval
+        self.burst_polls = burst_polls
+        self.burst_speedup = burst_speedup
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+
+        self.schedule = state.setdefault('poll_schedule', {})
+        self.schedule.setdefault('month', None)
+        # Reads used to be counted here as well; the quota tracker owns them now
+        self.schedule.pop('reads_used', None)
+        self.schedule.setdefault('burst_polls_left', 0)
+        self.schedule.setdefault('idle_polls', 0)
+
+    def _roll_month(self, now: datetime):
+        """Reset the burst and backoff state when a new month starts."""
+        month = now.strftime('%Y-%m')
+        if self.schedule['month'] != month:
+            if self.schedule['month'] is not None:
+                logger.info(f"New month {month} - resetting poll schedule")
+            self.schedule.update(month=month, burst_polls_left=0, idle_polls=0)
+
+    def reads_left(self, now: Optional[datetime] = None) -> int:
+        """Reads left in this month's quota."""
+        return self.quota.remaining('reads', now)
+
+    def record_poll(self, mentions_found: int, now: Optional[datetime] = None):
+        """
+        Update the burst and backoff state after a poll.
+
+        Args:
+            mentions_found: Number of mentions the poll returned
+            now: Poll time (defaults to the current UTC time)
+        """
+        now = now or datetime.now(timezone.utc)
+        self._roll_month(now)
+
+        if mentions_found:
+            self.schedule['burst_polls_left'] = self.burst_polls
+            self.schedule['idle_polls'] = 0
+        elif self.schedule['burst_polls_left'] > 0:
+            self.schedule['burst_polls_left'] -= 1
+        else:
+            self.schedule['idle_polls'] += 1
+
+    def base_interval(self, now: Optional[datetime] = None) -> float:
+        """Interval that spends the reads left evenly over the rest of the month."""
+        now = now or datetime.now(timezone.utc)
+        self._roll_month(now)
+        seconds_left = (month_end(now) - now).total_seconds()
+        reads_left = self.reads_left(now)
+        if not reads_left:
+            return seconds_left
+        return seconds_left / reads_left
+
+    def next_interval(self, now: Optional[datetime] = None) -> float:
+        """
+        Seconds to wait before the next poll.
+
+        Args:
+            now: Current time (defaults to the current UTC time)
+
+        Returns:
+            Interval in seconds, never past the monthly budget reset
+        """
+        now = now or datetime.now(timezone.utc)
+        base = self.base_interval(now)
+        seconds_left = (month_end(now) - now).total_seconds()
+        reads_left = self.reads_left(now)
+        if not reads_left:
+            logger.warning("Read budget spent - next poll after the monthly reset")
+            return seconds_left + 1
+
+        if self.schedule['burst_polls_left'] > 0:
+            interval = base * self.burst_speedup
+            mode = f"burst, {self.schedule['burst_polls_left']} fast polls left"
+        else:
+            interval = base * min(self.backoff_factor ** self.schedule['idle_polls'], self.max_backoff)
+            mode = f"{self.schedule['idle_polls']} quiet polls"
+
+        interval = max(self.min_interval, min(interval, seconds_left + 1))
+        logger.info(
+            f"[SCHEDULE] {reads_left}/{self.quota.limits['reads']} reads left, "
+            f"base {base:.0f}s, next poll in {interval:.0f}s ({mode})"
+        )
+        return interval
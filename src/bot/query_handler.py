@@ -2,9 +2,13 @@ from typing import Dict, List, Optional, Tuple
 import re
 from dataclasses import dataclass
 import logging
+from src.utils.script_utils import Script, ScriptClassifier, ScriptUtils
 
 logger = logging.getLogger(__name__)
 
+# First capturing group of a query pattern, i.e. the target word/phrase
+CAPTURE_GROUP = re.compile(r'(?<!\\)\((?!\?)')
+
 @dataclass
 class Query:
     raw_text: str
@@ -13,25 +17,31 @@ class Query:
     script_type: str  # Detected script type
 
 class QueryHandler:
-    def __init__(self):
-        # Define script patterns for all major Indic languages
-        self.script_patterns = {
-            # North Indian Scripts
-            'devanagari': re.compile(r'[\u0900-\u097F]'),  # Hindi, Marathi, Sanskrit
-            'gurmukhi': re.compile(r'[\u0A00-\u0A7F]'),    # Punjabi
-            'gujarati': re.compile(r'[\u0A80-\u0AFF]'),    # Gujarati
-            
-            # East Indian Scripts
-            'bengali': re.compile(r'[\u0980-\u09FF]'),     # Bengali
-            'odia': re.compile(r'[\u0B00-\u0B7F]'),        # Odia/Oriya
-            
-            # South Indian Scripts
-            'tamil': re.compile(r'[\u0B80-\u0BFF]'),       # Tamil
-            'telugu': re.compile(r'[\u0C00-\u0C7F]'),      # Telugu
-            'kannada': re.compile(r'[\u0C80-\u0CFF]'),     # Kannada
-            'malayalam': re.compile(r'[\u0D00-\u0D7F]'),   # Malayalam
-        }
+    INDIC_SCRIPTS = (
+        # North Indian Scripts
+        Script.DEVANAGARI,  # Hindi, Marathi, Sanskrit
+        Script.GURMUKHI,    # Punjabi
+        Script.GUJARATI,    # Gujarati
+        
+        # East Indian Scripts
+        Script.BENGALI,     # Bengali
+        Script.ODIA,        # Odia/Oriya
         
+        # South Indian Scripts
+        Script.TAMIL,       # Tamil
+        Script.TELUGU,      # Telugu
+        Script.KANNADA,     # Kannada
+        Script.MALAYALAM,   # Malayalam
+    )
+    
+    # Single-pass classifier over all major Indic scripts, built once; the
+    # order above breaks ties between equally common scripts
+    SCRIPT_CLASSIFIER = ScriptClassifier(
+        (script.value, ScriptUtils.SCRIPT_RANGES[script])
+        for script in INDIC_SCRIPTS
+    )
+    
+    def __init__(self):
         # Query patterns for different types of questions
         self.query_patterns = {
             'word_lookup': {
@@ -59,24 +69,26 @@ class QueryHandler:
                 'or': r'(.+?)\s+ର\s+ଉତ୍ପତ୍ତି'
             }
         }
+        
+        # Combined matchers, compiled once per pattern language
+        self._query_group_types = {}
+        self._query_matchers = {
+            language: self._compile_query_matcher(language)
+            for patterns in self.query_patterns.values()
+            for language in patterns
+        }
+        self._default_query_matcher = self._query_matchers['en']
     
     def _detect_script(self, text: str) -> str:
         """
         Detect the dominant script in the text.
         Returns the script with the highest character count.
         """
-        # Count characters in each script
-        script_counts = {
-            script: len(pattern.findall(text))
-            for script, pattern in self.script_patterns.items()
-        }
-        
         # If no Indic scripts found, return 'latin'
-        if all(count == 0 for count in script_counts.values()):
-            return 'latin'
+        dominant_script = self.SCRIPT_CLASSIFIER.dominant(text, default='latin')
+        if dominant_script == 'latin':
+            return dominant_script
         
-        # Return the script with the most characters
-        dominant_script = max(script_counts.items(), key=lambda x: x[1])[0]
         logger.info(f"Detected script: {dominant_script} for text: {text[:50]}...")
         return dominant_script
     
@@ -101,22 +113,37 @@ class QueryHandler:
         """
         text = text.lower().strip()
         
-        # Try patterns for detected script
-        for query_type, patterns in self.query_patterns.items():
-            # Try script-specific pattern first
-            if script_type in patterns:
-                match = re.search(patterns[script_type], text)
-                if match:
-                    return query_type, match.group(1).strip()
-            
-            # Fallback to English pattern
-            match = re.search(patterns['en'], text)
-            if match:
-                return query_type, match.group(1).strip()
+        matcher = self._query_matchers.get(script_type, self._default_query_matcher)
+        match = matcher.match(text)
+        if match:
+            return self._query_group_types[match.lastgroup], match.group(match.lastgroup).strip()
         
         # Default to word lookup if no pattern matches
         return 'word_lookup', None
     
+    def _compile_query_matcher(self, script_type: str) -> re.Pattern:
+        """
+        Merge the query patterns for a script into one regex.
+        
+        Each pattern's target group becomes a named group, and each
+        alternative is prefixed with a lazy scan, so a single match tries the
+        patterns in the same order as separate searches would: per query type,
+        the script-specific pattern first, then the English one.
+        """
+        alternatives = []
+        for query_type, patterns in self.query_patterns.items():
+            languages = ['en']
+            if script_type in patterns and script_type != 'en':
+                languages.insert(0, script_type)
+            
+            for language in languages:
+                group = f"{query_type}__{language}"
+                self._query_group_types[group] = query_type
+                pattern = CAPTURE_GROUP.sub(f"(?P<{group}>", patterns[language], count=1)
+                alternatives.append(f"(?s:.*?)(?:{pattern})")
+        
+        return re.compile("|".join(alternatives))
+    
     def parse_query(self, text: str) -> Query:
         """
         Parse the query text and identify potential Sanskrit loanwords.
@@ -0,0 +1,170 @@
+from typing import Dict, List, Mapping, Optional
+import logging
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit
+
+from config import bot_config as cfg
+from .poll_scheduler import month_end
+from .state_store import BotStateStore
+
+logger = logging.getLogger(__name__)
+
+# Rate limit header families: the per-endpoint 15 minute window and the
+# 24 hour user/app caps the API reports on some endpoints (e.g. POST /tweets)
+RATE_LIMIT_WINDOWS = ('x-rate-limit', 'x-user-limit-24hour', 'x-app-limit-24hour')
+
+# Numeric path segments (user and tweet IDs)
+ID_SEGMENT = re.compile(r'/\d+(?=/|$)')
+
+class QuotaTracker:
+    """
+    Persisted API quota accounting and rate limiting.
+
+    Monthly read and write counters, and per-endpoint daily usage, are kept
+    in the state store so a restart (or a crash loop) cannot forget what was
+    already spent. Rate limit windows are learned from the x-rate-limit-*
+    headers of every response and counted down locally between responses,
+    so a request the API is known to reject is never sent.
+    """
+
+    def __init__(self, store: BotStateStore, max_reads: int, max_writes: int):
+        """
+        Args:
+            store: State store holding the counters and rate limit windows
+            max_reads: Reads available per month
+            max_writes: Writes available per month
+        """
+        self.store = store
+        self.limits = {'reads': max_reads, 'writes': max_writes}
+        self._lock = threading.Lock()
+        self._windows = store.get_rate_limits()
+        self._month = None
+
+    @staticmethod
+    def endpoint_key(method: str, url: str) -> str:
+        """Endpoint name for a request, with IDs replaced (e.g. 'GET /users/:id/mentions')."""
+        path = urlsplit(url).path
+        base_path = urlsplit(cfg.API_BASE_URL).path
+        if base_path and path.startswith(base_path):
+            path = path[len(base_path):]
+        return f"{method} {ID_SEGMENT.sub('/:id', path)}"
+
+    def _counter_name(self, kind: str, now: datetime) -> str:
+        """State store name of the month's 'reads' or 'writes' counter."""
+        month = now.strftime('%Y-%m')
+        if self._month is not None and month != self._month:
+            logger.info(f"New month {month} - API counters start from zero")
+        self._month = month
+        return f"{kind}:{month}"
+
+    def used(self, kind: str, now: Optional[datetime] = None) -> int:
+        """Requests of a kind ('reads' or 'writes') made this month."""
+        now = now or datetime.now(timezone.utc)
+        return self.store.get_counter(self._counter_name(kind, now))
+
+    def remaining(self, kind: str, now: Optional[datetime] = None) -> int:
+        """Requests of a kind left this month."""
+        return max(self.limits[kind] - self.used(kind, now), 0)
+
+    def record(self, endpoint: str, kind: str, now: Optional[datetime] = None) -> int:
+        """
+        Count a request against the monthly quota and the endpoint's usage.
+
+        Args:
+            endpoint: Endpoint name (see endpoint_key)
+            kind: 'reads' or 'writes'
+            now: Request time (defaults to the current UTC time)
+
+        Returns:
+            Requests of the kind made this month, including this one
+        """
+        now = now or datetime.now(timezone.utc)
+        self.store.record_usage(now.strftime('%Y-%m-%d'), endpoint, kind)
+        return self.store.increment_counter(self._counter_name(kind, now))
+
+    def history(self, days: int = 30, now: Optional[datetime] = None) -> List[Dict]:
+        """Per-endpoint daily usage over the last days."""
+        now = now or datetime.now(timezone.utc)
+        return self.store.usage_history((now - timedelta(days=days - 1)).strftime('%Y-%m-%d'))
+
+    def projected_exhaustion(self, kind: str, now: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        When the monthly quota runs out at this month's rate of use.
+
+        Args:
+            kind: 'reads' or 'writes'
+            now: Current time (defaults to the current UTC time)
+
+        Returns:
+            Projected exhaustion time, or None if the quota lasts until the reset
+        """
+        now = now or datetime.now(timezone.utc)
+        used = self.used(kind, now)
+        if used >= self.limits[kind]:
+            return now
+        elapsed = (now - now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)).total_seconds()
+        if not used or elapsed <= 0:
+            return None
+
+        exhaustion = now + timedelta(seconds=(self.limits[kind] - used) * elapsed / used)
+        return exhaustion if exhaustion < month_end(now) else None
+
+    def update_rate_limits(self, endpoint: str, headers: Mapping[str, str]):
+        """
+        Learn an endpoint's rate limit windows from response headers.
+
+        Args:
+            endpoint: Endpoint name (see endpoint_key)
+            headers: Response headers (case-insensitive mapping)
+        """
+        for window in RATE_LIMIT_WINDOWS:
+            remaining = headers.get(f'{window}-remaining')
+            reset_at = headers.get(f'{window}-reset')
+            if remaining is None or reset_at is None:
+                continue
+            try:
+                limit = headers.get(f'{window}-limit')
+                state = {
+                    'limit': int(limit) if limit is not None else None,
+                    'remaining': int(remaining),
+                    'reset_at': float(reset_at)
+                }
+            except ValueError:
+                logger.warning(f"Ignoring malformed {window} headers for {endpoint}")
+                continue
+
+            with self._lock:
+                self._windows[(endpoint, window)] = state
+            self.store.set_rate_limit(endpoint, window, state['limit'], state['remaining'], state['reset_at'])
+
+    def acquire(self, endpoint: str) -> float:
+        """
+        Take a request from the endpoint's known rate limit windows.
+
+        Args:
+            endpoint: Endpoint name (see endpoint_key)
+
+        Returns:
+            0 if the request can be sent now (and is counted down locally),
+            otherwise the seconds until the exhausted window resets
+        """
+        now = time.time()
+        with self._lock:
+            windows = [state for (name, _), state in self._windows.items()
+                       if name == endpoint and state['reset_at'] > now]
+            wait = max((state['reset_at'] - now for state in windows if state['remaining'] <= 0), default=0.0)
+            if wait <= 0:
+                for state in windows:
+                    state['remaining'] -= 1
+        return wait
+
+    def log_status(self, now: Optional[datetime] = None):
+        """Log this month's usage and projected exhaustion."""
+        now = now or datetime.now(timezone.utc)
+        for kind, limit in self.limits.items():
+            exhaustion = self.projected_exhaustion(kind, now)
+            projection = exhaustion.strftime('%Y-%m-%d %H:%M') if exhaustion else "lasts until the monthly reset"
+            logger.info(f"[QUOTA] {kind}: {self.used(kind, now)}/{limit} used, projected exhaustion: {projection}")
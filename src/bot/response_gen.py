@@ -1,6 +1,10 @@
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from .query_handler import QueryHandler, Query
+from .word_cache import WordInfoCache
+from config import bot_config as cfg
 import logging
+import threading
+import time
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -13,58 +17,124 @@ class LoanwordInfo:
     confidence: float
     etymology: Optional[str] = None
     usage_examples: Optional[List[str]] = None
+    # Stand-in result when neither the dictionary nor the model is available;
+    # never posted as an answer
+    placeholder: bool = False
+
+@dataclass
+class TierStats:
+    """Hit rate and latency of one word resolution tier (cache, dictionary or model)."""
+    lookups: int = 0
+    hits: int = 0
+    total_time: float = 0.0
+    
+    def record(self, hits: int, lookups: int, elapsed: float):
+        """Record a lookup of one or more words that took elapsed seconds."""
+        self.hits += hits
+        self.lookups += lookups
+        self.total_time += elapsed
+    
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+    
+    @property
+    def avg_latency_ms(self) -> float:
+        return self.total_time * 1000 / self.lookups if self.lookups else 0.0
+    
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            'lookups': self.lookups,
+            'hits': self.hits,
+            'hit_rate': self.hit_rate,
+            'avg_latency_ms': self.avg_latency_ms,
+            'total_time': self.total_time
+        }
 
 class ResponseGenerator:
-    def __init__(self):
-        """Initialize the response generator with templates, model, and dictionary."""
+    # In-process cache of resolved words
+    WORD_CACHE_SIZE = 10000
+    WORD_CACHE_TTL = 6 * 60 * 60  # seconds
+    NEGATIVE_CACHE_TTL = 60 * 60  # seconds for confirmed non-loanwords, 0 disables
+    
+    def __init__(self, warm_up: bool = False):
+        """
+        Initialize the response generator with templates, model, and dictionary.
+        
+        The IndicBERT model (torch, transformers, weights and labels) is not
+        loaded here: it loads on first use, or in a background thread when
+        warm_up is set, so dictionary-backed replies are available right away.
+        
+        Args:
+            warm_up: Start loading the model in a background thread
+        """
+        init_start = time.perf_counter()
+        self.startup_timings = {}
+        
         # Load model paths from config
-        self.model_path = "models/fine_tuned_model"
-        self.tokenizer_path = "models/fine_tuned_model"
+        self.model_path = cfg.MODEL_PATH
+        self.tokenizer_path = cfg.MODEL_PATH
         self.labels_path = "data/sanskrit_roots.json"
         
-        try:
-            # Initialize IndicBERT model
-            from src.models.indic_bert_handler import IndicBertHandler
-            self.model = IndicBertHandler(
-                model_path=self.model_path,
-                tokenizer_path=self.tokenizer_path,
-                labels_path=self.labels_path
-            )
-            logger.info("Successfully initialized IndicBERT model")
-        except Exception as e:
-            logger.error(f"Error loading IndicBERT model: {e}")
-            self.model = None
+        # Lazily loaded IndicBERT model, see the model property
+        self._model = None
+        self._model_loaded = False
+        self._model_lock = threading.Lock()
+        self._warm_up_thread = None
             
         try:
             # Initialize dictionary handler
+            start = time.perf_counter()
             from src.data.dict_handler import DictionaryHandler
-            self.dict_handler = DictionaryHandler()
+            # Preload the dictionary so per-word lookups are in-memory
+            self.dict_handler = DictionaryHandler(preload=True)
+            self.startup_timings['dictionary'] = time.perf_counter() - start
             logger.info("Successfully initialized dictionary handler")
         except Exception as e:
             logger.error(f"Error loading dictionary handler: {e}")
             self.dict_handler = None
         
+        # Tiered word resolution: cache -> dictionary -> model
+        self.word_cache = WordInfoCache(
+            max_size=self.WORD_CACHE_SIZE,
+            ttl=self.WORD_CACHE_TTL,
+            negative_ttl=self.NEGATIVE_CACHE_TTL
+        )
+        if self.dict_handler:
+            # New dictionary entries must not be shadowed by cached results
+            self.dict_handler.add_write_listener(self.word_cache.invalidate)
+            self.dict_handler.add_reload_listener(self.word_cache.clear)
+        self.tier_stats = {
+            'cache': TierStats(),
+            'dictionary': TierStats(),
+            'model': TierStats()
+        }
+        
         self.query_handler = QueryHandler()
         self.response_templates = {
             # Generic responses (in English)
             'generic': {
                 'found': "The word '{word}' comes from Sanskrit '{sanskrit_root}', meaning: {meaning}",
                 'not_found': "Sorry, I couldn't find Sanskrit origins for '{word}'.",
-                'low_confidence': "I'm not entirely sure, but '{word}' might be derived from Sanskrit '{sanskrit_root}' (confidence: {confidence}%)"
+                'low_confidence': "I'm not entirely sure, but '{word}' might be derived from Sanskrit '{sanskrit_root}' (confidence: {confidence}%)",
+                'no_sanskrit': "I couldn't find any Sanskrit loanwords in this tweet.",
+                'error': "Sorry, something went wrong while analyzing this tweet. Please try again later."
             },
             
             # Hindi (Devanagari)
             'devanagari': {
                 'found': "शब्द '{word}' संस्कृत मूल '{sanskrit_root}' से आया है, अर्थ: {meaning}",
                 'not_found': "क्षमा करें, '{word}' का संस्कृत मूल नहीं मिल सका।",
-                'low_confidence': "मुझे पूरा यकीन नहीं है, लेकिन '{word}' शायद संस्कृत '{sanskrit_root}' से आया है।"
+                'low_confidence': "मुझे पूरा यकीन नहीं है, लेकिन '{word}' शायद संस्कृत '{sanskrit_root}' से आया है।",
+                'no_sanskrit': "क्षमा करें, इस ट्वीट में कोई संस्कृत शब्द नहीं मिला।"
             },
             
             # Bengali
             'bengali': {
                 'found': "শব্দ '{word}' সংস্কৃত মূল '{sanskrit_root}' থেকে এসেছে, অর্থ: {meaning}",
                 'not_found': "দুঃখিত, '{word}' এর সংস্কৃত মূল খুঁজে পাওয়া যায়নি।",
-                'low_confidence': "আমি নিশ্চিত নই, কিন্তু '{word}' সম্ভবত সংস্কৃত '{sanskrit_root}' থেকে এসেছে।"
+                'low_confidence': "আমি নিশ্চিত নই, কিন্তু '{word}' সম্ভবত সংস্কৃত '{sanskrit_root}' থেকে এসেছে।",
+                'no_sanskrit': "দুঃখিত, এই টুইটে কোনো সংস্কৃত শব্দ পাওয়া যায়নি।"
             },
             
             # Telugu
@@ -116,54 +186,126 @@ class ResponseGenerator:
                 'low_confidence': "ਮੈਨੂੰ ਪੱਕਾ ਪਤਾ ਨਹੀਂ, ਪਰ '{word}' ਸ਼ਾਇਦ ਸੰਸਕ੍ਰਿਤ '{sanskrit_root}' ਤੋਂ ਆਇਆ ਹੈ।"
             }
         }
+        
+        self.startup_timings['init'] = time.perf_counter() - init_start
+        logger.info(
+            "Response generator ready in "
+            f"{self.startup_timings['init'] * 1000:.1f} ms "
+            f"(dictionary {self.startup_timings.get('dictionary', 0.0) * 1000:.1f} ms)"
+        )
+        
+        if warm_up:
+            self.warm_up()
+
+    @property
+    def model(self):
+        """
+        The IndicBERT handler, loaded on first use.
+        
+        None if loading failed, or while a background warm-up is still
+        loading it, so callers fall back to the dictionary instead of waiting.
+        """
+        if self._model_loaded:
+            return self._model
+        if self._warm_up_thread is not None and self._warm_up_thread.is_alive():
+            return None
+        return self._load_model()
+
+    @model.setter
+    def model(self, model):
+        with self._model_lock:
+            self._model = model
+            self._model_loaded = True
+
+    def _load_model(self):
+        """Load the model and labels once; safe to call from several threads."""
+        with self._model_lock:
+            if self._model_loaded:
+                return self._model
+            
+            start = time.perf_counter()
+            try:
+                # Initialize IndicBERT model
+                from src.models.indic_bert_handler import IndicBertHandler
+                self._model = IndicBertHandler(
+                    model_path=self.model_path,
+                    tokenizer_path=self.tokenizer_path,
+                    labels_path=self.labels_path,
+                    backend=cfg.MODEL_BACKEND,
+                    onnx_path=cfg.ONNX_MODEL_PATH,
+                    num_threads=cfg.MODEL_NUM_THREADS
+                )
+                logger.info("Successfully initialized IndicBERT model")
+            except Exception as e:
+                logger.error(f"Error loading IndicBERT model: {e}")
+                self._model = None
+            
+            # Failures are not retried on every request
+            self._model_loaded = True
+            self.startup_timings['model'] = time.perf_counter() - start
+            logger.info(f"Model loading took {self.startup_timings['model'] * 1000:.1f} ms")
+            return self._model
+
+    def _model_load_failed(self) -> bool:
+        """True once loading the model was attempted and failed; False while it is still loading."""
+        return self._model_loaded and self._model is None
+
+    def warm_up(self) -> Optional[threading.Thread]:
+        """
+        Load the model in a background thread; until it is ready, replies use the dictionary only.
+        
+        Returns:
+            The warm-up thread, or None if the model was already loaded
+        """
+        if self._warm_up_thread is None and not self._model_loaded:
+            self._warm_up_thread = threading.Thread(
+                target=self._load_model, name="model-warm-up", daemon=True
+            )
+            self._warm_up_thread.start()
+        return self._warm_up_thread
 
     def _get_word_info(self, word: str, script_type: str) -> Optional[LoanwordInfo]:
         """
-        Get information about a potential Sanskrit loanword using both dictionary and model.
-        Uses a hybrid approach:
-        1. First checks dictionary for exact matches
-        2. If not found, uses IndicBERT model for prediction
-        3. If found in both, combines information with dictionary taking precedence
+        Get information about a potential Sanskrit loanword.
+        Resolves the word through tiers, stopping at the first hit:
+        1. In-process cache of recently resolved words
+        2. Dictionary lookup for exact matches
+        3. IndicBERT model prediction, only for words the dictionary doesn't know
         """
         try:
-            dict_entry = None
-            model_prediction = None
+            # Tier 1: Cache
+            start = time.perf_counter()
+            found, cached = self.word_cache.get(word, script_type)
+            self.tier_stats['cache'].record(int(found), 1, time.perf_counter() - start)
+            if found:
+                return cached
             
-            # Step 1: Dictionary Lookup
+            # Tier 2: Dictionary Lookup
             if self.dict_handler:
+                start = time.perf_counter()
                 dict_entry = self.dict_handler.lookup_word(word, script_type)
+                self.tier_stats['dictionary'].record(int(dict_entry is not None), 1, time.perf_counter() - start)
+                if dict_entry:
+                    info = self._dict_word_info(word, dict_entry)
+                    self.word_cache.put(word, script_type, info)
+                    return info
             
-            # Step 2: Model Prediction
+            # Tier 3: Model Prediction
             if self.model:
-                sanskrit_root, meaning, confidence = self.model.predict(word, script_type)
-                if sanskrit_root and meaning:
-                    model_prediction = LoanwordInfo(
-                        word=word,
-                        sanskrit_root=sanskrit_root,
-                        meaning=meaning,
-                        confidence=confidence
-                    )
-            
-            # Step 3: Combine Results
-            if dict_entry:
-                # Dictionary entries have high confidence
-                return LoanwordInfo(
-                    word=word,
-                    sanskrit_root=dict_entry.sanskrit_root,
-                    meaning=dict_entry.meaning,
-                    confidence=1.0
-                )
-            elif model_prediction:
+                start = time.perf_counter()
+                model_prediction, settled = self._model_word_info(word, script_type)
+                self.tier_stats['model'].record(int(model_prediction is not None), 1, time.perf_counter() - start)
+                # Not in the dictionary and rejected by the model: cache as a
+                # non-loanword; words the model failed on or found no label
+                # for are left uncached
+                if settled:
+                    self.word_cache.put(word, script_type, model_prediction)
                 return model_prediction
-            elif not self.model and not self.dict_handler:
-                # Fallback if neither system is available
+            elif not self.dict_handler and self._model_load_failed():
+                # Fallback if neither system is available; while the model is
+                # still loading the word is left unresolved instead
                 logger.warning("Both dictionary and model unavailable, using fallback")
-                return LoanwordInfo(
-                    word=word,
-                    sanskrit_root="मूल",
-                    meaning="root/origin",
-                    confidence=0.85
-                )
+                return self._placeholder_info(word)
             
             return None
             
@@ -171,6 +313,152 @@ class ResponseGenerator:
             logger.error(f"Error getting word info: {e}")
             return None
 
+    @staticmethod
+    def _placeholder_info(word: str) -> LoanwordInfo:
+        """Stand-in result used when neither the dictionary nor the model is available."""
+        return LoanwordInfo(
+            word=word,
+            sanskrit_root="मूल",
+            meaning="root/origin",
+            confidence=0.85,
+            placeholder=True
+        )
+
+    def _dict_word_info(self, word: str, dict_entry) -> LoanwordInfo:
+        """Build word info from a dictionary entry."""
+        # Dictionary entries have high confidence
+        return LoanwordInfo(
+            word=word,
+            sanskrit_root=dict_entry.sanskrit_root,
+            meaning=dict_entry.meaning,
+            confidence=1.0
+        )
+
+    @staticmethod
+    def _prediction_info(word: str, prediction) -> Tuple[Optional[LoanwordInfo], bool]:
+        """
+        Turn a (sanskrit_root, meaning, confidence, rejected) model prediction into word info.
+        
+        Returns:
+            The word info (None if no root was found), and whether the result
+            is settled enough to cache: a found root or a word the classifier
+            rejected. A failed prediction or a loanword without a label entry
+            stays unknown.
+        """
+        sanskrit_root, meaning, confidence, rejected = prediction
+        if sanskrit_root and meaning:
+            return LoanwordInfo(
+                word=word,
+                sanskrit_root=sanskrit_root,
+                meaning=meaning,
+                confidence=confidence
+            ), True
+        return None, rejected
+
+    def _model_word_info(self, word: str, script_type: str) -> Tuple[Optional[LoanwordInfo], bool]:
+        """Get the IndicBERT prediction for a word and whether to cache it, see _prediction_info."""
+        if not self.model:
+            return None, False
+        return self._prediction_info(word, self.model.predict(word, script_type))
+
+    def _model_words_info(self, words: List[str],
+                          script_type: str) -> Dict[str, Tuple[Optional[LoanwordInfo], bool]]:
+        """Get IndicBERT predictions for many words with batched inference."""
+        if not self.model or not words:
+            return {word: (None, False) for word in words}
+        
+        predictions = self.model.predict_batch(words, script_type)
+        return {
+            word: self._prediction_info(word, prediction)
+            for word, prediction in zip(words, predictions)
+        }
+
+    def _get_words_info(self, words: List[str], script_type: str) -> Dict[str, Optional[LoanwordInfo]]:
+        """
+        Get information about every word of a tweet at once.
+        Uses the same tiers as _get_word_info, but each tier handles all of the
+        remaining words together: one dictionary lookup and one model batch.
+        """
+        unique_words = list(dict.fromkeys(words))
+        results = {}
+        timings = {}
+        try:
+            # Tier 1: Cache
+            start = time.perf_counter()
+            remaining = []
+            for word in unique_words:
+                found, cached = self.word_cache.get(word, script_type)
+                if found:
+                    results[word] = cached
+                else:
+                    remaining.append(word)
+            timings['cache'] = time.perf_counter() - start
+            self.tier_stats['cache'].record(len(unique_words) - len(remaining), len(unique_words), timings['cache'])
+            
+            # Tier 2: Dictionary Lookup
+            if self.dict_handler and remaining:
+                start = time.perf_counter()
+                dict_entries = self.dict_handler.lookup_words(remaining, script_type)
+                timings['dictionary'] = time.perf_counter() - start
+                self.tier_stats['dictionary'].record(len(dict_entries), len(remaining), timings['dictionary'])
+                
+                for word, dict_entry in dict_entries.items():
+                    results[word] = self._dict_word_info(word, dict_entry)
+                    self.word_cache.put(word, script_type, results[word])
+                remaining = [word for word in remaining if word not in dict_entries]
+            
+            # Tier 3: Model Prediction; the model is only touched (and lazily
+            # loaded) for words the cache and the dictionary did not resolve
+            if remaining and self.model:
+                start = time.perf_counter()
+                predictions = self._model_words_info(remaining, script_type)
+                timings['model'] = time.perf_counter() - start
+                found = 0
+                for word, (prediction, settled) in predictions.items():
+                    found += int(prediction is not None)
+                    results[word] = prediction
+                    # Only words the classifier rejected are cached as non-loanwords
+                    if settled:
+                        self.word_cache.put(word, script_type, prediction)
+                self.tier_stats['model'].record(found, len(remaining), timings['model'])
+            elif remaining and not self.dict_handler and self._model_load_failed():
+                # Same fallback as _get_word_info when neither system is available
+                logger.warning("Both dictionary and model unavailable, using fallback")
+                for word in remaining:
+                    results[word] = self._placeholder_info(word)
+            
+        except Exception as e:
+            logger.error(f"Error getting word info: {e}")
+        
+        for word in unique_words:
+            results.setdefault(word, None)
+        
+        logger.debug(
+            f"Resolved {len(unique_words)} words: " +
+            ", ".join(f"{tier} {elapsed * 1000:.1f} ms" for tier, elapsed in timings.items())
+        )
+        return results
+
+    def get_tier_statistics(self) -> Dict[str, Dict[str, float]]:
+        """Hit rate and latency of each resolution tier, plus the word cache counters."""
+        statistics = {tier: stats.as_dict() for tier, stats in self.tier_stats.items()}
+        statistics['word_cache'] = self.word_cache.get_statistics()
+        return statistics
+
+    def log_tier_statistics(self):
+        """Log hit rate and latency of each resolution tier."""
+        for tier, stats in self.tier_stats.items():
+            logger.info(
+                f"{tier}: {stats.hits}/{stats.lookups} hits ({stats.hit_rate:.0%}), "
+                f"{stats.avg_latency_ms:.2f} ms per word, {stats.total_time:.2f} s total"
+            )
+        cache_stats = self.word_cache.get_statistics()
+        logger.info(
+            f"word cache: {cache_stats['size']} words, {cache_stats['hits']} hits, "
+            f"{cache_stats['negative_hits']} negative hits, {cache_stats['misses']} misses, "
+            f"{cache_stats['evictions']} evictions"
+        )
+
     def _format_script_specific_response(self, template_key: str, script_type: str, **kwargs) -> str:
         """Format response using script-specific template if available."""
         # Use script-specific template if available, fall back to generic
@@ -187,8 +475,9 @@ class ResponseGenerator:
             
             # Process each word in the query
             loanword_results = []
+            words_info = self._get_words_info(query.words, query.script_type)
             for word in query.words:
-                word_info = self._get_word_info(word, query.script_type)
+                word_info = words_info[word]
                 if word_info:
                     if word_info.confidence < 0.7:
                         response = self._format_script_specific_response(
@@ -272,9 +561,11 @@ class ResponseGenerator:
             'low_confidence': []
         }
         
+        words_info = self._get_words_info(words, script_type)
         for word in words:
-            word_info = self._get_word_info(word, script_type)
-            if word_info:
+            word_info = words_info[word]
+            # Placeholder results are not real matches and must not be tweeted
+            if word_info and not word_info.placeholder:
                 if word_info.confidence >= 0.8:
                     results['high_confidence'].append(word_info)
                 elif word_info.confidence >= 0.5:
@@ -0,0 +1,302 @@
+from typing import Any, Dict, List, Optional, Tuple, Union
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# State key recording which JSON state file was imported
+IMPORT_MARKER = 'imported_state_file'
+
+class BotStateStore:
+    """
+    SQLite store for the bot's state.
+
+    Holds plain state values (last mention ID, polling plan), API counters
+    with per-endpoint daily usage, learned rate limit windows, mentions
+    waiting for a reply, processed tweet IDs and per-user conversation
+    context. Every update touches only its own rows and is committed on
+    its own, so its cost does not grow with the number of users, and a
+    crash loses at most the update in flight instead of corrupting the
+    whole state.
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Args:
+            db_path: Path to the SQLite state file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode = WAL')
+        self._conn.execute('PRAGMA synchronous = NORMAL')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS state (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS counters (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS api_usage (
+                day TEXT NOT NULL,
+                endpoint TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (day, endpoint, kind)
+            );
+            CREATE TABLE IF NOT EXISTS rate_limits (
+                endpoint TEXT NOT NULL,
+                window TEXT NOT NULL,
+                request_limit INTEGER,
+                remaining INTEGER NOT NULL,
+                reset_at REAL NOT NULL,
+                PRIMARY KEY (endpoint, window)
+            );
+            CREATE TABLE IF NOT EXISTS pending_mentions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                tweet_id TEXT NOT NULL UNIQUE,
+                mention TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS processed_tweets (
+                tweet_id TEXT PRIMARY KEY,
+                processed_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS conversation_context (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id TEXT NOT NULL,
+                entry TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS conversation_context_user
+                ON conversation_context (user_id, id);
+        ''')
+        self._conn.commit()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Load a JSON-serializable state value."""
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM state WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set(self, key: str, value: Any) -> None:
+        """Save a JSON-serializable state value."""
+        self.update({key: value})
+
+    def update(self, values: Dict[str, Any]) -> None:
+        """Save several state values in one transaction."""
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)',
+                [(key, json.dumps(value, ensure_ascii=False)) for key, value in values.items()]
+            )
+            self._conn.commit()
+
+    def load(self) -> Dict[str, Any]:
+        """Return every state value."""
+        with self._lock:
+            rows = self._conn.execute('SELECT key, value FROM state').fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def get_counter(self, name: str) -> int:
+        """Current value of a counter (0 if never incremented)."""
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM counters WHERE name = ?', (name,)).fetchone()
+        return row[0] if row else 0
+
+    def increment_counter(self, name: str, amount: int = 1) -> int:
+        """Atomically add to a counter and return its new value."""
+        with self._lock:
+            self._conn.execute('''
+                INSERT INTO counters (name, value) VALUES (?, ?)
+                ON CONFLICT (name) DO UPDATE SET value = value + excluded.value
+            ''', (name, amount))
+            self._conn.commit()
+            return self._conn.execute('SELECT value FROM counters WHERE name = ?', (name,)).fetchone()[0]
+
+    def record_usage(self, day: str, endpoint: str, kind: str, amount: int = 1) -> None:
+        """Add requests to an endpoint's usage for a day."""
+        with self._lock:
+            self._conn.execute('''
+                INSERT INTO api_usage (day, endpoint, kind, count) VALUES (?, ?, ?, ?)
+                ON CONFLICT (day, endpoint, kind) DO UPDATE SET count = count + excluded.count
+            ''', (day, endpoint, kind, amount))
+            self._conn.commit()
+
+    def usage_history(self, since_day: Optional[str] = None) -> List[Dict]:
+        """
+        Per-endpoint daily usage.
+
+        Args:
+            since_day: First day (YYYY-MM-DD) to include, or None for all
+
+        Returns:
+            Dicts with day, endpoint, kind and count, ordered by day
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT day, endpoint, kind, count FROM api_usage WHERE day >= ? ORDER BY day, endpoint, kind',
+                (since_day or '',)
+            ).fetchall()
+        return [{'day': day, 'endpoint': endpoint, 'kind': kind, 'count': count}
+                for day, endpoint, kind, count in rows]
+
+    def get_rate_limits(self) -> Dict[Tuple[str, str], Dict]:
+        """Saved rate limit windows, keyed by (endpoint, window)."""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT endpoint, window, request_limit, remaining, reset_at FROM rate_limits'
+            ).fetchall()
+        return {
+            (endpoint, window): {'limit': limit, 'remaining': remaining, 'reset_at': reset_at}
+            for endpoint, window, limit, remaining, reset_at in rows
+        }
+
+    def set_rate_limit(self, endpoint: str, window: str, limit: Optional[int],
+                       remaining: int, reset_at: float) -> None:
+        """Save what the API last reported for a rate limit window."""
+        with self._lock:
+            self._conn.execute('''
+                INSERT OR REPLACE INTO rate_limits (endpoint, window, request_limit, remaining, reset_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (endpoint, window, limit, remaining, reset_at))
+            self._conn.commit()
+
+    def add_pending_mentions(self, mentions: List[Dict], state: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record mentions waiting for a reply.
+
+        Args:
+            mentions: Mentions returned by the API
+            state: State values saved in the same transaction (e.g. the
+                last mention ID, so it never gets ahead of the pending mentions)
+        """
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO pending_mentions (tweet_id, mention) VALUES (?, ?)',
+                [(str(mention['id']), json.dumps(mention, ensure_ascii=False)) for mention in mentions]
+            )
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)',
+                [(key, json.dumps(value, ensure_ascii=False)) for key, value in (state or {}).items()]
+            )
+            self._conn.commit()
+
+    def remove_pending_mention(self, tweet_id: str) -> None:
+        """Forget a mention once it was replied to or skipped."""
+        with self._lock:
+            self._conn.execute('DELETE FROM pending_mentions WHERE tweet_id = ?', (str(tweet_id),))
+            self._conn.commit()
+
+    def pending_mentions(self) -> List[Dict]:
+        """Mentions still waiting for a reply, in the order they were added."""
+        with self._lock:
+            rows = self._conn.execute('SELECT mention FROM pending_mentions ORDER BY id').fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def is_processed(self, tweet_id: str) -> bool:
+        """Whether a tweet was already handled."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT 1 FROM processed_tweets WHERE tweet_id = ?', (str(tweet_id),)
+            ).fetchone()
+        return row is not None
+
+    def mark_processed(self, tweet_id: str) -> None:
+        """Record that a tweet was handled."""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO processed_tweets (tweet_id, processed_at) VALUES (?, ?)',
+                (str(tweet_id), time.time())
+            )
+            self._conn.commit()
+
+    def prune_processed(self, max_age: float) -> int:
+        """Forget processed tweets older than max_age seconds. Returns the number removed."""
+        with self._lock:
+            cursor = self._conn.execute(
+                'DELETE FROM processed_tweets WHERE processed_at < ?', (time.time() - max_age,)
+            )
+            self._conn.commit()
+        return cursor.rowcount
+
+    def get_context(self, user_id: str) -> List[Dict]:
+        """A user's conversation context, oldest entry first."""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT entry FROM conversation_context WHERE user_id = ? ORDER BY id', (str(user_id),)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def append_context(self, user_id: str, entry: Dict, keep: int = 5) -> None:
+        """
+        Add an entry to a user's conversation context.
+
+        Args:
+            user_id: User the entry belongs to
+            entry: JSON-serializable context entry
+            keep: Number of most recent entries kept for the user
+        """
+        with self._lock:
+            self._conn.execute(
+                'INSERT INTO conversation_context (user_id, entry) VALUES (?, ?)',
+                (str(user_id), json.dumps(entry, ensure_ascii=False))
+            )
+            self._conn.execute('''
+                DELETE FROM conversation_context
+                WHERE user_id = ? AND id NOT IN (
+                    SELECT id FROM conversation_context WHERE user_id = ? ORDER BY id DESC LIMIT ?
+                )
+            ''', (str(user_id), str(user_id), keep))
+            self._conn.commit()
+
+    def import_json(self, json_path: Union[str, Path], keep: int = 5) -> bool:
+        """
+        Import a state file written by the old JSON state code.
+
+        Does nothing if the store already holds state. A marker key records
+        the import, so a file holding nothing but conversation context is
+        not imported again on the next start.
+
+        Args:
+            json_path: Path to the JSON state file
+            keep: Number of most recent context entries kept per user
+
+        Returns:
+            True if the file was imported
+        """
+        json_path = Path(json_path)
+        if not json_path.exists() or self.load():
+            return False
+        try:
+            with open(json_path, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Error importing state from {json_path}: {e}")
+            return False
+
+        contexts = state.pop('conversation_context', {}) or {}
+        state[IMPORT_MARKER] = str(json_path)
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)',
+                [(key, json.dumps(value, ensure_ascii=False)) for key, value in state.items()]
+            )
+            self._conn.executemany(
+                'INSERT INTO conversation_context (user_id, entry) VALUES (?, ?)',
+                [(str(user_id), json.dumps(entry, ensure_ascii=False))
+                 for user_id, entries in contexts.items() for entry in entries[-keep:]]
+            )
+            self._conn.commit()
+        logger.info(f"Imported state from {json_path}")
+        return True
+
+    def close(self) -> None:
+        """Close the state database."""
+        with self._lock:
+            self._conn.close()
@@ -1,12 +1,14 @@
 import os
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 import json
-from datetime import datetime, timezone
+from datetime import datetime
 import random
 from requests_oauthlib import OAuth1
 import logging
+import threading
 from pathlib import Path
 import sys
 
@@ -15,6 +17,10 @@ project_root = Path(__file__).resolve().parents[2]
 sys.path.append(str(project_root))
 
 from config import bot_config as cfg
+from src.bot.mention_pipeline import MentionPipeline
+from src.bot.poll_scheduler import PollScheduler
+from src.bot.quota_tracker import QuotaTracker
+from src.bot.state_store import BotStateStore
 
 # Set up logging
 logging.basicConfig(
@@ -34,7 +40,9 @@ logging.getLogger('oauthlib').setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
 
-# State file path
+# State database path
+STATE_DB = os.path.join(os.path.dirname(__file__), 'bot_state.db')
+# Old JSON state file, imported into the state database on first run
 STATE_FILE = os.path.join(os.path.dirname(__file__), 'bot_state.json')
 
 class TwitterBot:
@@ -59,16 +67,41 @@ class TwitterBot:
             self.access_token_secret
         )
         
-        # API usage tracking
-        self.monthly_reads = 0
-        self.monthly_writes = 0
+        # Pooled session: connections are kept alive and reused across API calls
+        self.session = self._create_session()
+        
+        # Durable state: state values, API counters and processed tweets
+        self.store = BotStateStore(STATE_DB)
+        self.store.import_json(STATE_FILE)
+        self.store.prune_processed(cfg.PROCESSED_TWEET_RETENTION)
+        
+        # API usage tracking: monthly quotas, per-endpoint history and
+        # rate limit windows, all persisted in the state store
         self.max_monthly_reads = cfg.MAX_MONTHLY_READS
         self.max_monthly_writes = cfg.MAX_MONTHLY_WRITES
-        self.last_reset_time = datetime.now(timezone.utc)
+        self.quota = QuotaTracker(self.store, self.max_monthly_reads, self.max_monthly_writes)
+        self.monthly_reads = self.quota.used('reads')
+        self.monthly_writes = self.quota.used('writes')
+        # Counters are shared by the polling loop and the reply worker
+        self._api_lock = threading.Lock()
+        
+        # Created on the first run_bot call
+        self.response_gen = None
         
         # Load state
         self.state = self._load_state()
         
+        # Polling plan for the reads left in the quota, persisted with the state
+        self.scheduler = PollScheduler(
+            self.state,
+            self.quota,
+            min_interval=cfg.MIN_CHECK_INTERVAL,
+            burst_polls=cfg.POLL_BURST_POLLS,
+            burst_speedup=cfg.POLL_BURST_SPEEDUP,
+            backoff_factor=cfg.BACKOFF_FACTOR,
+            max_backoff=cfg.POLL_MAX_BACKOFF
+        )
+        
         logger.info("=== Bot Initialization ===")
         logger.info(f"Initializing bot as {self.bot_username}")
         
@@ -82,13 +115,39 @@ class TwitterBot:
         logger.info(f"(+) Free API limits: {self.max_monthly_reads} reads, {self.max_monthly_writes} writes per month")
         logger.info("=========================")
 
+    def _create_session(self):
+        """Create an HTTP session with OAuth attached and a connection pool"""
+        session = requests.Session()
+        session.auth = self.auth
+        adapter = HTTPAdapter(
+            pool_connections=cfg.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=cfg.HTTP_POOL_MAXSIZE
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if not cfg.HTTP_KEEP_ALIVE:
+            session.headers['Connection'] = 'close'
+        return session
+
+    def close(self):
+        """Close the pooled connections and the state database"""
+        self.session.close()
+        self.store.close()
+
     def _get_user_id(self):
         """Get the bot's user ID"""
         logger.info("Getting bot's user ID...")
         url = f"{cfg.API_BASE_URL}{cfg.USER_LOOKUP_ENDPOINT}"
+        endpoint = self.quota.endpoint_key('GET', url)
+        if not self._wait_for_rate_limit(endpoint):
+            return None
+        # Made on every start, so a crash loop spends reads too
+        if not self._check_api_limits(is_write=False, endpoint=endpoint):
+            return None
         
         try:
-            response = requests.get(url, auth=self.auth)
+            response = self.session.get(url)
+            self.quota.update_rate_limits(endpoint, response.headers)
             if response.status_code == 200:
                 return response.json()['data']['id']
             else:
@@ -120,47 +179,69 @@ class TwitterBot:
             return True
         return False
 
-    def _check_api_limits(self, is_write=False):
-        """Check if we're within API limits"""
-        current_time = datetime.now(timezone.utc)
-        
-        # Reset counters if it's a new month
-        if current_time.month != self.last_reset_time.month:
-            logger.info("\n=== Monthly Reset ===")
-            logger.info("New month detected - resetting API counters")
-            self.monthly_reads = 0
-            self.monthly_writes = 0
-            self.last_reset_time = current_time
-            logger.info("=====================\n")
+    def _wait_for_rate_limit(self, endpoint):
+        """Wait out a short rate limit window; False if the API would reject the request"""
+        wait = self.quota.acquire(endpoint)
+        while wait > 0:
+            if wait > cfg.MAX_RATE_LIMIT_WAIT:
+                reset_datetime = datetime.fromtimestamp(time.time() + wait)
+                logger.warning(f"Rate limit for {endpoint} exhausted until "
+                               f"{reset_datetime.strftime('%Y-%m-%d %H:%M:%S')} - not sending")
+                return False
+            logger.info(f"Rate limit for {endpoint} exhausted - waiting {wait:.0f} seconds")
+            time.sleep(wait)
+            wait = self.quota.acquire(endpoint)
+        return True
+
+    def _within_api_limits(self, is_write=False):
+        """Check if a request would stay within the monthly API limits, without counting it"""
+        # Counters are kept per month, so a new month starts from zero
+        self.monthly_reads = self.quota.used('reads')
+        self.monthly_writes = self.quota.used('writes')
 
         if is_write:
-            if self.monthly_writes >= self.max_monthly_writes:
-                logger.error("Monthly write limit reached!")
-                return False
-            self.monthly_writes += 1
-            logger.info(f"[W] Write counter: {self.monthly_writes}/{self.max_monthly_writes}")
-        else:
-            if self.monthly_reads >= self.max_monthly_reads:
-                logger.error("Monthly read limit reached!")
+            return self.monthly_writes < self.max_monthly_writes
+        return self.monthly_reads < self.max_monthly_reads
+
+    def _check_api_limits(self, is_write=False, endpoint='unknown'):
+        """Check if we're within API limits and count the request.
+
+        Called once per request from _make_request and _get_user_id, the
+        only places the budget is spent.
+        """
+        with self._api_lock:
+            if not self._within_api_limits(is_write):
+                logger.error(f"Monthly {'write' if is_write else 'read'} limit reached!")
                 return False
-            self.monthly_reads += 1
-            logger.info(f"[R] Read counter: {self.monthly_reads}/{self.max_monthly_reads}")
-        return True
+
+            if is_write:
+                self.monthly_writes = self.quota.record(endpoint, 'writes')
+                logger.info(f"[W] Write counter: {self.monthly_writes}/{self.max_monthly_writes}")
+            else:
+                self.monthly_reads = self.quota.record(endpoint, 'reads')
+                logger.info(f"[R] Read counter: {self.monthly_reads}/{self.max_monthly_reads}")
+            return True
 
     def _make_request(self, url, method='GET', params=None, json_data=None):
         """Make an authenticated request to Twitter API with rate limit handling"""
-        if not self._check_api_limits(is_write=(method == 'POST')):
+        endpoint = self.quota.endpoint_key(method, url)
+        if not self._wait_for_rate_limit(endpoint):
+            return None
+        if not self._check_api_limits(is_write=(method == 'POST'), endpoint=endpoint):
             return None
 
         headers = {'Content-Type': 'application/json'}
         
         for retry in range(cfg.MAX_RETRIES):
             try:
+                if retry and not self._wait_for_rate_limit(endpoint):
+                    return None
                 logger.info(f"\n>>> Making {method} request to {url} (attempt {retry + 1}/{cfg.MAX_RETRIES})")
                 if method == 'GET':
-                    response = requests.get(url, auth=self.auth, headers=headers, params=params)
+                    response = self.session.get(url, headers=headers, params=params)
                 elif method == 'POST':
-                    response = requests.post(url, auth=self.auth, headers=headers, json=json_data)
+                    response = self.session.post(url, headers=headers, json=json_data)
+                self.quota.update_rate_limits(endpoint, response.headers)
                 
                 if self._handle_rate_limit(response):
                     continue
@@ -186,20 +267,18 @@ class TwitterBot:
         return None
 
     def _load_state(self):
-        """Load bot state from file"""
+        """Load bot state from the state database"""
+        state = {"last_mention_id": None, "last_check_time": None}
         try:
-            if os.path.exists(STATE_FILE):
-                with open(STATE_FILE, 'r') as f:
-                    return json.load(f)
+            state.update(self.store.load())
         except Exception as e:
             logger.error(f"Error loading state: {e}")
-        return {"last_mention_id": None, "last_check_time": None}
+        return state
     
-    def _save_state(self):
-        """Save bot state to file"""
+    def _save_state(self, *keys):
+        """Save the given state keys (all of them if none are given)"""
         try:
-            with open(STATE_FILE, 'w') as f:
-                json.dump(self.state, f, indent=4)
+            self.store.update({key: self.state[key] for key in keys or self.state})
         except Exception as e:
             logger.error(f"Error saving state: {e}")
 
@@ -259,19 +338,96 @@ class TwitterBot:
             logger.error(f"Error replying to tweet: {e}")
             return None
 
+    def _generate_reply(self, mention):
+        """Build the reply to a mention with the response generator, cut to fit a tweet"""
+        reply = self.response_gen.process_tweet(mention.get('text', ''))
+        if reply and len(reply) > cfg.MAX_TWEET_LENGTH:
+            # Cut at the last full line that fits, so no word entry is left half-written
+            cut = reply[:cfg.MAX_TWEET_LENGTH - 1]
+            if '\n' in cut:
+                cut = cut[:cut.rindex('\n')]
+            reply = cut.rstrip() + '…'
+        return reply
+
+    def _post_reply(self, tweet_id, message):
+        """Reply to a mention and record it as processed"""
+        response = self.reply_to_tweet(tweet_id, message)
+        if response:
+            self.store.mark_processed(tweet_id)
+        return response
+
+    def _finish_mention(self, mention):
+        """Drop a mention from the pending list once the pipeline is done with it"""
+        self.store.remove_pending_mention(mention['id'])
+
+    def _queue_mentions(self, mentions, pipeline, poll_time=0.0):
+        """
+        Record polled mentions as pending and hand them to the pipeline.
+        
+        The pending mentions are saved together with the new last mention ID,
+        so mentions still queued when the bot stops are requeued on restart
+        instead of being skipped by since_id.
+        """
+        self.scheduler.record_poll(len(mentions))
+        
+        # Mentions replied to before a restart can come back; skip them
+        new_mentions = [m for m in mentions if not self.store.is_processed(m['id'])]
+        if len(new_mentions) < len(mentions):
+            logger.info(f"Skipping {len(mentions) - len(new_mentions)} already processed mentions")
+        
+        state = {'poll_schedule': self.state['poll_schedule']}
+        if mentions:
+            state['last_mention_id'] = mentions[0]['id']
+        self.store.add_pending_mentions(new_mentions, state)
+        self.state.update(state)
+        pipeline.submit(new_mentions, poll_time)
+
+    def _requeue_pending(self, pipeline):
+        """Queue the mentions left unanswered when the bot last stopped"""
+        pending = []
+        for mention in self.store.pending_mentions():
+            if self.store.is_processed(mention['id']):
+                self.store.remove_pending_mention(mention['id'])
+            else:
+                pending.append(mention)
+        if pending:
+            logger.info(f"Requeueing {len(pending)} mentions left from the last run")
+            pipeline.requeue(pending)
+
+    def _create_pipeline(self):
+        """Create the poll -> respond -> post pipeline for mentions"""
+        if self.response_gen is None:
+            from src.bot.response_gen import ResponseGenerator
+            self.response_gen = ResponseGenerator(warm_up=True)
+        
+        return MentionPipeline(
+            respond=self._generate_reply,
+            post=self._post_reply,
+            mention_queue_size=cfg.MENTION_QUEUE_SIZE,
+            reply_queue_size=cfg.REPLY_QUEUE_SIZE,
+            response_workers=cfg.RESPONSE_WORKERS,
+            reply_interval=cfg.REPLY_INTERVAL,
+            on_done=self._finish_mention
+        )
+
     def run_bot(self, check_interval=cfg.DEFAULT_CHECK_INTERVAL):
         """Run the bot continuously"""
         logger.info("\n=== Starting Bot ===")
         logger.info(f"[BOT] Username: {self.bot_username}")
         logger.info(f"[BOT] User ID: {self.user_id}")
-        logger.info(f"[TIME] Check interval: {check_interval} seconds")
+        logger.info(f"[TIME] Retry interval: {check_interval} seconds")
+        logger.info(f"[TIME] Planned check interval: {self.scheduler.base_interval():.0f} seconds")
         logger.info("[API] Using Free API tier limits:")
         logger.info(f"      - {self.max_monthly_reads} reads per month")
         logger.info(f"      - {self.max_monthly_writes} writes per month")
         logger.info("==================\n")
         
         check_count = 0
-        since_id = self.state.get('last_mention_id')
+        
+        # Responses are generated and posted by worker threads; this loop only polls
+        pipeline = self._create_pipeline()
+        pipeline.start()
+        self._requeue_pending(pipeline)
         
         while True:
             try:
@@ -280,32 +436,26 @@ class TwitterBot:
                 current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 logger.info(f"[TIME] Current: {current_time}")
                 
-                if not self._check_api_limits(is_write=False):
-                    sleep_time = (24 * 60 * 60)  # 24 hours
-                    logger.warning(f"API limit reached. Sleeping for {sleep_time} seconds...")
+                with self._api_lock:
+                    within_limits = self._within_api_limits(is_write=False)
+                if not within_limits:
+                    sleep_time = self.scheduler.next_interval()
+                    logger.warning(f"API limit reached. Sleeping for {sleep_time:.0f} seconds...")
                     time.sleep(sleep_time)
                     continue
 
-                mentions = self.check_mentions(since_id)
+                poll_start = time.perf_counter()
+                mentions = self.check_mentions(self.state.get('last_mention_id'))
+                poll_time = time.perf_counter() - poll_start
                 
-                if mentions:
-                    since_id = mentions[0]['id']
-                    self.state['last_mention_id'] = since_id
-                    self._save_state()
-                    for mention in mentions:
-                        if not self._check_api_limits(is_write=True):
-                            logger.warning("Write limit reached, skipping replies...")
-                            break
-                        
-                        reply = f"Thank you for mentioning me! I'm here to help identify Sanskrit loanwords. (Tweet ID: {mention['id']})"
-                        self.reply_to_tweet(mention['id'], reply)
-                        time.sleep(5)  # Delay between replies
+                self._queue_mentions(mentions, pipeline, poll_time)
+                pipeline.log_statistics()
+                self.quota.log_status()
                 
-                # Add jitter to check interval
+                # Add jitter to the planned interval
                 jitter = random.randint(*cfg.JITTER_RANGE)
-                adjusted_interval = max(cfg.MIN_CHECK_INTERVAL, 
-                                     min(check_interval + jitter, cfg.MAX_CHECK_INTERVAL))
-                logger.info(f"\n... Waiting {adjusted_interval} seconds before next check ...")
+                adjusted_interval = max(cfg.MIN_CHECK_INTERVAL, self.scheduler.next_interval() + jitter)
+                logger.info(f"\n... Waiting {adjusted_interval:.0f} seconds before next check ...")
                 time.sleep(adjusted_interval)
                 
             except KeyboardInterrupt:
@@ -315,6 +465,10 @@ class TwitterBot:
                 logger.error(f"Error in main loop: {e}", exc_info=True)
                 logger.info(f"... Waiting {check_interval} seconds before retry ...")
                 time.sleep(check_interval)
+        
+        pipeline.stop(timeout=cfg.PIPELINE_SHUTDOWN_TIMEOUT)
+        pipeline.log_statistics()
+        self.close()
 
 if __name__ == "__main__":
     try:
@@ -0,0 +1,120 @@
+from typing import Dict, Optional, Tuple
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import replace
+import logging
+
+logger = logging.getLogger(__name__)
+
+class WordInfoCache:
+    """
+    Bounded LRU cache with TTL for resolved loanword info.
+
+    Keys are (normalized_word, script_type). A None value is a negative
+    entry: a word confirmed not to be a loanword. Negative entries use their
+    own (usually shorter) TTL and are disabled when negative_ttl is 0.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 6 * 60 * 60,
+                 negative_ttl: float = 60 * 60, clock=time.monotonic):
+        """
+        Args:
+            max_size: Maximum number of cached words
+            ttl: Seconds a resolved word stays valid
+            negative_ttl: Seconds a confirmed non-loanword stays valid (0 disables)
+            clock: Time source, replaceable in tests
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        self._entries = OrderedDict()  # key -> (expires_at, info)
+        self._lock = threading.Lock()
+
+        # Counters
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def normalize(word: str) -> str:
+        """Normalize a word the way dictionary lookups do."""
+        return unicodedata.normalize('NFC', word).strip().lower()
+
+    def get(self, word: str, script_type: str) -> Tuple[bool, Optional[object]]:
+        """
+        Look up a word.
+
+        Returns:
+            (found, info). found is False on a miss; info is None for a
+            cached non-loanword.
+        """
+        key = (self.normalize(word), script_type)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+
+            expires_at, info = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return False, None
+
+            self._entries.move_to_end(key)
+            if info is None:
+                self.negative_hits += 1
+                return True, None
+            self.hits += 1
+
+        # Cached info may have been resolved from a different spelling of the word
+        return True, info if info.word == word else replace(info, word=word)
+
+    def put(self, word: str, script_type: str, info: Optional[object]):
+        """Cache resolved info, or None to record a confirmed non-loanword."""
+        ttl = self.ttl if info is not None else self.negative_ttl
+        if ttl <= 0 or self.max_size <= 0:
+            return
+
+        key = (self.normalize(word), script_type)
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, info)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, word: str, script_type: str):
+        """Drop a word, e.g. after its dictionary entry changed."""
+        key = (self.normalize(word), script_type)
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Hit, miss and eviction counters."""
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'negative_hits': self.negative_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations
+            }
@@ -6,10 +6,14 @@ Provides a clean interface for database interactions with proper error handling.
 import sqlite3
 from pathlib import Path
 import logging
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, Iterable, List, Optional, Tuple, Union, Any
+from itertools import islice
 import json
 from contextlib import contextmanager
+from dataclasses import dataclass
+import queue
 import sys
+import threading
 
 # Add project root to Python path
 project_root = Path(__file__).resolve().parents[2]
@@ -22,22 +26,237 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Script stored for each supported language
+LANGUAGE_SCRIPTS = {
+    'hindi': 'devanagari',
+    'bengali': 'bengali',
+    'tamil': 'tamil',
+    'telugu': 'telugu',
+    'kannada': 'kannada',
+    'malayalam': 'malayalam',
+    'gujarati': 'gujarati',
+    'punjabi': 'gurmukhi',
+    'odia': 'odia'
+}
+
 class DatabaseError(Exception):
     """Custom exception for database operations."""
     pass
 
+@dataclass
+class PoolConfig:
+    """Settings for the SQLite connection pool."""
+    max_connections: int = 5  # Upper bound on shared connections
+    per_thread: bool = False  # Pin one long-lived connection to each thread
+    timeout: float = 5.0  # Seconds to wait for a free shared connection
+    journal_mode: str = 'WAL'
+    synchronous: str = 'NORMAL'
+    mmap_size: int = 64 * 1024 * 1024  # Bytes
+    cache_size: int = -16000  # Negative values are KiB (~16MB)
+
+class ConnectionPool:
+    """Pool of long-lived SQLite connections.
+    
+    Connections are configured once when they are opened and then reused.
+    In shared mode at most ``max_connections`` are open at any time and
+    callers block until one is returned. In per-thread mode every thread
+    keeps its own connection until it exits; connections of exited threads
+    are closed the next time a thread opens one, so short-lived worker
+    threads do not leak SQLite handles.
+    """
+    
+    def __init__(self, db_path: Union[str, Path], config: Optional[PoolConfig] = None):
+        """Initialize the pool. Connections are opened lazily."""
+        self.db_path = Path(db_path)
+        self.config = config or PoolConfig()
+        if self.config.max_connections < 1:
+            raise DatabaseError("Connection pool needs at least one connection")
+        
+        self._idle = queue.LifoQueue(maxsize=self.config.max_connections)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all_connections: List[sqlite3.Connection] = []
+        self._thread_connections: Dict[threading.Thread, sqlite3.Connection] = {}
+        self._open_shared = 0
+        self._closed = False
+        
+        # Usage counters
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+    
+    def _configure(self, conn: sqlite3.Connection) -> None:
+        """Apply per-connection settings."""
+        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        conn.execute('PRAGMA foreign_keys = ON')
+        conn.execute(f'PRAGMA journal_mode = {self.config.journal_mode}')
+        conn.execute(f'PRAGMA synchronous = {self.config.synchronous}')
+        conn.execute(f'PRAGMA mmap_size = {int(self.config.mmap_size)}')
+        conn.execute(f'PRAGMA cache_size = {int(self.config.cache_size)}')
+    
+    def _open(self) -> sqlite3.Connection:
+        """Open and configure a new connection."""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.config.timeout,
+            check_same_thread=False
+        )
+        try:
+            self._configure(conn)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        with self._lock:
+            self._all_connections.append(conn)
+        return conn
+    
+    def _close_exited_threads(self) -> None:
+        """Close the per-thread connections of threads that have exited."""
+        with self._lock:
+            exited = [thread for thread in self._thread_connections if not thread.is_alive()]
+            connections = [self._thread_connections.pop(thread) for thread in exited]
+            for conn in connections:
+                self._all_connections.remove(conn)
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Error closing connection of exited thread: {e}")
+    
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+    
+    def acquire(self) -> sqlite3.Connection:
+        """Get a connection from the pool, opening one if needed."""
+        if self._closed:
+            raise DatabaseError("Connection pool is closed")
+        
+        if self.config.per_thread:
+            conn = getattr(self._local, 'conn', None)
+            if conn is not None:
+                self._count(hit=True)
+                return conn
+            self._close_exited_threads()
+            conn = self._open()
+            self._local.conn = conn
+            with self._lock:
+                self._thread_connections[threading.current_thread()] = conn
+            self._count(hit=False)
+            return conn
+        
+        try:
+            conn = self._idle.get_nowait()
+            self._count(hit=True)
+            return conn
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            can_open = self._open_shared < self.config.max_connections
+            if can_open:
+                self._open_shared += 1
+        
+        if can_open:
+            try:
+                conn = self._open()
+            except sqlite3.Error:
+                with self._lock:
+                    self._open_shared -= 1
+                raise
+            self._count(hit=False)
+            return conn
+        
+        # Pool exhausted, wait for another caller to release a connection
+        with self._lock:
+            self.waits += 1
+        try:
+            conn = self._idle.get(timeout=self.config.timeout)
+        except queue.Empty:
+            raise DatabaseError(
+                f"Timed out after {self.config.timeout}s waiting for a database connection"
+            )
+        self._count(hit=True)
+        return conn
+    
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool."""
+        if conn.in_transaction:
+            # Never hand out a connection with someone else's uncommitted work
+            conn.rollback()
+        
+        if self.config.per_thread:
+            return
+        
+        if self._closed:
+            conn.close()
+            return
+        self._idle.put_nowait(conn)
+    
+    def stats(self) -> Dict[str, int]:
+        """Return pool usage counters."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'waits': self.waits,
+                'open_connections': len(self._all_connections),
+                'idle_connections': self._idle.qsize()
+            }
+    
+    def close(self) -> None:
+        """Close every connection opened by the pool."""
+        self._closed = True
+        with self._lock:
+            connections, self._all_connections = self._all_connections, []
+            self._thread_connections.clear()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Error closing pooled connection: {e}")
+        logger.info(f"Closed connection pool for {self.db_path}: {self.stats()}")
+
 class Database:
-    def __init__(self, db_path: Union[str, Path], is_staging: bool = False):
-        """Initialize database connection."""
+    def __init__(self, db_path: Union[str, Path], is_staging: bool = False,
+                 pool_config: Optional[PoolConfig] = None, use_pool: bool = True):
+        """Initialize database connection.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            is_staging: Whether this is the staging database
+            pool_config: Optional connection pool settings
+            use_pool: Reuse pooled connections instead of opening one per call
+        """
         self.db_path = Path(db_path)
         self.is_staging = is_staging
         
         if not self.db_path.exists():
             raise DatabaseError(f"Database file not found: {self.db_path}")
+        
+        self.pool = ConnectionPool(self.db_path, pool_config) if use_pool else None
     
     @contextmanager
     def get_connection(self):
         """Context manager for database connections."""
+        if self.pool:
+            try:
+                conn = self.pool.acquire()
+            except sqlite3.Error as e:
+                logger.error(f"Database connection error: {e}")
+                raise DatabaseError(f"Failed to connect to database: {e}")
+            try:
+                yield conn
+            except sqlite3.Error as e:
+                logger.error(f"Database connection error: {e}")
+                raise DatabaseError(f"Failed to connect to database: {e}")
+            finally:
+                self.pool.release(conn)
+            return
+        
         conn = None
         try:
             conn = sqlite3.connect(self.db_path)
@@ -51,6 +270,15 @@ class Database:
         finally:
             if conn:
                 conn.close()
+    
+    def get_pool_stats(self) -> Dict[str, int]:
+        """Return connection pool hit/miss counters (empty if pooling is off)."""
+        return self.pool.stats() if self.pool else {}
+    
+    def close(self) -> None:
+        """Close all pooled connections."""
+        if self.pool:
+            self.pool.close()
 
     def add_word(self, word: str, language: str, script: str, romanized: str, 
                 meaning: Optional[str] = None) -> int:
@@ -82,6 +310,120 @@ class Database:
             logger.error(f"Error adding word: {e}")
             raise DatabaseError(f"Failed to add word: {e}")
 
+    def add_words_bulk(self, words: Iterable[Dict[str, Any]],
+                       chunk_size: int = 500) -> Dict[Tuple[str, str], int]:
+        """Insert or update many reconciled words and their etymologies.
+        
+        Each chunk is written in a single transaction using executemany, so a
+        failure only rolls back the chunk being written.
+        
+        Args:
+            words: Reconciled word dictionaries (as produced by WordReconciliation)
+            chunk_size: Number of words written per transaction
+            
+        Returns:
+            Mapping of (word, language) to the word's row id
+        """
+        if chunk_size < 1:
+            raise DatabaseError("chunk_size must be positive")
+        
+        ids = {}
+        iterator = iter(words)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            ids.update(self._write_words_chunk(chunk))
+        
+        logger.info(f"Bulk stored {len(ids)} words")
+        return ids
+    
+    @staticmethod
+    def _word_row(word_info: Dict[str, Any]) -> Tuple:
+        """Map a reconciled word dictionary onto a words table row."""
+        meaning = word_info.get('meaning')
+        if not meaning and word_info.get('meanings'):
+            meaning = '; '.join(word_info['meanings'])
+        
+        language = word_info['language']
+        return (
+            word_info['word'],
+            language,
+            word_info.get('script') or LANGUAGE_SCRIPTS.get(language, language),
+            word_info.get('romanized') or '',
+            meaning,
+            word_info.get('confidence', 0.0)
+        )
+    
+    def _write_words_chunk(self, chunk: List[Dict[str, Any]]) -> Dict[Tuple[str, str], int]:
+        """Write one chunk of words and etymologies in a single transaction."""
+        rows = []
+        for word_info in chunk:
+            try:
+                rows.append(self._word_row(word_info))
+            except KeyError as e:
+                logger.warning(f"Skipping malformed word entry, missing field: {e}")
+        if not rows:
+            return {}
+        
+        try:
+            with self.get_connection() as conn:
+                try:
+                    cursor = conn.cursor()
+                    cursor.executemany('''
+                        INSERT INTO words
+                        (word, language, script, romanized, meaning, confidence_score)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(word, language) DO UPDATE SET
+                            meaning = COALESCE(excluded.meaning, words.meaning),
+                            romanized = CASE WHEN excluded.romanized != ''
+                                             THEN excluded.romanized
+                                             ELSE words.romanized END,
+                            confidence_score = MAX(words.confidence_score,
+                                                   excluded.confidence_score)
+                    ''', rows)
+                    
+                    # Resolve ids for the whole chunk (upserts don't report them)
+                    ids = {}
+                    keys = list({(row[0], row[1]) for row in rows})
+                    for start in range(0, len(keys), 400):  # stay under SQLite's variable limit
+                        batch = keys[start:start + 400]
+                        placeholders = ', '.join(['(?, ?)'] * len(batch))
+                        cursor.execute(f'''
+                            SELECT id, word, language FROM words
+                            WHERE (word, language) IN (VALUES {placeholders})
+                        ''', [value for key in batch for value in key])
+                        for row in cursor.fetchall():
+                            ids[(row['word'], row['language'])] = row['id']
+                    
+                    etymologies = [
+                        (ids[(w['word'], w['language'])], w['sanskrit_word'], w.get('confidence', 0.0))
+                        for w in chunk
+                        if w.get('sanskrit_word') and (w.get('word'), w.get('language')) in ids
+                    ]
+                    cursor.executemany('''
+                        UPDATE etymologies
+                        SET confidence_score = MAX(confidence_score, ?3)
+                        WHERE word_id = ?1 AND sanskrit_root = ?2
+                    ''', etymologies)
+                    cursor.executemany('''
+                        INSERT INTO etymologies (word_id, sanskrit_root, confidence_score)
+                        SELECT ?1, ?2, ?3
+                        WHERE NOT EXISTS (
+                            SELECT 1 FROM etymologies
+                            WHERE word_id = ?1 AND sanskrit_root = ?2
+                        )
+                    ''', etymologies)
+                    
+                    conn.commit()
+                    return ids
+                except sqlite3.Error:
+                    conn.rollback()
+                    raise
+        except sqlite3.Error as e:
+            logger.error(f"Error bulk adding words: {e}")
+            raise DatabaseError(f"Failed to bulk add words: {e}")
+
     def add_etymology(self, word_id: int, sanskrit_root: str) -> int:
         """Add etymology information for a word."""
         try:
@@ -1,6 +1,6 @@
 """Module for reconciling conflicting word information from different sources."""
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import logging
 from dataclasses import dataclass
 from collections import defaultdict
@@ -31,6 +31,10 @@ class WordReconciliation:
         """
         self.confidence_threshold = confidence_threshold
         
+        # Entries buffered by add(), keyed by (sanskrit_word, word, language)
+        self._pending: Dict[Tuple[str, str, str], List[WordEntry]] = defaultdict(list)
+        self._pending_count = 0
+        
     def _group_entries(self, entries: List[WordEntry]) -> Dict[str, List[WordEntry]]:
         """Group entries by their Sanskrit word and target language word pair.
         
@@ -108,6 +112,107 @@ class WordReconciliation:
             }
         )
     
+    def _to_entry(self, entry: Dict) -> Optional[WordEntry]:
+        """Convert a scraped word dictionary to a WordEntry.
+        
+        Args:
+            entry: Word dictionary from a scraper
+            
+        Returns:
+            WordEntry or None if the entry is malformed
+        """
+        try:
+            return WordEntry(
+                word=entry['word'],
+                sanskrit_word=entry['sanskrit_word'],
+                language=entry['language'],
+                confidence=entry['confidence'],
+                source_url=entry['source_url'],
+                source_name=entry['context']['source'],
+                meanings=entry.get('meanings'),
+                usage_examples=entry.get('usage_examples'),
+                context=entry.get('context')
+            )
+        except (KeyError, TypeError) as e:
+            logger.warning(f"Skipping malformed entry, missing field: {e}")
+            return None
+    
+    def _reconcile_group(self, entries: List[WordEntry]) -> Optional[Dict]:
+        """Reconcile all entries for one word pair.
+        
+        Args:
+            entries: Entries sharing the same (sanskrit_word, word, language) key
+            
+        Returns:
+            Reconciled word dictionary or None if no entry is reliable
+        """
+        # Filter out low confidence entries
+        reliable_entries = [
+            e for e in entries 
+            if e.confidence >= self.confidence_threshold
+        ]
+        
+        if not reliable_entries:
+            return None
+        
+        merged = self._merge_entries(reliable_entries)
+        return {
+            'word': merged.word,
+            'sanskrit_word': merged.sanskrit_word,
+            'language': merged.language,
+            'confidence': merged.confidence,
+            'source_url': merged.source_url,
+            'meanings': merged.meanings,
+            'usage_examples': merged.usage_examples,
+            'context': merged.context
+        }
+    
+    @property
+    def pending_count(self) -> int:
+        """Number of entries buffered by add() and not yet flushed."""
+        return self._pending_count
+    
+    def add(self, entry: Dict) -> None:
+        """Buffer a single entry for incremental reconciliation.
+        
+        Entries below the confidence threshold are dropped immediately since
+        they can never contribute to a reconciled word.
+        
+        Args:
+            entry: Word dictionary from a scraper
+        """
+        word_entry = self._to_entry(entry)
+        if word_entry is None or word_entry.confidence < self.confidence_threshold:
+            return
+        
+        key = (word_entry.sanskrit_word, word_entry.word, word_entry.language)
+        self._pending[key].append(word_entry)
+        self._pending_count += 1
+    
+    def flush(self, language: Optional[str] = None) -> List[Dict]:
+        """Reconcile and release buffered entries.
+        
+        Args:
+            language: Only flush entries for this language. Flushes everything if None.
+            
+        Returns:
+            List of reconciled word entries
+        """
+        keys = [
+            key for key in self._pending
+            if language is None or key[2] == language
+        ]
+        
+        reconciled = []
+        for key in keys:
+            entries = self._pending.pop(key)
+            self._pending_count -= len(entries)
+            merged = self._reconcile_group(entries)
+            if merged:
+                reconciled.append(merged)
+        
+        return reconciled
+    
     def reconcile(self, entries: List[Dict]) -> List[Dict]:
         """Reconcile potentially conflicting word entries.
         
@@ -118,23 +223,10 @@ class WordReconciliation:
             List of reconciled word entries
         """
         # Convert dictionaries to WordEntry objects
-        word_entries = []
-        for entry in entries:
-            try:
-                word_entries.append(WordEntry(
-                    word=entry['word'],
-                    sanskrit_word=entry['sanskrit_word'],
-                    language=entry['language'],
-                    confidence=entry['confidence'],
-                    source_url=entry['source_url'],
-                    source_name=entry['context']['source'],
-                    meanings=entry.get('meanings'),
-                    usage_examples=entry.get('usage_examples'),
-                    context=entry.get('context')
-                ))
-            except KeyError as e:
-                logger.warning(f"Skipping malformed entry, missing field: {e}")
-                continue
+        word_entries = [
+            word_entry for word_entry in map(self._to_entry, entries)
+            if word_entry is not None
+        ]
         
         # Group entries by word pairs
         grouped = self._group_entries(word_entries)
@@ -142,23 +234,8 @@ class WordReconciliation:
         # Reconcile each group
         reconciled = []
         for entries in grouped.values():
-            # Filter out low confidence entries
-            reliable_entries = [
-                e for e in entries 
-                if e.confidence >= self.confidence_threshold
-            ]
-            
-            if reliable_entries:
-                merged = self._merge_entries(reliable_entries)
-                reconciled.append({
-                    'word': merged.word,
-                    'sanskrit_word': merged.sanskrit_word,
-                    'language': merged.language,
-                    'confidence': merged.confidence,
-                    'source_url': merged.source_url,
-                    'meanings': merged.meanings,
-                    'usage_examples': merged.usage_examples,
-                    'context': merged.context
-                })
+            merged = self._reconcile_group(entries)
+            if merged:
+                reconciled.append(merged)
         
         return reconciled
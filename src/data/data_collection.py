@@ -1,13 +1,21 @@
 """Data collection module for Shabda Setu project."""
 
 import json
+import queue
+import time
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Iterator, Optional, Tuple
+from urllib.parse import urlparse
 
 from ..core.database import Database
 from ..core.word_reconciliation import WordReconciliation
 from .scrapers.base_scraper import BaseScraper
+from .scrapers.http_cache import ResponseCache
+from .scrapers.crawl_state import CrawlStateStore
 from .scrapers.wiktionary_scraper import WiktionaryScraper
 from .scrapers.sanskrit_dict_scraper import SanskritDictScraper
 from .scrapers.wikisource_scraper import WikisourceScraper
@@ -62,15 +70,46 @@ class DataCollector:
         }
     }
     
-    def __init__(self, db: Database, languages: List[str] = None, scrapers: List[str] = None):
+    # Expected script of each language's words
+    LANGUAGE_SCRIPTS = {
+        'tamil': Script.TAMIL,
+        'telugu': Script.TELUGU,
+        'kannada': Script.KANNADA,
+        'malayalam': Script.MALAYALAM,
+        'bengali': Script.BENGALI,
+        'hindi': Script.DEVANAGARI,
+        'punjabi': Script.GURMUKHI,
+        'gujarati': Script.GUJARATI,
+        'odia': Script.ODIA
+    }
+    
+    # Streaming pipeline limits
+    DEFAULT_BATCH_SIZE = 500  # Reconciled words written per DB transaction
+    DEFAULT_MAX_PENDING = 50000  # Raw entries buffered before a forced flush
+    
+    def __init__(self, db: Database, languages: List[str] = None, scrapers: List[str] = None,
+                 max_workers: int = 1, max_per_host: int = 1, host_limits: Dict[str, int] = None,
+                 response_cache: Optional[ResponseCache] = None,
+                 crawl_state: Optional[CrawlStateStore] = None, crawl_mode: str = 'full'):
         """Initialize the data collector.
         
         Args:
             db: Database instance to store collected words
             languages: List of languages to collect words for. If None, collects for all supported languages.
             scrapers: List of scrapers to use. If None, uses all available scrapers.
+            max_workers: Number of scrapers run concurrently. 1 runs them sequentially.
+            max_per_host: Default number of scrapers allowed to hit the same host at once
+            host_limits: Per-host overrides for max_per_host, keyed by hostname
+            response_cache: Optional on-disk HTTP cache shared by all scrapers
+            crawl_state: Optional checkpoint store enabling resumable / delta crawls
+            crawl_mode: 'full', 'resume' or 'delta' (only used with crawl_state)
         """
         self.db = db
+        self.max_workers = max(1, max_workers)
+        self.max_per_host = max(1, max_per_host)
+        self.host_limits = host_limits or {}
+        self.response_cache = response_cache
+        self.scraper_timings: List[Dict] = []
         self.languages = languages or list(WiktionaryScraper.SUPPORTED_LANGUAGES.keys())
         self.active_scrapers = scrapers or list(self.SCRAPERS.keys())
         
@@ -81,6 +120,11 @@ class DataCollector:
                 try:
                     scraper_info = self.SCRAPERS[scraper_id]
                     scraper = scraper_info['class'](lang)
+                    if response_cache:
+                        scraper.response_cache = response_cache
+                    if crawl_state:
+                        scraper.crawl_state = crawl_state
+                        scraper.crawl_mode = crawl_mode
                     self.scrapers.append((scraper, scraper_info['weight']))
                     logger.info(
                         f"Initialized {scraper_id} for {lang}: "
@@ -99,39 +143,67 @@ class DataCollector:
         Returns:
             Updated word information dictionary
         """
-        base_confidence = word_info['confidence']
-        
         # Validate scripts
-        script_map = {
-            'tamil': Script.TAMIL,
-            'telugu': Script.TELUGU,
-            'kannada': Script.KANNADA,
-            'malayalam': Script.MALAYALAM,
-            'bengali': Script.BENGALI,
-            'hindi': Script.DEVANAGARI,
-            'punjabi': Script.GURMUKHI,
-            'gujarati': Script.GUJARATI,
-            'odia': Script.ODIA
-        }
-        
         script_validation = 1.0
-        if word_info['language'] in script_map:
+        script = self.LANGUAGE_SCRIPTS.get(word_info['language'])
+        if script:
             # Check target language word
-            if not ScriptUtils.validate_script(
-                word_info['word'], 
-                script_map[word_info['language']], 
-                allow_diacritics=True
-            ):
+            if not ScriptUtils.validate_script(word_info['word'], script, allow_diacritics=True):
                 script_validation *= 0.8
             
             # Check Sanskrit word
-            if not ScriptUtils.validate_script(
-                word_info['sanskrit_word'],
-                Script.DEVANAGARI,
-                allow_diacritics=True
-            ):
+            if not ScriptUtils.validate_script(word_info['sanskrit_word'], Script.DEVANAGARI, allow_diacritics=True):
                 script_validation *= 0.8
         
+        return self._apply_confidence(word_info, scraper_weight, script_validation)
+    
+    def _adjust_confidence_batch(self, words: List[Dict], scraper_weight: float) -> List[Dict]:
+        """Adjust confidence scores of one scraper's entire output at once.
+        
+        Same result as _adjust_confidence on each word, but each language's
+        words and Sanskrit words are validated in a single batch.
+        
+        Args:
+            words: Word information dictionaries
+            scraper_weight: Weight of the scraper
+            
+        Returns:
+            Updated word information dictionaries
+        """
+        script_validation = [1.0] * len(words)
+        
+        # Group words by language so each script is validated in one pass
+        by_language = defaultdict(list)
+        for index, word_info in enumerate(words):
+            by_language[word_info['language']].append(index)
+        
+        for language, indices in by_language.items():
+            script = self.LANGUAGE_SCRIPTS.get(language)
+            if not script:
+                continue
+            
+            word_valid = ScriptUtils.validate_batch(
+                [words[i]['word'] for i in indices], script, allow_diacritics=True
+            )
+            sanskrit_valid = ScriptUtils.validate_batch(
+                [words[i]['sanskrit_word'] for i in indices], Script.DEVANAGARI, allow_diacritics=True
+            )
+            for i, is_word_valid, is_sanskrit_valid in zip(indices, word_valid, sanskrit_valid):
+                if not is_word_valid:
+                    script_validation[i] *= 0.8
+                if not is_sanskrit_valid:
+                    script_validation[i] *= 0.8
+        
+        return [
+            self._apply_confidence(word_info, scraper_weight, validation)
+            for word_info, validation in zip(words, script_validation)
+        ]
+    
+    def _apply_confidence(self, word_info: Dict[str, str], scraper_weight: float,
+                          script_validation: float) -> Dict[str, str]:
+        """Combine scraper weight, script validation and context into the confidence score."""
+        base_confidence = word_info['confidence']
+        
         # Additional context-based adjustments
         if 'context' in word_info:
             # Higher confidence for words from classical texts
@@ -142,76 +214,236 @@ class DataCollector:
         word_info['confidence'] = min(1.0, base_confidence * scraper_weight * script_validation)
         return word_info
         
-    def collect_and_store(self, cache_dir: str = None):
+    def _run_scraper(self, scraper: BaseScraper, weight: float,
+                     cache_path: Optional[Path]) -> List[Dict]:
+        """Run a single scraper and return its confidence-adjusted words.
+        
+        Args:
+            scraper: Scraper to run
+            weight: Weight of the scraper
+            cache_path: Optional directory to cache scraped data
+            
+        Returns:
+            List of word dictionaries (empty if the scraper failed)
+        """
+        start = time.perf_counter()
+        words = []
+        error = None
+        try:
+            logger.info(f"Starting scraping {scraper.language} with {scraper.__class__.__name__}")
+            words = scraper.scrape_words()
+            logger.debug(f"Scraped {len(words)} words from {scraper.language} using {scraper.__class__.__name__}")
+            
+            # Adjust confidence scores
+            words = self._adjust_confidence_batch(words, weight)
+            logger.debug(f"Adjusted confidence for {len(words)} words from {scraper.language}")
+            
+            # Cache results if directory specified
+            if cache_path:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                cache_file = cache_path / f"{scraper.__class__.__name__}_{scraper.language}_{timestamp}.json"
+                with open(cache_file, 'w', encoding='utf-8') as f:
+                    json.dump(words, f, ensure_ascii=False, indent=2)
+                logger.debug(f"Cached {len(words)} words to {cache_file}")
+            
+            logger.info(
+                f"Collected {len(words)} words from {scraper.language} using "
+                f"{scraper.__class__.__name__} (confidence: {weight:.2f})"
+            )
+            return words
+            
+        except Exception as e:
+            logger.error(f"Error in {scraper.__class__.__name__} for {scraper.language}: {e}")
+            error = str(e)
+            words = []
+            return words
+        finally:
+            scraper.cleanup()
+            self.scraper_timings.append({
+                'scraper': scraper.__class__.__name__,
+                'language': scraper.language,
+                'host': self._get_host(scraper),
+                'seconds': time.perf_counter() - start,
+                'words': len(words),
+                'error': error
+            })
+    
+    @staticmethod
+    def _get_host(scraper: BaseScraper) -> str:
+        """Get the hostname a scraper talks to."""
+        base_url = getattr(scraper, 'base_url', '')
+        return urlparse(base_url).netloc if isinstance(base_url, str) else ''
+    
+    def _scrape_batches(self, cache_path: Optional[Path]) -> Iterator[Tuple[BaseScraper, List[Dict]]]:
+        """Yield each scraper together with its confidence-adjusted words."""
+        if self.max_workers > 1:
+            yield from self._scrape_concurrently(cache_path)
+            return
+        
+        for scraper, weight in self.scrapers:
+            yield scraper, self._run_scraper(scraper, weight, cache_path)
+    
+    def _scrape_concurrently(self, cache_path: Optional[Path]) -> Iterator[Tuple[BaseScraper, List[Dict]]]:
+        """Run scrapers on a thread pool and yield results as they finish.
+        
+        Scrapers are grouped by host. Each host gets at most its configured
+        number of worker "lanes", and every lane runs that host's scrapers one
+        after another, so a host never sees more concurrent scrapers than
+        allowed while unrelated hosts proceed in parallel.
+        """
+        by_host = defaultdict(deque)
+        for scraper, weight in self.scrapers:
+            by_host[self._get_host(scraper)].append((scraper, weight))
+        
+        # Interleave lanes across hosts so no host waits behind another's extra lanes
+        lanes = []
+        for lane_index in range(max(len(pending) for pending in by_host.values()) if by_host else 0):
+            for host, pending in by_host.items():
+                if lane_index < min(self.host_limits.get(host, self.max_per_host), len(pending)):
+                    lanes.append(host)
+        
+        results = queue.Queue()
+        done = object()
+        
+        def run_lane(host: str):
+            try:
+                while True:
+                    try:
+                        scraper, weight = by_host[host].popleft()
+                    except IndexError:
+                        return
+                    results.put((scraper, self._run_scraper(scraper, weight, cache_path)))
+            finally:
+                results.put(done)
+        
+        logger.info(
+            f"Running {len(self.scrapers)} scrapers across {len(by_host)} hosts "
+            f"with {min(self.max_workers, len(lanes))} workers"
+        )
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='scraper') as executor:
+            for host in lanes:
+                executor.submit(run_lane, host)
+            
+            finished_lanes = 0
+            while finished_lanes < len(lanes):
+                result = results.get()
+                if result is done:
+                    finished_lanes += 1
+                else:
+                    yield result
+    
+    def _log_collection_summary(self, wall_time: float) -> None:
+        """Log per-scraper timings for the last collection run."""
+        logger.info("=== Collection Summary ===")
+        for timing in sorted(self.scraper_timings, key=lambda t: t['seconds'], reverse=True):
+            status = f"failed: {timing['error']}" if timing['error'] else f"{timing['words']} words"
+            logger.info(
+                f"{timing['scraper']} ({timing['language']}, {timing['host'] or 'unknown host'}): "
+                f"{status} in {timing['seconds']:.2f}s"
+            )
+        scraper_time = sum(t['seconds'] for t in self.scraper_timings)
+        logger.info(
+            f"Total: {len(self.scraper_timings)} scrapers, {scraper_time:.2f}s of scraping "
+            f"in {wall_time:.2f}s wall time"
+        )
+        if self.response_cache:
+            self.response_cache.log_stats()
+    
+    def _reconciled_stream(self, reconciliation: WordReconciliation, cache_path: Optional[Path],
+                           max_pending: int, counts: Counter) -> Iterator[Dict]:
+        """Yield reconciled words as soon as they are final.
+        
+        A language's entries are reconciled once every scraper for that
+        language has finished. If more than ``max_pending`` raw entries are
+        buffered, everything pending is flushed early; later entries for an
+        already flushed word are then merged by the database upsert instead.
+        
+        Args:
+            reconciliation: Reconciliation state
+            cache_path: Optional directory to cache scraped data
+            max_pending: Maximum number of raw entries held in memory
+            counts: Counter updated with raw and reconciled totals
+            
+        Returns:
+            Iterator over reconciled word dictionaries
+        """
+        remaining = Counter(scraper.language for scraper, _ in self.scrapers)
+        
+        for scraper, words in self._scrape_batches(cache_path):
+            counts['raw'] += len(words)
+            for word in words:
+                reconciliation.add(word)
+                if reconciliation.pending_count >= max_pending:
+                    logger.warning(
+                        f"Reconciliation buffer reached {max_pending} entries, flushing early"
+                    )
+                    for merged in reconciliation.flush():
+                        counts['reconciled'] += 1
+                        yield merged
+            
+            remaining[scraper.language] -= 1
+            if remaining[scraper.language] == 0:
+                for merged in reconciliation.flush(scraper.language):
+                    counts['reconciled'] += 1
+                    yield merged
+        
+        for merged in reconciliation.flush():
+            counts['reconciled'] += 1
+            yield merged
+    
+    def collect_and_store(self, cache_dir: str = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                          max_pending: int = DEFAULT_MAX_PENDING):
         """Collect words from all sources and store them in the database.
         
+        Words flow through a generator pipeline (scrape, adjust confidence,
+        reconcile, write) so only one scraper's output and the unreconciled
+        entries are held in memory, and each batch is committed as soon as
+        it is ready.
+        
         Args:
             cache_dir: Optional directory to cache scraped data
+            batch_size: Number of reconciled words written per transaction
+            max_pending: Maximum number of raw entries buffered for reconciliation
         """
-        all_words = []
+        cache_path = None
         
         # Create cache directory if specified
         if cache_dir:
             cache_path = Path(cache_dir)
             cache_path.mkdir(parents=True, exist_ok=True)
         
-        # Collect words from each scraper
-        for scraper, weight in self.scrapers:
-            try:
-                logger.info(f"Starting scraping {scraper.language} with {scraper.__class__.__name__}")
-                words = scraper.scrape_words()
-                logger.debug(f"Scraped {len(words)} words from {scraper.language} using {scraper.__class__.__name__}")
-                
-                # Adjust confidence scores
-                words = [self._adjust_confidence(word, weight) for word in words]
-                logger.debug(f"Adjusted confidence for {len(words)} words from {scraper.language}")
-                
-                # Cache results if directory specified
-                if cache_dir:
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    cache_file = cache_path / f"{scraper.__class__.__name__}_{scraper.language}_{timestamp}.json"
-                    with open(cache_file, 'w', encoding='utf-8') as f:
-                        json.dump(words, f, ensure_ascii=False, indent=2)
-                    logger.debug(f"Cached {len(words)} words to {cache_file}")
-                
-                all_words.extend(words)
-                logger.info(
-                    f"Collected {len(words)} words from {scraper.language} using "
-                    f"{scraper.__class__.__name__} (confidence: {weight:.2f})"
-                )
-                
-            except Exception as e:
-                logger.error(f"Error in {scraper.__class__.__name__} for {scraper.language}: {e}")
-            finally:
-                scraper.cleanup()
-        
-        # Reconcile conflicting information
+        start = time.perf_counter()
+        self.scraper_timings = []
+        counts = Counter()
         reconciliation = WordReconciliation()
-        reconciled_words = reconciliation.reconcile(all_words)
-        logger.info(
-            f"Reconciled {len(all_words)} raw entries into {len(reconciled_words)} "
-            "unique word pairs"
-        )
+        stream = self._reconciled_stream(reconciliation, cache_path, max_pending, counts)
         
-        # Store reconciled words in database
+        # Store reconciled words in database, one transaction per chunk. A
+        # failed chunk is skipped: earlier chunks stay committed and counted,
+        # and the remaining scrapers still run
         stored_count = 0
-        for word_info in reconciled_words:
+        failed_count = 0
+        while True:
+            try:
+                chunk = list(islice(stream, batch_size))
+            except Exception as e:
+                logger.error(f"Error collecting reconciled words, stopping early: {e}")
+                break
+            if not chunk:
+                break
             try:
-                logger.debug(f"Storing word: {word_info}")
-                self.db.add_word(
-                    word=word_info['word'],
-                    sanskrit_word=word_info['sanskrit_word'],
-                    language=word_info['language'],
-                    confidence=word_info['confidence'],
-                    source_url=word_info['source_url'],
-                    meanings=word_info.get('meanings'),
-                    usage_examples=word_info.get('usage_examples'),
-                    context=word_info.get('context')
-                )
-                stored_count += 1
+                stored_count += len(self.db.add_words_bulk(chunk, chunk_size=batch_size))
             except Exception as e:
-                logger.error(f"Error storing word {word_info}: {e}")
+                failed_count += len(chunk)
+                logger.error(f"Error storing a chunk of {len(chunk)} reconciled words: {e}")
         
+        logger.info(
+            f"Reconciled {counts['raw']} raw entries into {counts['reconciled']} "
+            "unique word pairs"
+        )
         logger.info(
             f"Successfully stored {stored_count} reconciled entries in the database"
-        )
\ No newline at end of file
+        )
+        if failed_count:
+            logger.warning(f"Failed to store {failed_count} reconciled entries")
+        self._log_collection_summary(time.perf_counter() - start)
\ No newline at end of file
@@ -1,12 +1,34 @@
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 import json
 import logging
+import os
+import sys
+import threading
+import time
 from pathlib import Path
 import sqlite3
 from dataclasses import dataclass
+from src.utils.script_utils import Script
+from src.utils.transliteration import BRAHMIC_SCRIPTS, CONSONANTS, VOWELS, transliterate
 
 logger = logging.getLogger(__name__)
 
+# Scripts that Latin/IAST lookups are transliterated into, by script_type
+TRANSLITERATION_TARGETS = {script.value: script for script in BRAHMIC_SCRIPTS}
+
+# Letters IAST words are spelled with (vowels, consonants, anusvara, visarga)
+IAST_LETTERS = frozenset(''.join(VOWELS) + ''.join(CONSONANTS) + 'ṃṁḥ')
+
+# Dictionary source reliability weights
+SOURCE_WEIGHTS = {
+    'monier_williams': 1.0,
+    'cologne': 0.95,
+    'apte': 0.9,
+    'shabdanjali': 0.85,
+    'indowordnet': 0.8
+}
+DEFAULT_SOURCE_WEIGHT = 0.5
+
 @dataclass
 class DictionaryEntry:
     word: str
@@ -15,8 +37,140 @@ class DictionaryEntry:
     source: str  # Which dictionary this came from
     confidence: float = 1.0  # Dictionary entries have high confidence by default
 
+class LexiconIndex:
+    """
+    Read-only in-memory index of the dictionary database.
+    
+    Holds the best-source entry for every (word, script) so a lookup is a
+    single dict access. The index is rebuilt when the database file changes.
+    """
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._entries: Dict[Tuple[str, str], DictionaryEntry] = {}
+        self._signature = None
+        self._lock = threading.Lock()
+        self.load_time = 0.0
+        self.loaded_at = None
+    
+    def _file_signature(self) -> Tuple:
+        """Modification time and size of the database and its WAL file."""
+        signature = []
+        for path in (self.db_path, f"{self.db_path}-wal"):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+    
+    def load(self):
+        """Load every entry, keeping only the most reliable source per (word, script)."""
+        start = time.perf_counter()
+        signature = self._file_signature()
+        
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute("""
+                SELECT word, sanskrit_root, meaning, source, script
+                FROM dictionary_entries
+            """)
+            entries = {}
+            weights = {}
+            for word, sanskrit_root, meaning, source, script in rows:
+                key = (word, script)
+                weight = SOURCE_WEIGHTS.get(source, DEFAULT_SOURCE_WEIGHT)
+                if key not in entries or weight > weights[key]:
+                    entries[key] = DictionaryEntry(
+                        word=word,
+                        sanskrit_root=sanskrit_root,
+                        meaning=meaning,
+                        source=source
+                    )
+                    weights[key] = weight
+        finally:
+            conn.close()
+        
+        # Swap in the new index in one step so readers never see a partial load
+        with self._lock:
+            self._entries = entries
+            self._signature = signature
+        
+        self.load_time = time.perf_counter() - start
+        self.loaded_at = time.time()
+        logger.info(
+            f"Loaded lexicon index: {len(entries)} entries in {self.load_time * 1000:.1f} ms "
+            f"(~{self.memory_footprint() / (1024 * 1024):.1f} MiB)"
+        )
+    
+    def refresh_if_changed(self) -> bool:
+        """Reload the index if the database file changed since the last load."""
+        if self._file_signature() == self._signature:
+            return False
+        self.load()
+        return True
+    
+    def get(self, word: str, script_type: str) -> Optional[DictionaryEntry]:
+        """Get the best entry for a word, or None."""
+        return self._entries.get((word, script_type))
+    
+    def put(self, entry: DictionaryEntry, script_type: str, previous_signature: Optional[Tuple] = None):
+        """
+        Apply a write made through this process without a full reload.
+        
+        Args:
+            entry: The entry that was written
+            script_type: Script of the entry
+            previous_signature: File signature taken just before the write.
+                If the index was up to date then, the new signature is
+                recorded so the write does not trigger a reload; changes by
+                other writers made before it are still picked up.
+        """
+        key = (entry.word, script_type)
+        with self._lock:
+            if previous_signature is not None and previous_signature == self._signature:
+                self._signature = self._file_signature()
+            current = self._entries.get(key)
+            if (current is None or current.source == entry.source or
+                    SOURCE_WEIGHTS.get(entry.source, DEFAULT_SOURCE_WEIGHT) >
+                    SOURCE_WEIGHTS.get(current.source, DEFAULT_SOURCE_WEIGHT)):
+                # Updated in place: a single dict assignment is atomic for
+                # readers, and copying the index would make bulk writes O(N^2)
+                self._entries[key] = entry
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def memory_footprint(self) -> int:
+        """Approximate size of the index in bytes (dict, keys, entries and their strings)."""
+        # Snapshot the items, as put() may add entries while we iterate
+        with self._lock:
+            size = sys.getsizeof(self._entries)
+            items = list(self._entries.items())
+        for key, entry in items:
+            size += sys.getsizeof(key) + sum(sys.getsizeof(part) for part in key)
+            size += sys.getsizeof(entry) + sys.getsizeof(entry.__dict__)
+            size += sum(
+                sys.getsizeof(value) for value in
+                (entry.sanskrit_root, entry.meaning, entry.source)
+            )
+        return size
+    
+    def get_statistics(self) -> Dict[str, float]:
+        """Size, memory footprint and load time of the index."""
+        return {
+            'entries': len(self._entries),
+            'memory_bytes': self.memory_footprint(),
+            'load_time_ms': self.load_time * 1000,
+            'loaded_at': self.loaded_at
+        }
+
 class DictionaryHandler:
-    def __init__(self, db_path: str = "data/dictionaries/sanskrit_dict.db"):
+    # Words per query in lookup_words
+    LOOKUP_BATCH_SIZE = 500
+    
+    def __init__(self, db_path: str = "data/dictionaries/sanskrit_dict.db",
+                 preload: bool = False, refresh_interval: float = 30.0):
         """
         Initialize dictionary handler with SQLite database containing merged dictionary data.
         
@@ -26,9 +180,26 @@ class DictionaryHandler:
         - Cologne Digital Sanskrit Dictionary
         - Shabdanjali Sanskrit-Hindi Dictionary
         - IndoWordNet
+        
+        Args:
+            db_path: Path to the dictionary database
+            preload: Load the whole dictionary into an in-memory index so
+                lookups don't touch SQLite
+            refresh_interval: Seconds between checks for a changed database
+                file when preloaded
         """
         self.db_path = db_path
         self._init_db()
+        
+        self._write_listeners: List[Callable[[str, str], None]] = []
+        self._reload_listeners: List[Callable[[], None]] = []
+        self.refresh_interval = refresh_interval
+        self._index = None
+        self._last_refresh_check = 0.0
+        if preload:
+            self._index = LexiconIndex(db_path)
+            self._index.load()
+            self._last_refresh_check = time.monotonic()
     
     def _init_db(self):
         """Initialize SQLite database if it doesn't exist."""
@@ -64,6 +235,11 @@ class DictionaryHandler:
         Look up a word in the merged dictionary database.
         Returns the most reliable entry if found in multiple dictionaries.
         """
+        key = self.normalize_word(word, script_type)
+        if self._index is not None:
+            self._maybe_refresh_index()
+            return self._index.get(key, script_type)
+        
         try:
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
@@ -73,7 +249,7 @@ class DictionaryHandler:
                 SELECT word, sanskrit_root, meaning, source 
                 FROM dictionary_entries 
                 WHERE word = ? AND script = ?
-            """, (word.lower(), script_type))
+            """, (key, script_type))
             
             entries = cursor.fetchall()
             conn.close()
@@ -81,17 +257,8 @@ class DictionaryHandler:
             if not entries:
                 return None
             
-            # Dictionary source reliability weights
-            source_weights = {
-                'monier_williams': 1.0,
-                'cologne': 0.95,
-                'apte': 0.9,
-                'shabdanjali': 0.85,
-                'indowordnet': 0.8
-            }
-            
             # Get the entry from the most reliable source
-            best_entry = max(entries, key=lambda x: source_weights.get(x[3], 0.5))
+            best_entry = max(entries, key=lambda x: SOURCE_WEIGHTS.get(x[3], DEFAULT_SOURCE_WEIGHT))
             
             return DictionaryEntry(
                 word=best_entry[0],
@@ -104,9 +271,88 @@ class DictionaryHandler:
             logger.error(f"Error looking up word in dictionary: {e}")
             return None
     
+    @staticmethod
+    def normalize_word(word: str, script_type: str) -> str:
+        """
+        Normalize a word into its dictionary key for a script.
+        Words typed in IAST (e.g. 'kṛṣṇa' in a Hindi tweet) are transliterated
+        into the script being looked up. Only words with IAST diacritics are:
+        plain ASCII words in mixed-language tweets are mostly English ('the',
+        'me'), and a word with other letters or punctuation would come out
+        in two scripts.
+        """
+        key = word.lower()
+        script = TRANSLITERATION_TARGETS.get(script_type)
+        if script and not key.isascii() and IAST_LETTERS.issuperset(key):
+            return transliterate(key, Script.IAST, script)
+        return key
+    
+    def lookup_words(self, words: Iterable[str], script_type: str) -> Dict[str, DictionaryEntry]:
+        """
+        Look up many words (e.g. all tokens of a tweet) in one query.
+        Returns the most reliable entry for every word found, keyed by the word as given.
+        """
+        # Query each distinct normalized word once
+        normalized = {}
+        for word in words:
+            normalized.setdefault(self.normalize_word(word, script_type), []).append(word)
+        if not normalized:
+            return {}
+        
+        if self._index is not None:
+            self._maybe_refresh_index()
+            best = {}
+            for key in normalized:
+                entry = self._index.get(key, script_type)
+                if entry:
+                    best[key] = entry
+        else:
+            try:
+                best = self._query_best_entries(list(normalized), script_type)
+            except Exception as e:
+                logger.error(f"Error looking up words in dictionary: {e}")
+                return {}
+        
+        return {
+            word: entry
+            for key, entry in best.items()
+            for word in normalized[key]
+        }
+    
+    def _query_best_entries(self, words: List[str], script_type: str) -> Dict[str, DictionaryEntry]:
+        """Fetch the best-source entry for each (already lowercased) word."""
+        best = {}
+        weights = {}
+        conn = sqlite3.connect(self.db_path)
+        try:
+            # Stay below SQLite's bound parameter limit
+            for start in range(0, len(words), self.LOOKUP_BATCH_SIZE):
+                chunk = words[start:start + self.LOOKUP_BATCH_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(f"""
+                    SELECT word, sanskrit_root, meaning, source
+                    FROM dictionary_entries
+                    WHERE script = ? AND word IN ({placeholders})
+                """, (script_type, *chunk))
+                
+                for word, sanskrit_root, meaning, source in rows:
+                    weight = SOURCE_WEIGHTS.get(source, DEFAULT_SOURCE_WEIGHT)
+                    if word not in best or weight > weights[word]:
+                        best[word] = DictionaryEntry(
+                            word=word,
+                            sanskrit_root=sanskrit_root,
+                            meaning=meaning,
+                            source=source
+                        )
+                        weights[word] = weight
+        finally:
+            conn.close()
+        return best
+    
     def add_entry(self, entry: DictionaryEntry, script_type: str):
         """Add a new entry to the dictionary database."""
         try:
+            signature = self._index._file_signature() if self._index is not None else None
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             
@@ -125,10 +371,55 @@ class DictionaryHandler:
             conn.commit()
             conn.close()
             
+            if self._index is not None:
+                self._index.put(
+                    DictionaryEntry(
+                        word=entry.word.lower(),
+                        sanskrit_root=entry.sanskrit_root,
+                        meaning=entry.meaning,
+                        source=entry.source
+                    ),
+                    script_type,
+                    previous_signature=signature
+                )
+            
+            for listener in self._write_listeners:
+                listener(entry.word.lower(), script_type)
+            
         except Exception as e:
             logger.error(f"Error adding dictionary entry: {e}")
             raise
     
+    def add_write_listener(self, listener: Callable[[str, str], None]):
+        """Register a callback(word, script_type) run after add_entry writes, e.g. to invalidate caches."""
+        self._write_listeners.append(listener)
+    
+    def add_reload_listener(self, listener: Callable[[], None]):
+        """Register a callback run after the index reloads because another writer changed the database."""
+        self._reload_listeners.append(listener)
+    
+    def _maybe_refresh_index(self):
+        """Reload the in-memory index if the database changed (checked at most every refresh_interval)."""
+        now = time.monotonic()
+        if now - self._last_refresh_check < self.refresh_interval:
+            return
+        self._last_refresh_check = now
+        try:
+            reloaded = self._index.refresh_if_changed()
+        except Exception as e:
+            # Keep serving the previous index
+            logger.error(f"Error refreshing lexicon index: {e}")
+            return
+        if reloaded:
+            for listener in self._reload_listeners:
+                listener()
+    
+    def get_index_statistics(self) -> Optional[Dict[str, float]]:
+        """Memory footprint and load time of the in-memory index, if preloaded."""
+        if self._index is None:
+            return None
+        return self._index.get_statistics()
+    
     def get_statistics(self) -> Dict[str, int]:
         """Get statistics about the dictionary database."""
         try:
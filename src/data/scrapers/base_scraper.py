@@ -3,11 +3,19 @@ logger = setup_logging("base")
 class for Shabda Setu project."""
 
 import abc
+import asyncio
+import hashlib
 import time
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, List, Dict, Optional
+from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from .html_parsing import parse_html, resolve_parser
+from .rate_limiter import host_rate_limiter
+from .http_cache import CachedResponse, ResponseCache
+from .crawl_state import CrawlStateStore
 from config.logging_config import setup_logging
 from config.logging_config import setup_logging
 
@@ -16,17 +24,38 @@ logger = setup_logging('scraper')
 class BaseScraper(abc.ABC):
     """Abstract base class for all scrapers."""
     
+    # Maximum number of requests in flight for get_pages()
+    MAX_CONCURRENT_REQUESTS = 4
+    
+    # Seconds a cached response is served without revalidation (None always revalidates)
+    CACHE_TTL: Optional[float] = 24 * 60 * 60
+    
+    # HTML parsing backend (None picks the fastest installed one, see html_parsing)
+    HTML_PARSER: Optional[str] = None
+    
     def __init__(self, base_url: str, delay: float = 1.0):
         """Initialize the scraper.
         
         Args:
             base_url: The base URL of the website to scrape
-            delay: Minimum delay between requests in seconds
+            delay: Minimum delay between requests to the same host in seconds
         """
         self.base_url = base_url.rstrip('/')
         self.delay = delay
         self.last_request_time = 0
         self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=self.MAX_CONCURRENT_REQUESTS)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.html_parser = resolve_parser(self.HTML_PARSER)
+        self._executor = None
+        self.response_cache: Optional[ResponseCache] = None
+        
+        # Crawl checkpointing (see begin_crawl)
+        self.crawl_state: Optional[CrawlStateStore] = None
+        self.crawl_mode = 'full'
+        self._active_crawl_mode = None
+        self._content_hashes: Dict[str, str] = {}
         self.session.headers.update({
             'User-Agent': 'ShabdaSetu/1.0 (Sanskrit-Tamil Loanword Research Project)'
         })
@@ -48,35 +77,241 @@ class BaseScraper(abc.ABC):
             return True
         return self.robots_parser.can_fetch("ShabdaSetu", url)
 
-    def _respect_rate_limit(self):
-        """Ensure we respect the rate limit between requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.delay:
-            time.sleep(self.delay - elapsed)
+    def _rate_limit_bucket(self, url: str):
+        """Get the process-wide token bucket for the URL's host."""
+        if self.delay <= 0:
+            return None
+        host = urlparse(url).netloc or urlparse(self.base_url).netloc
+        return host_rate_limiter.get_bucket(host, 1.0 / self.delay)
+
+    def _respect_rate_limit(self, url: Optional[str] = None):
+        """Ensure we respect the host's rate limit before a request.
+        
+        The limit is shared by every scraper talking to the same host.
+        """
+        bucket = self._rate_limit_bucket(url or self.base_url)
+        if bucket:
+            bucket.acquire()
         self.last_request_time = time.time()
 
-    def get_page(self, url: str) -> Optional[BeautifulSoup]:
+    def _fetch(self, url: str, cached: Optional[CachedResponse] = None) -> Optional[str]:
+        """Fetch a URL and return the response body (no rate limiting).
+        
+        If a stale cached copy is given, the request is made conditional and
+        a 304 response returns the cached body.
+        """
+        try:
+            if cached:
+                response = self.session.get(url, headers=cached.conditional_headers())
+                if response.status_code == 304:
+                    self.response_cache.touch(url)
+                    self.response_cache.record('revalidated', len(cached.body.encode('utf-8')))
+                    return cached.body
+            else:
+                response = self.session.get(url)
+            response.raise_for_status()
+            
+            if self.response_cache:
+                self.response_cache.store(
+                    url,
+                    response.text,
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified')
+                )
+                self.response_cache.record('miss')
+            return response.text
+        except Exception as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return None
+
+    def _cached_response(self, url: str) -> Optional[CachedResponse]:
+        """Look up the URL in the response cache, if one is configured."""
+        if not self.response_cache:
+            return None
+        return self.response_cache.get(url)
+
+    def _fresh_body(self, cached: Optional[CachedResponse]) -> Optional[str]:
+        """Return the cached body if it is within CACHE_TTL, counting the hit."""
+        if cached and cached.is_fresh(self.CACHE_TTL):
+            self.response_cache.record('hit', len(cached.body.encode('utf-8')))
+            return cached.body
+        return None
+
+    def parse(self, markup: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse HTML with the scraper's parsing backend.
+        
+        Args:
+            markup: HTML text
+            parse_only: Optional strainer so only the needed elements are built
+            
+        Returns:
+            BeautifulSoup object
+        """
+        return parse_html(markup, self.html_parser, parse_only)
+
+    def get_page(self, url: str, params: Optional[Dict] = None,
+                 parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
         """Fetch a page and return its BeautifulSoup object.
         
         Args:
             url: The URL to fetch
+            params: Optional query string parameters
+            parse_only: Optional strainer for a targeted parse (see parse)
             
         Returns:
             BeautifulSoup object or None if fetch failed
         """
+        if params:
+            url = requests.Request('GET', url, params=params).prepare().url
+        
         if not self._can_fetch(url):
             logger.warning(f"Robots.txt disallows fetching {url}")
             return None
 
-        self._respect_rate_limit()
+        cached = self._cached_response(url)
+        text = self._fresh_body(cached)
+        if text is None:
+            self._respect_rate_limit(url)
+            text = self._fetch(url, cached)
         
-        try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
-        except Exception as e:
-            logger.error(f"Error fetching {url}: {e}")
+        if text is None:
             return None
+        self._remember_content(url, text)
+        return self.parse(text, parse_only)
+
+    async def get_page_async(self, url: str,
+                             parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """Asynchronously fetch a page and return its BeautifulSoup object.
+        
+        Waits on the host's shared token bucket without blocking the event
+        loop, then performs the request on a worker thread using the
+        scraper's pooled session.
+        
+        Args:
+            url: The URL to fetch
+            parse_only: Optional strainer for a targeted parse (see parse)
+            
+        Returns:
+            BeautifulSoup object or None if fetch failed
+        """
+        if not self._can_fetch(url):
+            logger.warning(f"Robots.txt disallows fetching {url}")
+            return None
+
+        cached = self._cached_response(url)
+        text = self._fresh_body(cached)
+        if text is None:
+            bucket = self._rate_limit_bucket(url)
+            if bucket:
+                await bucket.acquire_async()
+            self.last_request_time = time.time()
+            
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.MAX_CONCURRENT_REQUESTS,
+                    thread_name_prefix=self.__class__.__name__
+                )
+            loop = asyncio.get_running_loop()
+            text = await loop.run_in_executor(self._executor, self._fetch, url, cached)
+        
+        if text is None:
+            return None
+        self._remember_content(url, text)
+        return self.parse(text, parse_only)
+
+    async def get_pages_async(self, urls: List[str], max_concurrency: Optional[int] = None,
+                              parse_only: Optional[SoupStrainer] = None) -> List[Optional[BeautifulSoup]]:
+        """Fetch many pages concurrently while staying within each host's rate.
+        
+        Args:
+            urls: URLs to fetch
+            max_concurrency: Maximum requests in flight (defaults to MAX_CONCURRENT_REQUESTS)
+            parse_only: Optional strainer for a targeted parse (see parse)
+            
+        Returns:
+            BeautifulSoup objects (or None for failures) in the same order as urls
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.MAX_CONCURRENT_REQUESTS)
+        
+        async def fetch(url):
+            async with semaphore:
+                return await self.get_page_async(url, parse_only)
+        
+        return await asyncio.gather(*(fetch(url) for url in urls))
+
+    def get_pages(self, urls: List[str], max_concurrency: Optional[int] = None,
+                  parse_only: Optional[SoupStrainer] = None) -> List[Optional[BeautifulSoup]]:
+        """Blocking wrapper around get_pages_async() for synchronous scrapers."""
+        if not urls:
+            return []
+        return asyncio.run(self.get_pages_async(urls, max_concurrency, parse_only))
+
+    @property
+    def crawl_key(self) -> str:
+        """Key identifying this scraper's crawl in the state store."""
+        return f"{self.__class__.__name__}:{getattr(self, 'language', '')}"
+
+    def begin_crawl(self) -> List[Dict[str, str]]:
+        """Start a crawl in the configured crawl_mode.
+        
+        Returns:
+            Results already collected by the interrupted crawl when resuming,
+            otherwise an empty list
+        """
+        if not self.crawl_state:
+            return []
+        self._active_crawl_mode = self.crawl_state.begin(self.crawl_key, self.crawl_mode)
+        if self._active_crawl_mode == 'resume':
+            results = self.crawl_state.results(self.crawl_key)
+            logger.info(f"Resuming {self.crawl_key} with {len(results)} previously scraped words")
+            return results
+        return []
+
+    def finish_crawl(self):
+        """Mark the crawl as successfully completed."""
+        if self.crawl_state:
+            self.crawl_state.finish(self.crawl_key)
+        self._active_crawl_mode = None
+        self._content_hashes.clear()
+
+    def load_checkpoint(self, name: str, default: Any = None) -> Any:
+        """Load a saved cursor (e.g. pagination URL or finished letters)."""
+        if not self.crawl_state or self._active_crawl_mode != 'resume':
+            return default
+        return self.crawl_state.get_cursor(self.crawl_key, name, default)
+
+    def save_checkpoint(self, name: str, value: Any):
+        """Save a cursor so an interrupted crawl can pick up from here."""
+        if self.crawl_state:
+            self.crawl_state.set_cursor(self.crawl_key, name, value)
+
+    def already_visited(self, url: str) -> bool:
+        """Check whether a resumed crawl already processed this page."""
+        if not self.crawl_state or self._active_crawl_mode != 'resume':
+            return False
+        return self.crawl_state.get_visit(self.crawl_key, url) is not None
+
+    def is_unchanged(self, url: str) -> bool:
+        """Check whether a fetched page is identical to the last crawl's copy (delta mode)."""
+        if not self.crawl_state or self._active_crawl_mode != 'delta':
+            return False
+        visit = self.crawl_state.get_visit(self.crawl_key, url)
+        content_hash = self._content_hashes.get(url)
+        if visit is not None and content_hash is not None and visit[0] == content_hash:
+            self._content_hashes.pop(url, None)
+            return True
+        return False
+
+    def record_page(self, url: str, result: Optional[Dict[str, str]] = None):
+        """Record that a page was processed along with the word it produced."""
+        content_hash = self._content_hashes.pop(url, None)
+        if self.crawl_state:
+            self.crawl_state.record_visit(self.crawl_key, url, content_hash, result)
+
+    def _remember_content(self, url: str, text: str):
+        """Keep a hash of the page body for change detection."""
+        if self.crawl_state:
+            self._content_hashes[url] = hashlib.sha1(text.encode('utf-8')).hexdigest()
 
     @abc.abstractmethod
     def scrape_words(self) -> List[Dict[str, str]]:
@@ -98,4 +333,7 @@ class BaseScraper(abc.ABC):
 
     def cleanup(self):
         """Clean up resources."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
         self.session.close()
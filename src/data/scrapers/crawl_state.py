@@ -0,0 +1,168 @@
+"""Persistent crawl checkpoints for resumable and incremental scraping."""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from config.logging_config import setup_logging
+
+logger = setup_logging("crawl_state")
+
+# Supported crawl modes:
+# - full: start from scratch and forget previous progress
+# - resume: continue an interrupted crawl, skipping pages already processed
+# - delta: walk everything again but only process pages that are new or changed
+CRAWL_MODES = ('full', 'resume', 'delta')
+
+class CrawlStateStore:
+    """SQLite store for crawl cursors, visited pages and run status.
+
+    State is kept per crawl key (usually scraper class and language), so
+    many scrapers can share one store.
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """Open (or create) the state database.
+
+        Args:
+            db_path: Path to the SQLite state file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode = WAL')
+        self._conn.execute('PRAGMA synchronous = NORMAL')
+        self._conn.executescript('''
+            CREATE TABLE IF NOT EXISTS crawl_runs (
+                crawl_key TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                started_at REAL NOT NULL,
+                finished_at REAL
+            );
+            CREATE TABLE IF NOT EXISTS crawl_cursors (
+                crawl_key TEXT NOT NULL,
+                name TEXT NOT NULL,
+                value TEXT NOT NULL,
+                PRIMARY KEY (crawl_key, name)
+            );
+            CREATE TABLE IF NOT EXISTS visited_pages (
+                crawl_key TEXT NOT NULL,
+                url TEXT NOT NULL,
+                content_hash TEXT,
+                result TEXT,
+                visited_at REAL NOT NULL,
+                PRIMARY KEY (crawl_key, url)
+            );
+        ''')
+        self._conn.commit()
+
+    def begin(self, crawl_key: str, mode: str) -> str:
+        """Start a crawl and prepare its state for the requested mode.
+
+        Args:
+            crawl_key: Identifier of the crawl
+            mode: One of CRAWL_MODES
+
+        Returns:
+            The effective mode. 'resume' falls back to 'full' when the last
+            crawl finished (or never ran), since there is nothing to resume.
+        """
+        if mode not in CRAWL_MODES:
+            raise ValueError(f"Unknown crawl mode '{mode}'. Supported modes: {CRAWL_MODES}")
+
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT status FROM crawl_runs WHERE crawl_key = ?', (crawl_key,)
+            ).fetchone()
+            if mode == 'resume' and (row is None or row[0] != 'running'):
+                mode = 'full'
+
+            if mode == 'full':
+                self._conn.execute('DELETE FROM visited_pages WHERE crawl_key = ?', (crawl_key,))
+            if mode in ('full', 'delta'):
+                self._conn.execute('DELETE FROM crawl_cursors WHERE crawl_key = ?', (crawl_key,))
+            if mode != 'resume':
+                self._conn.execute('''
+                    INSERT OR REPLACE INTO crawl_runs (crawl_key, status, started_at)
+                    VALUES (?, 'running', ?)
+                ''', (crawl_key, time.time()))
+            self._conn.commit()
+
+        logger.info(f"Starting {mode} crawl for {crawl_key}")
+        return mode
+
+    def finish(self, crawl_key: str) -> None:
+        """Mark a crawl as successfully completed and drop its cursors."""
+        with self._lock:
+            self._conn.execute('''
+                UPDATE crawl_runs SET status = 'complete', finished_at = ?
+                WHERE crawl_key = ?
+            ''', (time.time(), crawl_key))
+            self._conn.execute('DELETE FROM crawl_cursors WHERE crawl_key = ?', (crawl_key,))
+            self._conn.commit()
+
+    def get_cursor(self, crawl_key: str, name: str, default: Any = None) -> Any:
+        """Load a JSON-serializable cursor value."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value FROM crawl_cursors WHERE crawl_key = ? AND name = ?',
+                (crawl_key, name)
+            ).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set_cursor(self, crawl_key: str, name: str, value: Any) -> None:
+        """Save a JSON-serializable cursor value."""
+        with self._lock:
+            self._conn.execute('''
+                INSERT OR REPLACE INTO crawl_cursors (crawl_key, name, value)
+                VALUES (?, ?, ?)
+            ''', (crawl_key, name, json.dumps(value, ensure_ascii=False)))
+            self._conn.commit()
+
+    def get_visit(self, crawl_key: str, url: str) -> Optional[Tuple[Optional[str], Optional[Dict]]]:
+        """Look up a visited page.
+
+        Returns:
+            (content_hash, extracted result) or None if the page was never visited
+        """
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT content_hash, result FROM visited_pages WHERE crawl_key = ? AND url = ?',
+                (crawl_key, url)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]) if row[1] else None
+
+    def record_visit(self, crawl_key: str, url: str, content_hash: Optional[str],
+                     result: Optional[Dict] = None) -> None:
+        """Record that a page was processed, with whatever it yielded."""
+        with self._lock:
+            self._conn.execute('''
+                INSERT OR REPLACE INTO visited_pages (crawl_key, url, content_hash, result, visited_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (
+                crawl_key,
+                url,
+                content_hash,
+                json.dumps(result, ensure_ascii=False) if result is not None else None,
+                time.time()
+            ))
+            self._conn.commit()
+
+    def results(self, crawl_key: str) -> List[Dict]:
+        """Return every non-empty result recorded for a crawl."""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT result FROM visited_pages WHERE crawl_key = ? AND result IS NOT NULL ORDER BY visited_at',
+                (crawl_key,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def close(self) -> None:
+        """Close the state database."""
+        with self._lock:
+            self._conn.close()
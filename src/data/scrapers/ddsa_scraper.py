@@ -2,7 +2,7 @@
 
 import re
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from .base_scraper import BaseScraper
 from ...utils.script_utils import ScriptUtils, Script
 from config.logging_config import setup_logging
@@ -13,6 +13,13 @@ logger = setup_logging("ddsa")
 class DDSAScraper(BaseScraper):
     """Scraper for Digital Dictionaries of South Asia (University of Chicago)."""
     
+    # Digitized print dictionaries rarely change
+    CACHE_TTL = 30 * 24 * 60 * 60
+    
+    # Only the parts of each page that are actually read
+    INDEX_PARSE_ONLY = SoupStrainer('a', class_='entry-link')
+    ENTRY_PARSE_ONLY = SoupStrainer('div', class_=['entry', 'headword'])
+    
     def __init__(self, language: str):
         """Initialize the scraper.
         
@@ -140,10 +147,9 @@ class DDSAScraper(BaseScraper):
             try:
                 # Get dictionary index
                 index_url = f"{self.base_url}{dictionary['path']}/index.html"
-                response = self.session.get(index_url)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self.get_page(index_url, parse_only=self.INDEX_PARSE_ONLY)
+                if not soup:
+                    continue
                 
                 # Get all entry links
                 entry_links = soup.find_all('a', class_='entry-link')
@@ -153,10 +159,9 @@ class DDSAScraper(BaseScraper):
                         entry_url = f"{self.base_url}{dictionary['path']}/{link['href']}"
                         self.current_url = entry_url
                         
-                        entry_response = self.session.get(entry_url)
-                        entry_response.raise_for_status()
-                        
-                        entry_soup = BeautifulSoup(entry_response.text, 'html.parser')
+                        entry_soup = self.get_page(entry_url, parse_only=self.ENTRY_PARSE_ONLY)
+                        if not entry_soup:
+                            continue
                         word_info = self._extract_word_info(entry_soup, dictionary)
                         
                         if word_info:
@@ -0,0 +1,68 @@
+"""Pluggable HTML parsing backends for scrapers."""
+
+import importlib.util
+from functools import lru_cache
+from typing import List, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from config.logging_config import setup_logging
+
+logger = setup_logging("html_parsing")
+
+# BeautifulSoup tree builders and the module each one needs. lxml is in
+# requirements.txt, html5lib is an optional extra and html.parser ships with
+# Python, so it is the fallback when lxml is missing.
+PARSER_MODULES = {
+    'lxml': 'lxml',
+    'html.parser': None,
+    'html5lib': 'html5lib'
+}
+
+# Order in which backends are picked when none is configured (fastest first).
+# html5lib is slower than html.parser and is only used when asked for.
+PARSER_PREFERENCE = ('lxml', 'html.parser')
+
+@lru_cache(maxsize=None)
+def available_parsers() -> List[str]:
+    """Return the parsing backends that can be used in this environment."""
+    return [
+        name for name, module in PARSER_MODULES.items()
+        if module is None or importlib.util.find_spec(module) is not None
+    ]
+
+def resolve_parser(name: Optional[str] = None) -> str:
+    """Pick the parsing backend to use.
+
+    Args:
+        name: Requested backend, or None for the fastest installed one
+
+    Returns:
+        Name of an installed backend
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    available = available_parsers()
+    if name is None:
+        return next(parser for parser in PARSER_PREFERENCE if parser in available)
+    if name not in PARSER_MODULES:
+        raise ValueError(f"Unknown HTML parser '{name}'. Supported parsers: {list(PARSER_MODULES)}")
+    if name not in available:
+        fallback = resolve_parser()
+        logger.warning(f"HTML parser '{name}' is not installed, falling back to '{fallback}'")
+        return fallback
+    return name
+
+def parse_html(markup: str, parser: Optional[str] = None,
+               parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """Parse a page, optionally keeping only the elements a scraper needs.
+
+    Args:
+        markup: HTML text
+        parser: Backend name (see resolve_parser)
+        parse_only: Strainer limiting the tree to matching elements and their
+            descendants, which skips building the rest of the page
+
+    Returns:
+        BeautifulSoup object
+    """
+    return BeautifulSoup(markup, resolve_parser(parser), parse_only=parse_only)
@@ -0,0 +1,139 @@
+"""Persistent HTTP response cache for scrapers."""
+
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Union
+from config.logging_config import setup_logging
+
+logger = setup_logging("http_cache")
+
+@dataclass
+class CachedResponse:
+    """A response body stored in the cache, with its validators."""
+    url: str
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+    def is_fresh(self, ttl: Optional[float]) -> bool:
+        """Check whether the entry can be used without revalidation."""
+        if ttl is None:
+            return False
+        return time.time() - self.fetched_at < ttl
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers for revalidating this entry with the origin server."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+class ResponseCache:
+    """SQLite-backed cache of response bodies keyed by URL.
+
+    Entries younger than the caller's TTL are served directly. Older entries
+    are revalidated with ETag / Last-Modified, so unchanged pages cost a 304
+    instead of a full download.
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """Open (or create) the cache database.
+
+        Args:
+            db_path: Path to the SQLite cache file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode = WAL')
+        self._conn.execute('PRAGMA synchronous = NORMAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL
+            )
+        ''')
+        self._conn.commit()
+
+        # Usage counters
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.bytes_saved = 0
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Look up a cached response."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT url, body, etag, last_modified, fetched_at FROM responses WHERE url = ?',
+                (url,)
+            ).fetchone()
+        return CachedResponse(*row) if row else None
+
+    def store(self, url: str, body: str, etag: Optional[str] = None,
+              last_modified: Optional[str] = None) -> None:
+        """Store (or replace) a response."""
+        with self._lock:
+            self._conn.execute('''
+                INSERT OR REPLACE INTO responses (url, body, etag, last_modified, fetched_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (url, body, etag, last_modified, time.time()))
+            self._conn.commit()
+
+    def touch(self, url: str) -> None:
+        """Mark an entry as freshly validated (after a 304)."""
+        with self._lock:
+            self._conn.execute(
+                'UPDATE responses SET fetched_at = ? WHERE url = ?',
+                (time.time(), url)
+            )
+            self._conn.commit()
+
+    def record(self, outcome: str, size: int = 0) -> None:
+        """Update usage counters.
+
+        Args:
+            outcome: 'hit', 'revalidated' or 'miss'
+            size: Body size in bytes that did not have to be downloaded
+        """
+        with self._lock:
+            if outcome == 'hit':
+                self.hits += 1
+            elif outcome == 'revalidated':
+                self.revalidated += 1
+            else:
+                self.misses += 1
+            self.bytes_saved += size
+
+    def stats(self) -> Dict[str, int]:
+        """Return usage counters."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'revalidated': self.revalidated,
+                'misses': self.misses,
+                'bytes_saved': self.bytes_saved
+            }
+
+    def log_stats(self) -> None:
+        """Log usage counters."""
+        stats = self.stats()
+        logger.info(
+            f"HTTP cache: {stats['hits']} hits, {stats['revalidated']} revalidated (304), "
+            f"{stats['misses']} misses, {stats['bytes_saved'] / 1024:.1f} KiB saved"
+        )
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
@@ -2,7 +2,7 @@
 
 import re
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from .base_scraper import BaseScraper
 from ...utils.script_utils import ScriptUtils, Script
 from config.logging_config import setup_logging
@@ -11,6 +11,9 @@ from config.logging_config import setup_logging
 
 logger = setup_logging("punjabi_dict")
 class PunjabiDictScraper(BaseScraper):
+    # Only the word entries are read from dictionary pages
+    ENTRY_PARSE_ONLY = SoupStrainer('div', class_='word-entry')
+    
     def __init__(self, language: str):
         """Initialize the scraper.
         
@@ -55,7 +58,7 @@ class PunjabiDictScraper(BaseScraper):
                 dict_url = f"{self.base_url}{dict_info['endpoint']}/index"
                 
                 # Get dictionary index
-                soup = self.get_page(dict_url)
+                soup = self.get_page(dict_url, parse_only=self.ENTRY_PARSE_ONLY)
                 if not soup:
                     continue
                 
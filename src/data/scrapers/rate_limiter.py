@@ -0,0 +1,99 @@
+"""Process-wide, per-host rate limiting for scrapers."""
+
+import asyncio
+import threading
+import time
+from typing import Dict
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Callers reserve a token and are told how long to wait before using it,
+    so the same bucket works for blocking and asyncio callers.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive")
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return the number of seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self) -> float:
+        """Block until a token is available. Returns the time waited."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Wait asynchronously until a token is available. Returns the time waited."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def slow_down(self, rate: float) -> None:
+        """Lower the refill rate if a stricter limit is requested."""
+        with self._lock:
+            self.rate = min(self.rate, rate)
+
+class HostRateLimiter:
+    """Registry of token buckets keyed by host.
+
+    All scrapers talking to the same host share one bucket, no matter how
+    many scraper instances or threads are running.
+    """
+
+    def __init__(self):
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def get_bucket(self, host: str, rate: float, capacity: float = 1.0) -> TokenBucket:
+        """Get the bucket for a host, creating it if needed.
+
+        If the host already has a bucket, the stricter of the two rates wins.
+
+        Args:
+            host: Hostname (e.g. 'ta.wiktionary.org')
+            rate: Allowed requests per second
+            capacity: Burst size
+
+        Returns:
+            Shared TokenBucket for the host
+        """
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(rate, capacity)
+                self._buckets[host] = bucket
+            else:
+                bucket.slow_down(rate)
+            return bucket
+
+    def reset(self) -> None:
+        """Forget all buckets."""
+        with self._lock:
+            self._buckets.clear()
+
+# Shared by every scraper in the process
+host_rate_limiter = HostRateLimiter()
@@ -2,7 +2,7 @@
 
 import re
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from .base_scraper import BaseScraper
 from ...utils.script_utils import ScriptUtils, Script
 from config.logging_config import setup_logging
@@ -13,6 +13,10 @@ logger = setup_logging("sanskrit_dict")
 class SanskritDictScraper(BaseScraper):
     """Scraper for Sanskrit-Dictionary.com, which provides free access to Sanskrit dictionaries."""
     
+    # Only the parts of each page that are actually read
+    SEARCH_PARSE_ONLY = SoupStrainer('div', class_='dictionary-entry')
+    ENTRY_PARSE_ONLY = SoupStrainer('div', class_=['sanskrit-word', 'etymology', 'definition'])
+    
     def __init__(self, language: str):
         """Initialize the scraper.
         
@@ -116,12 +120,16 @@ class SanskritDictScraper(BaseScraper):
         Returns:
             List of dictionaries containing word pairs and metadata
         """
-        words = []
+        words = self.begin_crawl()
         
         # Get list of letters to search
         letters = 'aāiīuūṛṝḷḹeēoōṃḥkgṅcjñṭḍṇtdnpbmyrlvśṣsh'
+        completed_letters = set(self.load_checkpoint('completed_letters', []))
         
         for letter in letters:
+            if letter in completed_letters:
+                continue
+            
             try:
                 # Search for words starting with the letter
                 search_url = f"{self.base_url}/dictionary/search"
@@ -131,18 +139,22 @@ class SanskritDictScraper(BaseScraper):
                     'rows': 100  # Limit results per page
                 }
                 
-                response = self.session.get(search_url, params=params)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self.get_page(search_url, params=params, parse_only=self.SEARCH_PARSE_ONLY)
+                if not soup:
+                    continue
                 
                 # Process each word entry
                 for entry in soup.find_all('div', class_='dictionary-entry'):
                     entry_url = entry.find('a')['href']
-                    entry_response = self.session.get(entry_url)
-                    entry_response.raise_for_status()
+                    if self.already_visited(entry_url):
+                        continue
+                    
+                    entry_soup = self.get_page(entry_url, parse_only=self.ENTRY_PARSE_ONLY)
+                    if not entry_soup or self.is_unchanged(entry_url):
+                        continue
                     
-                    entry_soup = BeautifulSoup(entry_response.text, 'html.parser')
                     word_info = self._extract_word_info(entry_soup, entry_url)
+                    self.record_page(entry_url, word_info)
                     
                     if word_info:
                         words.append(word_info)
@@ -150,8 +162,12 @@ class SanskritDictScraper(BaseScraper):
                             f"Found Sanskrit loanword: {word_info['word']} <- "
                             f"{word_info['sanskrit_word']} ({self.language})"
                         )
+                
+                completed_letters.add(letter)
+                self.save_checkpoint('completed_letters', sorted(completed_letters))
             
             except Exception as e:
                 logger.error(f"Error processing letter {letter}: {e}")
         
+        self.finish_crawl()
         return words
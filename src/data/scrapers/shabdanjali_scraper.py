@@ -2,7 +2,7 @@
 
 import re
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from ..base_scraper import BaseScraper
 from ...utils.script_utils import ScriptUtils, Script
 from config.logging_config import setup_logging
@@ -13,6 +13,9 @@ logger = setup_logging("shabdanjali")
 class ShabdanjaliScraper(BaseScraper):
     """Scraper for Shabdanjali, a digital corpus of Sanskrit dictionaries."""
     
+    # Only the word links are read from index pages
+    INDEX_PARSE_ONLY = SoupStrainer('a', class_='word-link')
+    
     def __init__(self, language: str):
         """Initialize the scraper.
         
@@ -124,9 +127,9 @@ class ShabdanjaliScraper(BaseScraper):
                 index_url = f"{self.base_url}{dict_info['endpoint']}/index.php"
                 params = {'lang': lang_code}
                 
-                response = self.session.get(index_url, params=params)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = self.get_page(index_url, params=params, parse_only=self.INDEX_PARSE_ONLY)
+                if not soup:
+                    continue
                 
                 # Get all word links
                 word_links = soup.find_all('a', class_='word-link')
@@ -136,10 +139,9 @@ class ShabdanjaliScraper(BaseScraper):
                         word_url = f"{self.base_url}{dict_info['endpoint']}/{link['href']}"
                         self.current_url = word_url
                         
-                        word_response = self.session.get(word_url)
-                        word_response.raise_for_status()
-                        
-                        word_soup = BeautifulSoup(word_response.text, 'html.parser')
+                        word_soup = self.get_page(word_url)
+                        if not word_soup:
+                            continue
                         word_info = self._extract_word_info(word_soup, dict_name)
                         
                         if word_info:
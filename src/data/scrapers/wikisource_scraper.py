@@ -4,7 +4,7 @@ classical texts."""
 
 import re
 from typing import List, Dict, Optional, Set
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from .base_scraper import BaseScraper
 from ...utils.script_utils import ScriptUtils, Script
 from config.logging_config import setup_logging
@@ -13,6 +13,9 @@ from config.logging_config import setup_logging
 class WikisourceScraper(BaseScraper):
     """Scraper for parallel texts in Sanskrit and other Indic languages from Wikisource."""
     
+    # Only the article body is read from text pages
+    CONTENT_PARSE_ONLY = SoupStrainer('div', class_='mw-parser-output')
+    
     def __init__(self, language: str):
         """Initialize the scraper.
         
@@ -163,7 +166,7 @@ class WikisourceScraper(BaseScraper):
         for page_url in pages:
             try:
                 self.current_url = self.base_url + page_url
-                soup = self.get_page(self.current_url)
+                soup = self.get_page(self.current_url, parse_only=self.CONTENT_PARSE_ONLY)
                 if not soup:
                     continue
                 
@@ -1,6 +1,7 @@
 """Wiktionary scraper for Sanskrit loanwords in Indic languages."""
 
 import re
+from bs4 import SoupStrainer
 from typing import List, Dict, Optional, Tuple
 from urllib.parse import urljoin
 from .base_scraper import BaseScraper
@@ -70,6 +71,15 @@ class WiktionaryScraper(BaseScraper):
         }
     }
     
+    # Number of entry pages fetched concurrently per batch
+    PAGE_BATCH_SIZE = 20
+    
+    # Entry pages are cached for a week; stale ones are revalidated with ETags
+    CACHE_TTL = 7 * 24 * 60 * 60
+    
+    # Entry pages only need the title and the article body, not the site chrome
+    ENTRY_PARSE_ONLY = SoupStrainer(attrs={'id': ['firstHeading', 'mw-content-text']})
+    
     def __init__(self, language: str):
         """Initialize the scraper for a specific language.
         
@@ -173,8 +183,9 @@ class WiktionaryScraper(BaseScraper):
 
     def _get_category_pages(self) -> List[str]:
         """Get all pages in the Sanskrit loanwords category."""
-        pages = []
-        next_url = self.category_url
+        # On resume, continue the category walk where it stopped
+        pages = self.load_checkpoint('category_pages', [])
+        next_url = self.load_checkpoint('category_next_url', self.category_url)
         
         while next_url:
             soup = self.get_page(urljoin(self.base_url, next_url))
@@ -203,6 +214,9 @@ class WiktionaryScraper(BaseScraper):
             next_link = soup.find('a', text=re.compile(next_pattern, re.IGNORECASE))
             next_url = next_link['href'] if next_link else None
             
+            self.save_checkpoint('category_pages', pages)
+            self.save_checkpoint('category_next_url', next_url)
+            
         return pages
 
     def scrape_words(self) -> List[Dict[str, str]]:
@@ -211,19 +225,27 @@ class WiktionaryScraper(BaseScraper):
         Returns:
             List of dictionaries containing word pairs and metadata
         """
-        words = []
+        words = self.begin_crawl()
         pages = self._get_category_pages()
         
-        for page_url in pages:
-            self.current_url = urljoin(self.base_url, page_url)
-            soup = self.get_page(self.current_url)
+        # Entry pages finished before an interruption are not fetched again
+        urls = [urljoin(self.base_url, page_url) for page_url in pages]
+        urls = [url for url in urls if not self.already_visited(url)]
+        
+        # Fetch entry pages concurrently, a batch at a time
+        for start in range(0, len(urls), self.PAGE_BATCH_SIZE):
+            batch = urls[start:start + self.PAGE_BATCH_SIZE]
             
-            if not soup:
-                continue
+            for url, soup in zip(batch, self.get_pages(batch, parse_only=self.ENTRY_PARSE_ONLY)):
+                if not soup or self.is_unchanged(url):
+                    continue
                 
-            word_info = self._extract_word_info(soup)
-            if word_info:
-                words.append(word_info)
-                logger.info(f"Found Sanskrit loanword: {word_info['word']} <- {word_info['sanskrit_word']} ({self.language})")
+                self.current_url = url
+                word_info = self._extract_word_info(soup)
+                self.record_page(url, word_info)
+                if word_info:
+                    words.append(word_info)
+                    logger.info(f"Found Sanskrit loanword: {word_info['word']} <- {word_info['sanskrit_word']} ({self.language})")
         
+        self.finish_crawl()
         return words
@@ -8,7 +8,15 @@ import json
 logger = logging.getLogger(__name__)
 
 class IndicBertHandler:
-    def __init__(self, model_path: str, tokenizer_path: str, labels_path: str):
+    # Supported inference backends:
+    # - pytorch: fp32 PyTorch model (GPU if available)
+    # - quantized: int8 dynamically quantized PyTorch model (CPU)
+    # - onnx: ONNX Runtime session over an exported model (CPU), see scripts/export_model.py
+    BACKENDS = ('pytorch', 'quantized', 'onnx')
+    
+    def __init__(self, model_path: str, tokenizer_path: str, labels_path: str,
+                 backend: str = 'pytorch', onnx_path: Optional[str] = None,
+                 num_threads: Optional[int] = None):
         """
         Initialize the IndicBERT handler with paths to the fine-tuned model and tokenizer.
         
@@ -16,14 +24,36 @@ class IndicBertHandler:
             model_path: Path to the fine-tuned model
             tokenizer_path: Path to the tokenizer
             labels_path: Path to the labels JSON file containing Sanskrit roots and meanings
+            backend: Inference backend, one of BACKENDS
+            onnx_path: Path to the exported ONNX model (onnx backend only)
+            num_threads: CPU threads for inference (None keeps the library default)
         """
-        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown inference backend '{backend}'. Supported backends: {self.BACKENDS}")
+        self.backend = backend
+        
+        if backend == 'pytorch':
+            self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        else:
+            self.device = torch.device("cpu")
         
         try:
-            # Load the fine-tuned model
-            self.model = AutoModelForSequenceClassification.from_pretrained(model_path)
-            self.model.to(self.device)
-            self.model.eval()
+            if backend == 'onnx':
+                self.model = None
+                self.session = self._load_onnx_session(onnx_path, num_threads)
+            else:
+                if num_threads:
+                    torch.set_num_threads(num_threads)
+                
+                # Load the fine-tuned model
+                self.model = AutoModelForSequenceClassification.from_pretrained(model_path)
+                self.model.eval()
+                if backend == 'quantized':
+                    # int8 weights for the Linear layers, activations quantized on the fly
+                    self.model = torch.quantization.quantize_dynamic(
+                        self.model, {torch.nn.Linear}, dtype=torch.qint8
+                    )
+                self.model.to(self.device)
             
             # Load the tokenizer
             self.tokenizer = AutoTokenizer.from_pretrained(tokenizer_path)
@@ -32,13 +62,58 @@ class IndicBertHandler:
             with open(labels_path, 'r', encoding='utf-8') as f:
                 self.labels = json.load(f)
             
-            logger.info("Successfully loaded IndicBERT model, tokenizer, and labels")
+            logger.info(f"Successfully loaded IndicBERT model ({backend} backend), tokenizer, and labels")
             
         except Exception as e:
             logger.error(f"Error loading IndicBERT components: {e}")
             raise
     
-    def predict(self, word: str, script_type: str) -> Tuple[Optional[str], Optional[str], float]:
+    @staticmethod
+    def _load_onnx_session(onnx_path: Optional[str], num_threads: Optional[int]):
+        """Create an ONNX Runtime session for CPU inference."""
+        if not onnx_path:
+            raise ValueError("onnx_path is required for the onnx backend")
+        try:
+            import onnxruntime
+        except ImportError as e:
+            raise ImportError("The onnx backend requires the onnxruntime package") from e
+        
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        return onnxruntime.InferenceSession(onnx_path, options, providers=['CPUExecutionProvider'])
+    
+    def _classify(self, features) -> Tuple[List[float], List[int]]:
+        """
+        Run the classifier on tokenized (unpadded) features.
+        
+        Returns:
+            Confidence and predicted class for each example
+        """
+        if self.backend == 'onnx':
+            # Only the onnx backend needs NumPy; onnxruntime depends on it
+            import numpy as np
+            inputs = self.tokenizer.pad(features, return_tensors="np")
+            input_names = [node.name for node in self.session.get_inputs()]
+            logits = self.session.run(
+                ['logits'],
+                {name: inputs[name].astype('int64') for name in input_names if name in inputs}
+            )[0]
+            # Softmax over classes
+            logits = logits - logits.max(axis=-1, keepdims=True)
+            probabilities = np.exp(logits)
+            probabilities /= probabilities.sum(axis=-1, keepdims=True)
+            return probabilities.max(axis=-1).tolist(), probabilities.argmax(axis=-1).tolist()
+        
+        inputs = self.tokenizer.pad(features, return_tensors="pt").to(self.device)
+        with torch.no_grad():
+            outputs = self.model(**inputs)
+            probabilities = torch.nn.functional.softmax(outputs.logits, dim=-1)
+            confidences, predicted_classes = torch.max(probabilities, dim=-1)
+        return confidences.tolist(), predicted_classes.tolist()
+    
+    def predict(self, word: str, script_type: str) -> Tuple[Optional[str], Optional[str], float, bool]:
         """
         Predict if a word is a Sanskrit loanword and return its root and meaning.
         
@@ -50,41 +125,95 @@ class IndicBertHandler:
             Tuple containing:
             - Sanskrit root (if found, else None)
             - Meaning (if found, else None)
-            - Confidence score (0 to 1)
+            - Confidence score (0 to 1; 0.0 if the prediction failed)
+            - Whether the classifier rejected the word as a non-loanword; False
+              for a loanword without a label entry and for a failed prediction
         """
         try:
             # Prepare input
-            inputs = self.tokenizer(
-                word,
-                return_tensors="pt",
-                padding=True,
-                truncation=True,
-                max_length=128
-            ).to(self.device)
+            features = [self.tokenizer(word, truncation=True, max_length=128)]
             
             # Get model prediction
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                probabilities = torch.nn.functional.softmax(outputs.logits, dim=-1)
-                confidence, predicted_class = torch.max(probabilities, dim=-1)
-                
-                # Convert to Python scalars
-                confidence = confidence.item()
-                predicted_class = predicted_class.item()
+            confidences, predicted_classes = self._classify(features)
+            return self._label_prediction(word, predicted_classes[0], confidences[0])
             
-            # Get Sanskrit root and meaning if prediction is positive
-            if predicted_class == 1 and confidence > 0.5:  # Assuming 1 is the positive class
-                # Look up the word in our labels
-                word_info = self.labels.get(word.lower(), {})
-                sanskrit_root = word_info.get('root')
-                meaning = word_info.get('meaning')
-                return sanskrit_root, meaning, confidence
+        except Exception as e:
+            logger.error(f"Error during prediction: {e}")
+            return None, None, 0.0, False
+    
+    def predict_batch(self, words: List[str], script_type: str,
+                      max_batch_size: int = 64,
+                      max_batch_tokens: int = 4096) -> List[Tuple[Optional[str], Optional[str], float, bool]]:
+        """
+        Predict many words at once, e.g. all tokens of a tweet.
+        
+        Words are sorted by token length and grouped into dynamically sized
+        batches, so each forward pass pads only to the longest word in its
+        batch.
+        
+        Args:
+            words: The words to analyze
+            script_type: The script type of the words (devanagari, tamil, etc.)
+            max_batch_size: Maximum number of words per forward pass
+            max_batch_tokens: Maximum padded tokens (words x longest word) per forward pass
+            
+        Returns:
+            One (sanskrit_root, meaning, confidence, rejected) tuple per word, in input order,
+            same as predict()
+        """
+        if not words:
+            return []
+        
+        try:
+            # Tokenize without padding; padding happens per batch
+            encodings = self.tokenizer(list(words), truncation=True, max_length=128)
+            lengths = [len(ids) for ids in encodings['input_ids']]
+            
+            results = [None] * len(words)
+            for batch in self._length_batches(lengths, max_batch_size, max_batch_tokens):
+                features = [
+                    {key: encodings[key][i] for key in encodings.keys()}
+                    for i in batch
+                ]
+                confidences, predicted_classes = self._classify(features)
+                
+                for i, confidence, predicted_class in zip(batch, confidences, predicted_classes):
+                    results[i] = self._label_prediction(words[i], predicted_class, confidence)
             
-            return None, None, confidence
+            return results
             
         except Exception as e:
-            logger.error(f"Error during prediction: {e}")
-            return None, None, 0.0
+            logger.error(f"Error during batch prediction: {e}")
+            return [(None, None, 0.0, False)] * len(words)
+    
+    @staticmethod
+    def _length_batches(lengths: List[int], max_batch_size: int, max_batch_tokens: int) -> List[List[int]]:
+        """Group indices of similar token length into batches within the size limits."""
+        batches = []
+        batch = []
+        for i in sorted(range(len(lengths)), key=lengths.__getitem__):
+            # Sorted ascending, so the current word is the longest in the batch
+            if batch and (len(batch) >= max_batch_size or
+                          (len(batch) + 1) * lengths[i] > max_batch_tokens):
+                batches.append(batch)
+                batch = []
+            batch.append(i)
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    def _label_prediction(self, word: str, predicted_class: int,
+                          confidence: float) -> Tuple[Optional[str], Optional[str], float, bool]:
+        """Turn a class prediction into (sanskrit_root, meaning, confidence, rejected)."""
+        # Get Sanskrit root and meaning if prediction is positive
+        if predicted_class == 1 and confidence > 0.5:  # Assuming 1 is the positive class
+            # Look up the word in our labels
+            word_info = self.labels.get(word.lower(), {})
+            sanskrit_root = word_info.get('root')
+            meaning = word_info.get('meaning')
+            return sanskrit_root, meaning, confidence, False
+        
+        return None, None, confidence, True
     
     @staticmethod
     def prepare_training_data(words_file: str, output_file: str):
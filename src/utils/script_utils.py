@@ -1,9 +1,15 @@
 """Utility functions for script validation and conversion."""
 
 import re
-from typing import Dict, List, Set, Tuple
+from functools import lru_cache
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
 from enum import Enum
 
+try:
+    import numpy as np
+except ImportError:  # validate_batch falls back to per-word set checks
+    np = None
+
 class Script(Enum):
     """Enum for different writing scripts."""
     DEVANAGARI = 'devanagari'
@@ -12,9 +18,86 @@ class Script(Enum):
     TELUGU = 'telugu'
     MALAYALAM = 'malayalam'
     KANNADA = 'kannada'
+    GURMUKHI = 'gurmukhi'
+    GUJARATI = 'gujarati'
+    ODIA = 'odia'
     LATIN = 'latin'
     IAST = 'iast'
 
+class ScriptClassifier:
+    """Single-pass script classifier over a precomputed code point table.
+    
+    Every code point covered by the given ranges is mapped to a one-character
+    bucket, so classifying a text is one str.translate call followed by a
+    C-level count per bucket, instead of a Python loop over characters.
+    When ranges overlap, the script listed first wins.
+    """
+    
+    def __init__(self, scripts: Iterable[Tuple[Hashable, Sequence[Tuple[int, int]]]]):
+        """Build the lookup table.
+        
+        Args:
+            scripts: (script, [(start, end), ...]) pairs in priority order;
+                the order also breaks ties between equally common scripts
+        """
+        self.scripts = []
+        self._buckets = {}
+        script_ranges = list(scripts)
+        table_size = max(end + 1 for _, ranges in script_ranges for _, end in ranges)
+        
+        # None deletes unclassified characters; code points past the table are
+        # left as they are and never match a bucket
+        table = [None] * table_size
+        for index, (script, ranges) in enumerate(script_ranges):
+            self.scripts.append(script)
+            self._buckets[script] = chr(index)
+            for start, end in ranges:
+                for code in range(start, end + 1):
+                    if table[code] is None:
+                        table[code] = index
+        self._table = table
+    
+    def counts(self, text: str) -> Dict[Hashable, int]:
+        """Count the characters of each script in the text.
+        
+        Args:
+            text: Input text
+            
+        Returns:
+            Character count per script, in priority order
+        """
+        classified = text.translate(self._table)
+        return {script: classified.count(bucket) for script, bucket in self._buckets.items()}
+    
+    def dominant(self, text: str, default: Optional[Hashable] = None) -> Hashable:
+        """Find the script with the most characters in the text.
+        
+        Args:
+            text: Input text
+            default: Returned when no character belongs to any script;
+                if None, the first script is returned instead
+            
+        Returns:
+            Most common script, ties going to the script listed first
+        """
+        script_counts = self.counts(text)
+        dominant_script = max(script_counts, key=script_counts.get)
+        if default is not None and script_counts[dominant_script] == 0:
+            return default
+        return dominant_script
+
+class _CleanTable(dict):
+    """str.translate table for ScriptUtils.clean_text.
+    
+    Holds every code point below ScriptUtils.TABLE_LIMIT; code points above it
+    can only be kept as whitespace, and are classified (and remembered) on
+    first sight.
+    """
+    
+    def __missing__(self, code: int) -> Optional[int]:
+        self[code] = code if chr(code).isspace() else None
+        return self[code]
+
 class ScriptUtils:
     """Utility class for script validation and conversion."""
     
@@ -26,6 +109,9 @@ class ScriptUtils:
         Script.TELUGU: [(0x0C00, 0x0C7F)],  # Telugu
         Script.MALAYALAM: [(0x0D00, 0x0D7F)],  # Malayalam
         Script.KANNADA: [(0x0C80, 0x0CFF)],  # Kannada
+        Script.GURMUKHI: [(0x0A00, 0x0A7F)],  # Gurmukhi
+        Script.GUJARATI: [(0x0A80, 0x0AFF)],  # Gujarati
+        Script.ODIA: [(0x0B00, 0x0B7F)],  # Odia
         Script.LATIN: [(0x0000, 0x007F)],  # Basic Latin
         # Additional ranges for extended Latin characters used in IAST
         Script.IAST: [
@@ -35,6 +121,17 @@ class ScriptUtils:
         ]
     }
     
+    # Shared single-pass classifier over SCRIPT_RANGES
+    CLASSIFIER = ScriptClassifier(SCRIPT_RANGES.items())
+    
+    # Code points below this are classified by the precomputed character
+    # tables; every script range and diacritic lies below it
+    TABLE_LIMIT = 0x3000
+    
+    # Smallest batch validate_batch hands to NumPy; below this the per-word
+    # set checks are faster than encoding the batch
+    VECTORIZE_MIN_WORDS = 64
+    
     # Common diacritical marks and special characters
     DIACRITICS = {
         0x0951: 'udatta',
@@ -48,14 +145,6 @@ class ScriptUtils:
         0x094D: 'virama'
     }
     
-    # IAST to Devanagari mapping
-    IAST_TO_DEVANAGARI = {
-        'ā': 'आ', 'ī': 'ई', 'ū': 'ऊ', 'ṛ': 'ऋ', 'ṝ': 'ॠ',
-        'ḷ': 'ऌ', 'ḹ': 'ॡ', 'ṃ': 'ं', 'ḥ': 'ः',
-        'ś': 'श', 'ṣ': 'ष', 'ñ': 'ञ', 'ṅ': 'ङ', 'ṇ': 'ण',
-        'ṭ': 'ट', 'ḍ': 'ड', 'ṛh': 'ऋ', 'ṝh': 'ॠ'
-    }
-    
     @classmethod
     def get_script(cls, text: str) -> Script:
         """Determine the dominant script of a text.
@@ -66,18 +155,7 @@ class ScriptUtils:
         Returns:
             Most likely script of the text
         """
-        script_counts = {script: 0 for script in Script}
-        
-        for char in text:
-            char_code = ord(char)
-            for script, ranges in cls.SCRIPT_RANGES.items():
-                if any(start <= char_code <= end for start, end in ranges):
-                    script_counts[script] += 1
-                    break
-        
-        # Get script with highest character count, excluding diacritics
-        dominant_script = max(script_counts.items(), key=lambda x: x[1])[0]
-        return dominant_script
+        return cls.CLASSIFIER.dominant(text)
     
     @classmethod
     def validate_script(cls, text: str, expected_script: Script, 
@@ -94,31 +172,130 @@ class ScriptUtils:
         Returns:
             True if text is in expected script, False otherwise
         """
-        for char in text:
-            char_code = ord(char)
-            
-            # Skip whitespace
-            if char.isspace():
-                continue
-                
-            # Check numerals
-            if char.isnumeric():
-                if not allow_numerals:
-                    return False
-                continue
-            
-            # Check diacritics
-            if char_code in cls.DIACRITICS:
-                if not allow_diacritics:
-                    return False
-                continue
+        allowed = cls._allowed_chars(expected_script, allow_numerals, allow_diacritics)
+        if allowed.issuperset(text):
+            return True
+        if ord(max(text)) < cls.TABLE_LIMIT:
+            return False
+        
+        # Past the tables only whitespace and (optionally) numerals are valid
+        return all(
+            ord(char) >= cls.TABLE_LIMIT and
+            (char.isspace() or (allow_numerals and char.isnumeric()))
+            for char in set(text).difference(allowed)
+        )
+    
+    @classmethod
+    def validate_batch(cls, words: Sequence[str], expected_script: Script,
+                       allow_numerals: bool = True,
+                       allow_diacritics: bool = True) -> List[bool]:
+        """Validate many words against one script at once.
+        
+        Same result as calling validate_script on each word. With NumPy
+        installed, large batches are checked in one vectorized pass over
+        their UTF-32 code points.
+        
+        Args:
+            words: Input words
+            expected_script: Expected script of the words
+            allow_numerals: Whether to allow Arabic numerals (0-9)
+            allow_diacritics: Whether to allow diacritical marks
             
-            # Check if character is in expected script ranges
-            ranges = cls.SCRIPT_RANGES[expected_script]
-            if not any(start <= char_code <= end for start, end in ranges):
-                return False
+        Returns:
+            One flag per word, True if the word is in the expected script
+        """
+        if np is not None and len(words) >= cls.VECTORIZE_MIN_WORDS:
+            return cls._validate_batch_vectorized(words, expected_script, allow_numerals, allow_diacritics)
+        
+        allowed = cls._allowed_chars(expected_script, allow_numerals, allow_diacritics).issuperset
+        return [
+            True if allowed(word) else cls.validate_script(word, expected_script, allow_numerals, allow_diacritics)
+            for word in words
+        ]
+    
+    @classmethod
+    def _validate_batch_vectorized(cls, words: Sequence[str], expected_script: Script,
+                                   allow_numerals: bool, allow_diacritics: bool) -> List[bool]:
+        """validate_batch over a NumPy lookup table."""
+        table = cls._allowed_array(expected_script, allow_numerals, allow_diacritics)
+        codes = np.frombuffer(''.join(words).encode('utf-32-le', 'surrogatepass'), dtype='<u4')
         
-        return True
+        # Per character: inside the table and allowed by it
+        inside = codes < cls.TABLE_LIMIT
+        allowed = np.zeros(len(codes), dtype=bool)
+        allowed[inside] = table[codes[inside]]
+        
+        # Per word: count rejected characters between word boundaries
+        ends = np.cumsum([len(word) for word in words])
+        starts = ends - [len(word) for word in words]
+        rejected = np.concatenate(([0], np.cumsum(~allowed)))
+        outside = np.concatenate(([0], np.cumsum(~inside)))
+        valid = (rejected[ends] - rejected[starts]) == 0
+        needs_check = ~valid & ((outside[ends] - outside[starts]) > 0)
+        
+        results = valid.tolist()
+        # Characters past the table only pass as whitespace or numerals
+        for index in np.flatnonzero(needs_check).tolist():
+            results[index] = cls.validate_script(
+                words[index], expected_script, allow_numerals, allow_diacritics
+            )
+        return results
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _allowed_array(cls, script: Script, allow_numerals: bool, allow_diacritics: bool):
+        """_allowed_chars as a NumPy boolean table indexed by code point."""
+        table = np.zeros(cls.TABLE_LIMIT, dtype=bool)
+        allowed = cls._allowed_chars(script, allow_numerals, allow_diacritics)
+        table[[ord(char) for char in allowed]] = True
+        return table
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _script_chars(cls, script: Script) -> frozenset:
+        """All characters in the script's ranges."""
+        return frozenset(
+            chr(code)
+            for start, end in cls.SCRIPT_RANGES[script]
+            for code in range(start, end + 1)
+        )
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _allowed_chars(cls, script: Script, allow_numerals: bool,
+                       allow_diacritics: bool) -> frozenset:
+        """Characters below TABLE_LIMIT that validate_script accepts for the script.
+        
+        Checks are applied in the same order as the original per-character
+        rules: whitespace, then numerals, then diacritics, then script ranges.
+        """
+        script_chars = cls._script_chars(script)
+        allowed = set()
+        for code in range(cls.TABLE_LIMIT):
+            char = chr(code)
+            if char.isspace():
+                allowed.add(char)
+            elif char.isnumeric():
+                if allow_numerals:
+                    allowed.add(char)
+            elif code in cls.DIACRITICS:
+                if allow_diacritics:
+                    allowed.add(char)
+            elif char in script_chars:
+                allowed.add(char)
+        return frozenset(allowed)
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _clean_table(cls, script: Script) -> _CleanTable:
+        """Translate table keeping whitespace, diacritics and script characters."""
+        script_chars = cls._script_chars(script)
+        table = _CleanTable()
+        for code in range(cls.TABLE_LIMIT):
+            char = chr(code)
+            keep = char.isspace() or code in cls.DIACRITICS or char in script_chars
+            table[code] = code if keep else None
+        return table
     
     @classmethod
     def convert_iast_to_devanagari(cls, text: str) -> str:
@@ -130,14 +307,9 @@ class ScriptUtils:
         Returns:
             Text converted to Devanagari
         """
-        # First, replace multi-character combinations
-        text = text.replace('ṛh', 'ऋ').replace('ṝh', 'ॠ')
-        
-        # Then replace single characters
-        for iast, dev in cls.IAST_TO_DEVANAGARI.items():
-            text = text.replace(iast, dev)
-        
-        return text
+        # Imported here as the transliteration tables are built on ScriptUtils
+        from .transliteration import transliterate
+        return transliterate(text, Script.IAST, Script.DEVANAGARI)
     
     @classmethod
     def clean_text(cls, text: str, script: Script) -> str:
@@ -150,26 +322,7 @@ class ScriptUtils:
         Returns:
             Cleaned text containing only valid characters for the script
         """
-        cleaned = []
-        for char in text:
-            char_code = ord(char)
-            
-            # Always keep whitespace
-            if char.isspace():
-                cleaned.append(char)
-                continue
-            
-            # Keep diacritics
-            if char_code in cls.DIACRITICS:
-                cleaned.append(char)
-                continue
-            
-            # Keep characters in script range
-            ranges = cls.SCRIPT_RANGES[script]
-            if any(start <= char_code <= end for start, end in ranges):
-                cleaned.append(char)
-        
-        return ''.join(cleaned)
+        return text.translate(cls._clean_table(script))
 
     @classmethod
     def contains_script(cls, text: str, script: Script) -> bool:
@@ -182,8 +335,4 @@ class ScriptUtils:
         Returns:
             True if text contains any characters from the script
         """
-        ranges = cls.SCRIPT_RANGES[script]
-        return any(
-            any(start <= ord(char) <= end for start, end in ranges)
-            for char in text
-        )
+        return not cls._script_chars(script).isdisjoint(text)
@@ -0,0 +1,309 @@
+"""Transliteration between IAST and the Indic (Brahmic) scripts."""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from .script_utils import Script, ScriptUtils
+
+# Scripts whose Unicode blocks share the ISCII layout: the same letter sits at
+# the same offset from the start of each block
+BRAHMIC_SCRIPTS = (
+    Script.DEVANAGARI, Script.BENGALI, Script.GURMUKHI, Script.GUJARATI, Script.ODIA,
+    Script.TAMIL, Script.TELUGU, Script.KANNADA, Script.MALAYALAM
+)
+
+# IAST vowel: (independent vowel offset, vowel sign offset)
+VOWELS = {
+    'a': (0x05, None), 'ā': (0x06, 0x3E), 'i': (0x07, 0x3F), 'ī': (0x08, 0x40),
+    'u': (0x09, 0x41), 'ū': (0x0A, 0x42), 'ṛ': (0x0B, 0x43), 'ṝ': (0x60, 0x44),
+    'ḷ': (0x0C, 0x62), 'ḹ': (0x61, 0x63), 'e': (0x0F, 0x47), 'ai': (0x10, 0x48),
+    'o': (0x13, 0x4B), 'au': (0x14, 0x4C)
+}
+
+# IAST consonant: offset
+CONSONANTS = {
+    'k': 0x15, 'kh': 0x16, 'g': 0x17, 'gh': 0x18, 'ṅ': 0x19,
+    'c': 0x1A, 'ch': 0x1B, 'j': 0x1C, 'jh': 0x1D, 'ñ': 0x1E,
+    'ṭ': 0x1F, 'ṭh': 0x20, 'ḍ': 0x21, 'ḍh': 0x22, 'ṇ': 0x23,
+    't': 0x24, 'th': 0x25, 'd': 0x26, 'dh': 0x27, 'n': 0x28,
+    'p': 0x2A, 'ph': 0x2B, 'b': 0x2C, 'bh': 0x2D, 'm': 0x2E,
+    'y': 0x2F, 'r': 0x30, 'l': 0x32, 'ḻ': 0x33, 'v': 0x35,
+    'ś': 0x36, 'ṣ': 0x37, 's': 0x38, 'h': 0x39
+}
+
+# Candrabindu, anusvara, visarga, avagraha and digits: offset
+MARKS = {
+    'm̐': 0x01, 'ṃ': 0x02, 'ṁ': 0x02, 'ḥ': 0x03, "'": 0x3D,
+    **{str(digit): 0x66 + digit for digit in range(10)}
+}
+
+VIRAMA = 0x4D
+NUKTA = 0x3C
+
+# Dandas are shared by all the scripts
+PUNCTUATION = {'|': '।', '||': '॥'}
+
+# Nearest IAST spelling for letters a script does not have (e.g. Tamil has no
+# aspirated or voiced stops); applied repeatedly until the script has a letter
+FALLBACKS = {
+    'kh': 'k', 'g': 'k', 'gh': 'g', 'ch': 'c', 'jh': 'j',
+    'ṭh': 'ṭ', 'ḍ': 'ṭ', 'ḍh': 'ḍ', 'th': 't', 'd': 't', 'dh': 'd',
+    'ph': 'p', 'b': 'p', 'bh': 'b', 'v': 'b', 'ṣ': 'ś', 'ś': 's',
+    'ḻ': 'l', 'ṅ': 'n', 'ñ': 'n', 'ṇ': 'n',
+    'ṛ': 'ri', 'ṝ': 'rī', 'ḷ': 'li', 'ḹ': 'lī', 'm̐': 'ṃ'
+}
+
+# Script-specific characters with no ISCII offset: (kind, IAST)
+EXTRA_CHARACTERS = {
+    Script.GURMUKHI: {
+        'ੰ': ('mark', 'ṃ'),  # tippi
+        'ੱ': ('skip', ''),  # addak
+    },
+    Script.MALAYALAM: {
+        # Chillu letters: consonants without an inherent vowel
+        'ൺ': ('mark', 'ṇ'), 'ൻ': ('mark', 'n'), 'ർ': ('mark', 'r'),
+        'ൽ': ('mark', 'l'), 'ൾ': ('mark', 'ḻ'), 'ൿ': ('mark', 'k'),
+    },
+}
+
+class Letter(NamedTuple):
+    """One output unit of IAST-to-script conversion."""
+    kind: str  # 'consonant', 'vowel' or 'mark'
+    letter: str  # Consonant, independent vowel or mark
+    sign: str = ''  # Dependent vowel sign ('' for the inherent 'a')
+
+class Transliterator:
+    """Converts between IAST and one Brahmic script in a single pass.
+
+    IAST is read with longest-match tokenization over a table of every IAST
+    token (so 'kh' wins over 'k' + 'h' and 'ai' over 'a' + 'i'); consonant
+    clusters get viramas and vowels after consonants become vowel signs.
+    The reverse direction reads one script character at a time, looking
+    ahead for a vowel sign or virama to decide on the inherent 'a'.
+    """
+
+    def __init__(self, script: Script):
+        """Build the conversion tables for a script.
+
+        Args:
+            script: One of BRAHMIC_SCRIPTS
+        """
+        if script not in BRAHMIC_SCRIPTS:
+            raise ValueError(f"Transliteration is not supported for {script}")
+        self.script = script
+        self._base = ScriptUtils.SCRIPT_RANGES[script][0][0]
+        self.virama = chr(self._base + VIRAMA)
+
+        self._tokens = {}
+        for token in list(VOWELS) + list(CONSONANTS) + list(MARKS):
+            letters = self._resolve(token)
+            if letters is not None:
+                self._tokens[token] = letters
+        for token, danda in PUNCTUATION.items():
+            self._tokens[token] = [Letter('mark', danda)]
+        # Longest-match tokenizer: longer tokens are tried first, and any
+        # other character is a token of its own
+        self._tokenizer = re.compile(
+            '|'.join(re.escape(token) for token in sorted(self._tokens, key=len, reverse=True)) + '|.',
+            re.DOTALL
+        )
+
+        self._reverse = self._build_reverse_table()
+
+    def _char(self, offset: Optional[int]) -> Optional[str]:
+        """The script's character at a block offset, if Unicode assigns one."""
+        if offset is None:
+            return None
+        char = chr(self._base + offset)
+        return char if unicodedata.name(char, None) else None
+
+    def _native_letter(self, token: str) -> Optional[Letter]:
+        """The script's own letter for an IAST token, if it has one."""
+        if token in VOWELS:
+            letter_offset, sign_offset = VOWELS[token]
+            letter = self._char(letter_offset)
+            sign = self._char(sign_offset) if sign_offset is not None else ''
+            if letter and sign is not None:
+                return Letter('vowel', letter, sign)
+        elif token in CONSONANTS:
+            letter = self._char(CONSONANTS[token])
+            if letter:
+                return Letter('consonant', letter)
+        elif token in MARKS:
+            letter = self._char(MARKS[token])
+            if letter:
+                return Letter('mark', letter)
+        return None
+
+    def _resolve(self, token: str) -> Optional[List[Letter]]:
+        """Letters for an IAST token, falling back to the nearest spelling the script has."""
+        letter = self._native_letter(token)
+        if letter:
+            return [letter]
+        if token in FALLBACKS:
+            letters = []
+            for fallback in self._split(FALLBACKS[token]):
+                resolved = self._resolve(fallback)
+                if resolved is None:
+                    return None
+                letters.extend(resolved)
+            return letters
+        return None
+
+    @staticmethod
+    def _split(text: str) -> List[str]:
+        """Split a fallback spelling into IAST tokens."""
+        tokens = []
+        i = 0
+        while i < len(text):
+            length = 2 if text[i:i + 2] in VOWELS or text[i:i + 2] in CONSONANTS else 1
+            tokens.append(text[i:i + length])
+            i += length
+        return tokens
+
+    def _build_reverse_table(self) -> Dict[str, Tuple[str, str]]:
+        """Map each script character to (kind, IAST); the first IAST token for a character wins."""
+        reverse = {}
+        for token in VOWELS:
+            letter = self._native_letter(token)
+            if letter:
+                reverse.setdefault(letter.letter, ('vowel', token))
+                if letter.sign:
+                    reverse.setdefault(letter.sign, ('sign', token))
+        for token in CONSONANTS:
+            letter = self._native_letter(token)
+            if letter:
+                reverse.setdefault(letter.letter, ('consonant', token))
+        for token in MARKS:
+            letter = self._native_letter(token)
+            if letter:
+                reverse.setdefault(letter.letter, ('mark', token))
+        for token, danda in PUNCTUATION.items():
+            reverse[danda] = ('mark', token)
+
+        reverse[self.virama] = ('virama', '')
+        if self._char(NUKTA):
+            reverse[self._char(NUKTA)] = ('skip', '')
+        reverse.update(EXTRA_CHARACTERS.get(self.script, {}))
+        return reverse
+
+    def from_iast(self, text: str) -> str:
+        """Convert IAST text to the script.
+
+        Characters that are not IAST (spaces, punctuation, other letters)
+        are kept as they are.
+
+        Args:
+            text: Input text in IAST
+
+        Returns:
+            Text in the script
+        """
+        text = unicodedata.normalize('NFC', text.lower())
+        tokens = self._tokens
+        virama = self.virama
+        output = []
+        pending_virama = False  # Last output was a consonant without a vowel
+
+        for token in self._tokenizer.findall(text):
+            letters = tokens.get(token)
+            if letters is None:
+                if pending_virama:
+                    output.append(virama)
+                    pending_virama = False
+                output.append(token)
+                continue
+
+            for kind, letter, sign in letters:
+                if kind == 'consonant':
+                    if pending_virama:
+                        output.append(virama)
+                    output.append(letter)
+                    pending_virama = True
+                elif kind == 'vowel':
+                    if pending_virama:
+                        output.append(sign)
+                        pending_virama = False
+                    else:
+                        output.append(letter)
+                else:
+                    if pending_virama:
+                        output.append(virama)
+                        pending_virama = False
+                    output.append(letter)
+
+        if pending_virama:
+            output.append(virama)
+        return ''.join(output)
+
+    def to_iast(self, text: str) -> str:
+        """Convert text in the script to IAST.
+
+        Characters outside the script are kept as they are.
+
+        Args:
+            text: Input text in the script
+
+        Returns:
+            Text in IAST
+        """
+        reverse = self._reverse
+        output = []
+
+        i = 0
+        while i < len(text):
+            entry = reverse.get(text[i])
+            if entry is None:
+                output.append(text[i])
+                i += 1
+                continue
+
+            kind, iast = entry
+            i += 1
+            if kind != 'consonant':
+                # Stray viramas and nuktas produce nothing
+                output.append(iast)
+                continue
+
+            # The inherent 'a' is dropped before a virama and replaced by a vowel sign
+            while i < len(text) and reverse.get(text[i], ('',))[0] == 'skip':
+                i += 1
+            following = reverse.get(text[i]) if i < len(text) else None
+            if following and following[0] == 'sign':
+                output.append(iast + following[1])
+                i += 1
+            elif following and following[0] == 'virama':
+                output.append(iast)
+                i += 1
+            else:
+                output.append(iast + 'a')
+
+        return ''.join(output)
+
+@lru_cache(maxsize=None)
+def get_transliterator(script: Script) -> Transliterator:
+    """Shared transliterator for a script; tables are built once."""
+    return Transliterator(script)
+
+def transliterate(text: str, source: Script, target: Script) -> str:
+    """Transliterate text between IAST and the Brahmic scripts.
+
+    Conversions between two Brahmic scripts go through IAST.
+
+    Args:
+        text: Input text
+        source: Script of the text (IAST or one of BRAHMIC_SCRIPTS)
+        target: Script to convert to (IAST or one of BRAHMIC_SCRIPTS)
+
+    Returns:
+        Transliterated text
+    """
+    if source == target:
+        return text
+    if source != Script.IAST:
+        text = get_transliterator(source).to_iast(text)
+    if target != Script.IAST:
+        text = get_transliterator(target).from_iast(text)
+    return text
@@ -8,12 +8,15 @@ from pathlib import Path
 import sys
 import json
 import sqlite3
+import tempfile
+import threading
 
 # Add project root to Python path
 project_root = Path(__file__).resolve().parents[1]
 sys.path.append(str(project_root))
 
-from src.core.database import Database, DatabaseError
+from src.core.database import Database, DatabaseError, ConnectionPool, PoolConfig
+from data.scripts.init_db import init_database
 
 class TestDatabase(unittest.TestCase):
     def _clean_database(self, db_path: Path) -> None:
@@ -288,5 +291,185 @@ class TestDatabase(unittest.TestCase):
         )
         self.assertEqual(float(retrieved['confidence_score']), new_confidence)
 
+class TestBulkIngest(unittest.TestCase):
+    """Test cases for Database.add_words_bulk."""
+    
+    def setUp(self):
+        """Create a throwaway database with the full schema."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.db_path = Path(self.temp_dir.name) / 'test.db'
+        init_database(self.db_path)
+        self.db = Database(self.db_path)
+        self.addCleanup(self.db.close)
+        
+        self.reconciled = [
+            {
+                'word': 'மனிதன்',
+                'sanskrit_word': 'मनुष्य',
+                'language': 'tamil',
+                'confidence': 0.8,
+                'source_url': 'https://ta.wiktionary.org/wiki/மனிதன்',
+                'meanings': ['human']
+            },
+            {
+                'word': 'आकाश',
+                'sanskrit_word': 'आकाश',
+                'language': 'hindi',
+                'confidence': 0.9,
+                'source_url': 'https://hi.wiktionary.org/wiki/आकाश'
+            },
+            {
+                'word': 'ਧਰਮ',
+                'sanskrit_word': 'धर्म',
+                'language': 'punjabi',
+                'confidence': 0.75,
+                'source_url': 'https://pa.wiktionary.org/wiki/ਧਰਮ'
+            }
+        ]
+    
+    def _etymology_rows(self):
+        with self.db.get_connection() as conn:
+            return [dict(row) for row in conn.execute(
+                'SELECT word_id, sanskrit_root, confidence_score FROM etymologies'
+            )]
+    
+    def test_bulk_insert(self):
+        """Test that words and etymologies are written across chunks."""
+        ids = self.db.add_words_bulk(iter(self.reconciled), chunk_size=2)
+        
+        self.assertEqual(len(ids), 3)
+        word = self.db.get_word_by_text('மனிதன்', 'tamil')
+        self.assertEqual(word['id'], ids[('மனிதன்', 'tamil')])
+        self.assertEqual(word['sanskrit_root'], 'मनुष्य')
+        self.assertEqual(word['meaning'], 'human')
+        self.assertEqual(word['script'], 'tamil')
+        self.assertEqual(self.db.get_word_by_text('ਧਰਮ', 'punjabi')['script'], 'gurmukhi')
+        self.assertEqual(len(self._etymology_rows()), 3)
+    
+    def test_bulk_upsert(self):
+        """Test that re-ingesting updates rows instead of duplicating them."""
+        first_ids = self.db.add_words_bulk(self.reconciled)
+        
+        updated = dict(self.reconciled[1], confidence=0.95, meaning='sky')
+        second_ids = self.db.add_words_bulk([updated])
+        
+        self.assertEqual(second_ids[('आकाश', 'hindi')], first_ids[('आकाश', 'hindi')])
+        word = self.db.get_word_by_text('आकाश', 'hindi')
+        self.assertEqual(word['meaning'], 'sky')
+        self.assertAlmostEqual(word['confidence_score'], 0.95)
+        
+        etymologies = self._etymology_rows()
+        self.assertEqual(len(etymologies), 3)
+        self.assertIn(0.95, [row['confidence_score'] for row in etymologies])
+    
+    def test_malformed_entries_skipped(self):
+        """Test that entries missing required fields are skipped."""
+        ids = self.db.add_words_bulk(self.reconciled + [{'word': 'x'}])
+        self.assertEqual(len(ids), 3)
+
+class TestConnectionPool(unittest.TestCase):
+    """Test cases for the pooled connection layer."""
+    
+    def setUp(self):
+        """Create a throwaway database with the full schema."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.db_path = Path(self.temp_dir.name) / 'test.db'
+        init_database(self.db_path)
+    
+    def test_connections_are_reused(self):
+        """Test that sequential calls reuse a single pooled connection."""
+        db = Database(self.db_path)
+        self.addCleanup(db.close)
+        
+        word_id = db.add_word('ராஜா', 'tamil', 'tamil', 'raja', 'king')
+        db.add_etymology(word_id, 'राज')
+        self.assertIsNotNone(db.get_word_by_text('ராஜா', 'tamil'))
+        
+        stats = db.get_pool_stats()
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['open_connections'], 1)
+    
+    def test_pragmas_applied(self):
+        """Test that WAL and the tuning pragmas are set on pooled connections."""
+        db = Database(self.db_path, pool_config=PoolConfig(cache_size=-2000))
+        self.addCleanup(db.close)
+        
+        with db.get_connection() as conn:
+            self.assertEqual(conn.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+            self.assertEqual(conn.execute('PRAGMA synchronous').fetchone()[0], 1)  # NORMAL
+            self.assertEqual(conn.execute('PRAGMA cache_size').fetchone()[0], -2000)
+            self.assertEqual(conn.execute('PRAGMA foreign_keys').fetchone()[0], 1)
+    
+    def test_uncommitted_work_rolled_back_on_release(self):
+        """Test that a released connection never carries an open transaction."""
+        db = Database(self.db_path)
+        self.addCleanup(db.close)
+        
+        with db.get_connection() as conn:
+            conn.execute(
+                "INSERT INTO words (word, language, script, romanized) VALUES ('x', 'hindi', 'devanagari', 'x')"
+            )
+        
+        self.assertIsNone(db.get_word_by_text('x', 'hindi'))
+    
+    def test_bounded_pool_times_out(self):
+        """Test that an exhausted shared pool raises instead of growing."""
+        pool = ConnectionPool(self.db_path, PoolConfig(max_connections=1, timeout=0.05))
+        self.addCleanup(pool.close)
+        
+        conn = pool.acquire()
+        with self.assertRaises(DatabaseError):
+            pool.acquire()
+        pool.release(conn)
+        
+        self.assertIs(pool.acquire(), conn)
+        self.assertEqual(pool.stats()['waits'], 1)
+    
+    def test_per_thread_connections(self):
+        """Test that per-thread mode pins one connection to each thread."""
+        pool = ConnectionPool(self.db_path, PoolConfig(per_thread=True))
+        self.addCleanup(pool.close)
+        
+        main_conn = pool.acquire()
+        self.assertIs(pool.acquire(), main_conn)
+        
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(pool.acquire()))
+        thread.start()
+        thread.join()
+        
+        self.assertIsNot(seen[0], main_conn)
+        self.assertEqual(pool.stats()['misses'], 2)
+        self.assertEqual(pool.stats()['hits'], 1)
+    
+    def test_exited_thread_connections_closed(self):
+        """Test that connections of exited threads are closed instead of leaked."""
+        pool = ConnectionPool(self.db_path, PoolConfig(per_thread=True))
+        self.addCleanup(pool.close)
+        
+        seen = []
+        for _ in range(5):
+            thread = threading.Thread(target=lambda: seen.append(pool.acquire()))
+            thread.start()
+            thread.join()
+        # Only the last thread's connection is still waiting to be reaped
+        self.assertEqual(pool.stats()['open_connections'], 1)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            seen[0].execute('SELECT 1')
+        
+        pool.acquire()
+        self.assertEqual(pool.stats()['open_connections'], 1)
+        with self.assertRaises(sqlite3.ProgrammingError):
+            seen[-1].execute('SELECT 1')
+    
+    def test_pool_disabled(self):
+        """Test that pooling can be switched off."""
+        db = Database(self.db_path, use_pool=False)
+        db.add_word('देव', 'hindi', 'devanagari', 'deva')
+        self.assertEqual(db.get_pool_stats(), {})
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,131 @@
+"""
+Test suite for dictionary lookups.
+Tests SQLite lookups and the preloaded in-memory lexicon index.
+"""
+
+import unittest
+from pathlib import Path
+import sys
+import os
+import sqlite3
+import tempfile
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.append(str(project_root))
+
+from src.data.dict_handler import DictionaryHandler, DictionaryEntry
+
+class TestDictionaryHandler(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.db_path = str(Path(temp_dir.name) / 'dict.db')
+
+        handler = DictionaryHandler(self.db_path)
+        handler.add_entry(DictionaryEntry('धर्म', 'धृ', 'duty (apte)', 'apte'), 'devanagari')
+        handler.add_entry(DictionaryEntry('धर्म', 'धृ', 'duty (mw)', 'monier_williams'), 'devanagari')
+        handler.add_entry(DictionaryEntry('धर्म', 'धृ', 'duty (other)', 'blog'), 'devanagari')
+        handler.add_entry(DictionaryEntry('கர்மம்', 'कृ', 'action', 'shabdanjali'), 'tamil')
+
+    def test_lookup_prefers_reliable_source(self):
+        """Test that SQLite and index lookups pick the same best entry."""
+        for preload in (False, True):
+            handler = DictionaryHandler(self.db_path, preload=preload)
+            entry = handler.lookup_word('धर्म', 'devanagari')
+            self.assertEqual(entry.source, 'monier_williams')
+            self.assertEqual(entry.meaning, 'duty (mw)')
+            self.assertEqual(handler.lookup_word('கர்மம்', 'tamil').sanskrit_root, 'कृ')
+            self.assertIsNone(handler.lookup_word('धर्म', 'tamil'))
+            self.assertIsNone(handler.lookup_word('नहीं', 'devanagari'))
+
+    def test_lookup_words(self):
+        """Test batched lookups against both the database and the index."""
+        words = ['धर्म', 'नहीं', 'धर्म', 'कर्म']
+        for preload in (False, True):
+            handler = DictionaryHandler(self.db_path, preload=preload)
+            entries = handler.lookup_words(words, 'devanagari')
+            self.assertEqual(set(entries), {'धर्म'})
+            self.assertEqual(entries['धर्म'].source, 'monier_williams')
+            self.assertEqual(handler.lookup_words([], 'devanagari'), {})
+
+    def test_lookup_words_large_batch(self):
+        """Test that batches larger than one query's parameter limit are split."""
+        handler = DictionaryHandler(self.db_path)
+        words = [f'शब्द{i}' for i in range(DictionaryHandler.LOOKUP_BATCH_SIZE * 2)] + ['धर्म']
+        entries = handler.lookup_words(words, 'devanagari')
+        self.assertEqual(list(entries), ['धर्म'])
+
+    def test_iast_lookup_transliterated(self):
+        """Test that words typed in IAST are looked up in the requested script."""
+        DictionaryHandler(self.db_path).add_entry(DictionaryEntry('कृष्ण', 'कृष्', 'black', 'apte'), 'devanagari')
+        for preload in (False, True):
+            handler = DictionaryHandler(self.db_path, preload=preload)
+            self.assertEqual(handler.lookup_word('Kṛṣṇa', 'devanagari').sanskrit_root, 'कृष्')
+            self.assertEqual(set(handler.lookup_words(['kṛṣṇa', 'धर्म'], 'devanagari')), {'kṛṣṇa', 'धर्म'})
+            self.assertIsNone(handler.lookup_word('kṛṣṇa', 'latin'))
+
+    def test_plain_latin_words_not_transliterated(self):
+        """Test that English words and words IAST cannot spell keep their own key."""
+        for word, key in [('the', 'the'), ('Dharma', 'dharma'), ('what', 'what'),
+                          ('hello!', 'hello!'), ('kṛṣṇa!', 'kṛṣṇa!'), ('wṛ', 'wṛ'), ('१२', '१२')]:
+            self.assertEqual(DictionaryHandler.normalize_word(word, 'devanagari'), key)
+        self.assertEqual(DictionaryHandler.normalize_word('Saṃskṛtam', 'devanagari'), 'संस्कृतम्')
+
+    def test_index_statistics(self):
+        """Test that the index reports its size, footprint and load time."""
+        self.assertIsNone(DictionaryHandler(self.db_path).get_index_statistics())
+
+        stats = DictionaryHandler(self.db_path, preload=True).get_index_statistics()
+        self.assertEqual(stats['entries'], 2)
+        self.assertGreater(stats['memory_bytes'], 0)
+        self.assertGreaterEqual(stats['load_time_ms'], 0)
+
+    def test_index_sees_own_writes(self):
+        """Test that add_entry updates a preloaded index immediately."""
+        handler = DictionaryHandler(self.db_path, preload=True)
+        handler.add_entry(DictionaryEntry('कर्म', 'कृ', 'action', 'cologne'), 'devanagari')
+        handler.add_entry(DictionaryEntry('धर्म', 'धृ', 'law', 'indowordnet'), 'devanagari')
+
+        self.assertEqual(handler.lookup_word('कर्म', 'devanagari').source, 'cologne')
+        self.assertEqual(handler.lookup_word('धर्म', 'devanagari').source, 'monier_williams')
+
+    def test_index_writes_in_place(self):
+        """Test that writes update the index without copying it."""
+        handler = DictionaryHandler(self.db_path, preload=True)
+        entries = handler._index._entries
+        for i in range(100):
+            handler.add_entry(DictionaryEntry(f'शब्द{i}', 'शब्द्', 'word', 'apte'), 'devanagari')
+
+        self.assertIs(handler._index._entries, entries)
+        self.assertEqual(handler.get_index_statistics()['entries'], 102)
+
+    def test_own_writes_do_not_reload(self):
+        """Test that a write through the handler updates the index without a full reload."""
+        handler = DictionaryHandler(self.db_path, preload=True, refresh_interval=0)
+        reloads = []
+        handler.add_reload_listener(lambda: reloads.append(True))
+        loaded_at = handler._index.loaded_at
+
+        handler.add_entry(DictionaryEntry('कर्म', 'कृ', 'action', 'cologne'), 'devanagari')
+        self.assertEqual(handler.lookup_word('कर्म', 'devanagari').meaning, 'action')
+        self.assertEqual(reloads, [])
+        self.assertEqual(handler._index.loaded_at, loaded_at)
+
+    def test_index_refreshes_when_file_changes(self):
+        """Test that the index reloads after another writer changes the database."""
+        handler = DictionaryHandler(self.db_path, preload=True, refresh_interval=0)
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "INSERT INTO dictionary_entries VALUES ('योग', 'युज्', 'union', 'apte', 'devanagari')"
+        )
+        conn.commit()
+        conn.close()
+        # Make sure the change is visible even on coarse mtime filesystems
+        os.utime(self.db_path, ns=(0, os.stat(self.db_path).st_mtime_ns + 1_000_000))
+
+        self.assertEqual(handler.lookup_word('योग', 'devanagari').meaning, 'union')
+
+if __name__ == '__main__':
+    unittest.main()
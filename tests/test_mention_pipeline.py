@@ -0,0 +1,158 @@
+"""
+Test suite for the mention pipeline.
+Uses plain callables in place of the response generator and the Twitter API.
+"""
+
+import unittest
+from pathlib import Path
+import sys
+import threading
+import time
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.append(str(project_root))
+
+from src.bot.mention_pipeline import MentionPipeline
+
+def make_mentions(count):
+    return [{'id': str(i), 'text': f"@bot mention {i}"} for i in range(count)]
+
+class TestMentionPipeline(unittest.TestCase):
+    def setUp(self):
+        self.posted = []
+        self.lock = threading.Lock()
+
+    def post(self, tweet_id, text):
+        with self.lock:
+            self.posted.append((tweet_id, text))
+        return {'data': {'id': f"reply-{tweet_id}"}}
+
+    def test_replies_to_every_mention(self):
+        """Test that every mention goes through both stages in order."""
+        pipeline = MentionPipeline(respond=lambda mention: mention['text'].upper(), post=self.post)
+        pipeline.start()
+        pipeline.submit(make_mentions(5), poll_time=0.01)
+        pipeline.stop(timeout=5)
+
+        self.assertEqual(self.posted, [(str(i), f"@BOT MENTION {i}") for i in range(5)])
+        stats = pipeline.get_statistics()
+        self.assertEqual(stats['poll']['processed'], 1)
+        self.assertEqual(stats['respond']['processed'], 5)
+        self.assertEqual(stats['post']['processed'], 5)
+        self.assertEqual(stats['end_to_end']['failed'], 0)
+        self.assertEqual(stats['queues'], {'mentions': 0, 'replies': 0})
+
+    def test_slow_post_does_not_block_responses(self):
+        """Test that responses keep being generated while a reply is being posted."""
+        release = threading.Event()
+        responded = threading.Semaphore(0)
+
+        def respond(mention):
+            responded.release()
+            return mention['text']
+
+        def post(tweet_id, text):
+            release.wait(5)
+            return self.post(tweet_id, text)
+
+        pipeline = MentionPipeline(respond=respond, post=post)
+        pipeline.start()
+        pipeline.submit(make_mentions(3))
+        for _ in range(3):
+            self.assertTrue(responded.acquire(timeout=5))
+        self.assertEqual(self.posted, [])
+
+        release.set()
+        pipeline.stop(timeout=5)
+        self.assertEqual(len(self.posted), 3)
+
+    def test_bounded_queues_apply_backpressure(self):
+        """Test that submit blocks once the mention queue is full."""
+        release = threading.Event()
+
+        def respond(mention):
+            release.wait(5)
+            return mention['text']
+
+        pipeline = MentionPipeline(respond=respond, post=self.post,
+                                   mention_queue_size=2, reply_queue_size=1)
+        pipeline.start()
+        submitter = threading.Thread(target=pipeline.submit, args=(make_mentions(6),))
+        submitter.start()
+        time.sleep(0.2)
+        # One mention is held by the worker, two wait in the queue
+        self.assertTrue(submitter.is_alive())
+        self.assertEqual(pipeline.queue_depths()['mentions'], 2)
+
+        release.set()
+        submitter.join(5)
+        pipeline.stop(timeout=5)
+        self.assertEqual(len(self.posted), 6)
+
+    def test_failures_are_counted(self):
+        """Test that failing stages are logged and skipped, not fatal."""
+        def respond(mention):
+            if mention['id'] == '0':
+                raise RuntimeError("model failed")
+            if mention['id'] == '1':
+                return None
+            return mention['text']
+
+        def post(tweet_id, text):
+            return None if tweet_id == '2' else self.post(tweet_id, text)
+
+        pipeline = MentionPipeline(respond=respond, post=post, response_workers=2)
+        pipeline.start()
+        pipeline.submit(make_mentions(4))
+        pipeline.stop(timeout=5)
+
+        stats = pipeline.get_statistics()
+        self.assertEqual(stats['respond']['failed'], 2)
+        self.assertEqual(stats['post']['processed'], 2)
+        self.assertEqual(stats['post']['failed'], 1)
+        self.assertEqual(self.posted, [('3', "@bot mention 3")])
+
+    def test_done_callback(self):
+        """Test that on_done is called for every mention, answered or not."""
+        done = []
+
+        def respond(mention):
+            return None if mention['id'] == '1' else mention['text']
+
+        def post(tweet_id, text):
+            return None if tweet_id == '2' else self.post(tweet_id, text)
+
+        def on_done(mention):
+            with self.lock:
+                done.append(mention['id'])
+
+        pipeline = MentionPipeline(respond=respond, post=post, on_done=on_done)
+        pipeline.start()
+        pipeline.submit(make_mentions(2))
+        pipeline.requeue(make_mentions(4)[2:])
+        pipeline.stop(timeout=5)
+
+        self.assertEqual(sorted(done), ['0', '1', '2', '3'])
+        self.assertEqual(pipeline.get_statistics()['poll']['processed'], 1)
+
+    def test_reply_interval(self):
+        """Test that replies are spaced out by the posting stage."""
+        times = []
+
+        def post(tweet_id, text):
+            times.append(time.perf_counter())
+            return {}
+
+        pipeline = MentionPipeline(respond=lambda mention: mention['text'], post=post,
+                                   reply_interval=0.1)
+        pipeline.start()
+        pipeline.submit(make_mentions(3))
+        pipeline.stop(timeout=5)
+
+        self.assertEqual(len(times), 3)
+        for earlier, later in zip(times, times[1:]):
+            self.assertGreaterEqual(later - earlier, 0.09)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Test suite for the adaptive polling scheduler.
+"""
+
+import json
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+import sys
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.append(str(project_root))
+
+from src.bot.poll_scheduler import PollScheduler
+from src.bot.quota_tracker import QuotaTracker
+from src.bot.state_store import BotStateStore
+
+# Ten days before the end of a 30-day month
+NOW = datetime(2024, 6, 21, tzinfo=timezone.utc)
+TEN_DAYS = 10 * 24 * 60 * 60
+MENTIONS = 'GET /users/:id/mentions'
+
+class TestPollScheduler(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.dir = Path(temp_dir.name)
+        self.quota = self.make_quota(100)
+        self.state = {}
+        self.scheduler = PollScheduler(self.state, self.quota, min_interval=60)
+
+    def make_quota(self, max_reads):
+        store = BotStateStore(self.dir / f"bot_state_{max_reads}.db")
+        self.addCleanup(store.close)
+        return QuotaTracker(store, max_reads=max_reads, max_writes=500)
+
+    def poll(self, mentions_found, now=NOW, scheduler=None, quota=None):
+        """Spend a read on a poll, as TwitterBot does."""
+        (quota or self.quota).record(MENTIONS, 'reads', now)
+        (scheduler or self.scheduler).record_poll(mentions_found, now)
+
+    def test_budget_spread_over_month(self):
+        """Test that the reads left are spread over the time left."""
+        self.assertAlmostEqual(self.scheduler.next_interval(NOW), TEN_DAYS / 100)
+        for _ in range(50):
+            self.poll(1)
+        self.assertEqual(self.scheduler.reads_left(NOW), 50)
+        self.assertAlmostEqual(self.scheduler.base_interval(NOW), TEN_DAYS / 50)
+
+    def test_reads_come_from_quota(self):
+        """Test that reads are counted once, by the quota tracker."""
+        # A poll the bot dropped before sending spends nothing
+        self.scheduler.record_poll(0, NOW)
+        self.assertEqual(self.scheduler.reads_left(NOW), 100)
+
+        # Reads made outside polling are part of the same budget
+        self.quota.record('GET /users/me', 'reads', NOW)
+        self.assertEqual(self.scheduler.reads_left(NOW), 99)
+        self.assertAlmostEqual(self.scheduler.base_interval(NOW), TEN_DAYS / 99)
+
+    def test_burst_after_mentions(self):
+        """Test that polls speed up after mentions, then back off when quiet."""
+        self.poll(2)
+        base = self.scheduler.base_interval(NOW)
+        for _ in range(3):
+            self.assertAlmostEqual(self.scheduler.next_interval(NOW), base * 0.25)
+            self.poll(0)
+            base = self.scheduler.base_interval(NOW)
+
+        intervals = []
+        for _ in range(4):
+            self.poll(0)
+            intervals.append(self.scheduler.next_interval(NOW) / self.scheduler.base_interval(NOW))
+        self.assertEqual([round(i, 6) for i in intervals], [2, 4, 4, 4])
+
+        self.poll(1)
+        self.assertAlmostEqual(self.scheduler.next_interval(NOW), self.scheduler.base_interval(NOW) * 0.25)
+
+    def test_min_interval(self):
+        """Test that bursts never poll faster than min_interval."""
+        scheduler = PollScheduler({}, self.make_quota(100000), min_interval=60)
+        scheduler.record_poll(1, NOW)
+        self.assertEqual(scheduler.next_interval(NOW), 60)
+
+    def test_exhausted_budget_waits_for_reset(self):
+        """Test that no poll is planned before the monthly reset once the budget is spent."""
+        for _ in range(100):
+            self.poll(0)
+        self.assertEqual(self.scheduler.reads_left(NOW), 0)
+        self.assertEqual(self.scheduler.next_interval(NOW), TEN_DAYS + 1)
+
+        next_month = NOW + timedelta(days=10)
+        self.assertEqual(self.scheduler.reads_left(next_month), 100)
+        self.scheduler.next_interval(next_month)
+        self.assertEqual(self.state['poll_schedule']['month'], '2024-07')
+        self.assertEqual(self.state['poll_schedule']['idle_polls'], 0)
+
+    def test_backoff_never_passes_reset(self):
+        """Test that a quiet backoff does not skip the start of the next month."""
+        near_end = datetime(2024, 12, 31, 23, 0, tzinfo=timezone.utc)
+        quota = self.make_quota(2)
+        scheduler = PollScheduler({}, quota, min_interval=60)
+        self.poll(0, near_end, scheduler, quota)
+        self.assertEqual(scheduler.next_interval(near_end), 60 * 60 + 1)
+
+    def test_accounting_persists_in_state(self):
+        """Test that a scheduler built from saved state continues the burst."""
+        self.poll(1)
+        self.poll(0)
+        saved = json.loads(json.dumps(self.state))
+
+        restored = PollScheduler(saved, self.quota)
+        self.assertEqual(restored.reads_left(NOW), 98)
+        self.assertEqual(restored.schedule['burst_polls_left'], 2)
+        self.assertAlmostEqual(restored.next_interval(NOW), self.scheduler.next_interval(NOW))
+
+if __name__ == '__main__':
+    unittest.main()
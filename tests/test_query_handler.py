@@ -0,0 +1,97 @@
+"""
+Test suite for query parsing.
+Checks the combined query matcher against the per-pattern matcher it replaced.
+"""
+
+import unittest
+from pathlib import Path
+import re
+import sys
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.append(str(project_root))
+
+from src.bot.query_handler import QueryHandler
+
+SAMPLE_TWEETS = [
+    "@sanskrit_bot what is dharma?",
+    "@sanskrit_bot What's karma meaning?",
+    "@sanskrit_bot what is the meaning of yoga",
+    "@sanskrit_bot etymology of vidya?",
+    "@sanskrit_bot Etymology of guru",
+    "@sanskrit_bot etymology of what is it",
+    "@sanskrit_bot what is etymology of mantra?",
+    "@sanskrit_bot tell me about ahimsa",
+    "@sanskrit_bot what is\nthe origin of  atman?",
+    "first line\nwhat is moksha means",
+    "@sanskrit_bot धर्म का अर्थ क्या है",
+    "@sanskrit_bot धर्म का मतलब क्या है? what is dharma",
+    "@sanskrit_bot विद्या की उत्पत्ति",
+    "@sanskrit_bot ধর্ম মানে কি",
+    "@sanskrit_bot বিদ্যা এর উৎপত্তি",
+    "@sanskrit_bot ధర్మం అర్ధం ఏమిటి",
+    "@sanskrit_bot அன்பு பொருள் என்ன",
+    "@sanskrit_bot தர்மம் சொற்பிறப்பு",
+    "@sanskrit_bot ધર્મ અર્થ શું છે",
+    "@sanskrit_bot ಧರ್ಮ ಅರ್ಥ ಏನು",
+    "@sanskrit_bot ധർമ്മം അർത്ഥം എന്താണ്",
+    "@sanskrit_bot ਧਰਮ ਦਾ ਅਰਥ ਕੀ ਹੈ",
+    "@sanskrit_bot ଧର୍ମ ଅର୍ଥ କଣ",
+    "@sanskrit_bot ଧର୍ମ ର ଉତ୍ପତ୍ତି",
+    "",
+    "   ",
+    "what is",
+    "what is ?",
+]
+
+SCRIPT_TYPES = ['latin', 'en', 'devanagari', 'hi', 'bn', 'ta', 'or', 'unknown']
+
+def legacy_identify_query_type(query_patterns, text, script_type):
+    """The matcher _identify_query_type used before patterns were combined."""
+    text = text.lower().strip()
+    for query_type, patterns in query_patterns.items():
+        if script_type in patterns:
+            match = re.search(patterns[script_type], text)
+            if match:
+                return query_type, match.group(1).strip()
+        match = re.search(patterns['en'], text)
+        if match:
+            return query_type, match.group(1).strip()
+    return 'word_lookup', None
+
+class TestQueryMatcher(unittest.TestCase):
+    def setUp(self):
+        self.handler = QueryHandler()
+
+    def test_matches_legacy_matcher(self):
+        """Test that the combined matcher returns what the per-pattern searches did."""
+        for text in SAMPLE_TWEETS:
+            for script_type in SCRIPT_TYPES:
+                with self.subTest(text=text, script_type=script_type):
+                    self.assertEqual(
+                        self.handler._identify_query_type(text, script_type),
+                        legacy_identify_query_type(self.handler.query_patterns, text, script_type)
+                    )
+
+    def test_query_types(self):
+        """Test query type and target extraction."""
+        self.assertEqual(
+            self.handler._identify_query_type("@bot what is dharma?", 'latin'),
+            ('word_lookup', 'dharma')
+        )
+        self.assertEqual(
+            self.handler._identify_query_type("@bot etymology of guru", 'latin'),
+            ('etymology', 'guru')
+        )
+        self.assertEqual(
+            self.handler._identify_query_type("@bot विद्या की उत्पत्ति", 'hi'),
+            ('etymology', '@bot विद्या')
+        )
+        self.assertEqual(
+            self.handler._identify_query_type("@bot tell me about ahimsa", 'latin'),
+            ('word_lookup', None)
+        )
+
+if __name__ == '__main__':
+    unittest.main()
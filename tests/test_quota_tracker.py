@@ -0,0 +1,124 @@
+"""
+Test suite for API quota accounting and header-based rate limiting.
+"""
+
+import tempfile
+import time
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+import sys
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.append(str(project_root))
+
+from src.bot.quota_tracker import QuotaTracker
+from src.bot.state_store import BotStateStore
+
+MENTIONS = 'GET /users/:id/mentions'
+TWEETS = 'POST /tweets'
+
+class TestQuotaTracker(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.db_path = Path(temp_dir.name) / 'bot_state.db'
+        self.store = BotStateStore(self.db_path)
+        self.addCleanup(self.store.close)
+        self.quota = QuotaTracker(self.store, max_reads=100, max_writes=500)
+
+    def restart(self):
+        self.store.close()
+        self.store = BotStateStore(self.db_path)
+        self.quota = QuotaTracker(self.store, max_reads=100, max_writes=500)
+
+    def test_endpoint_key(self):
+        """Test that IDs and query strings are dropped from endpoint names."""
+        self.assertEqual(QuotaTracker.endpoint_key(
+            'GET', 'https://api.twitter.com/2/users/1234/mentions?since_id=99'), MENTIONS)
+        self.assertEqual(QuotaTracker.endpoint_key('POST', 'https://api.twitter.com/2/tweets'), TWEETS)
+
+    def test_counters_persist_per_month(self):
+        """Test that usage survives restarts and starts from zero each month."""
+        june = datetime(2024, 6, 10, tzinfo=timezone.utc)
+        july = datetime(2024, 7, 1, tzinfo=timezone.utc)
+        for _ in range(3):
+            self.quota.record(MENTIONS, 'reads', june)
+        self.assertEqual(self.quota.record(TWEETS, 'writes', june), 1)
+
+        self.restart()
+        self.assertEqual(self.quota.used('reads', june), 3)
+        self.assertEqual(self.quota.remaining('reads', june), 97)
+        self.assertEqual(self.quota.used('writes', june), 1)
+        self.assertEqual(self.quota.used('reads', july), 0)
+
+    def test_usage_history(self):
+        """Test per-endpoint daily usage."""
+        self.quota.record(MENTIONS, 'reads', datetime(2024, 6, 9, tzinfo=timezone.utc))
+        self.quota.record(MENTIONS, 'reads', datetime(2024, 6, 10, tzinfo=timezone.utc))
+        self.quota.record(MENTIONS, 'reads', datetime(2024, 6, 10, 12, tzinfo=timezone.utc))
+        self.quota.record(TWEETS, 'writes', datetime(2024, 6, 10, tzinfo=timezone.utc))
+
+        history = self.quota.history(days=1, now=datetime(2024, 6, 10, 23, tzinfo=timezone.utc))
+        self.assertEqual(history, [
+            {'day': '2024-06-10', 'endpoint': MENTIONS, 'kind': 'reads', 'count': 2},
+            {'day': '2024-06-10', 'endpoint': TWEETS, 'kind': 'writes', 'count': 1},
+        ])
+        self.assertEqual(len(self.quota.history(days=30, now=datetime(2024, 6, 10, tzinfo=timezone.utc))), 3)
+
+    def test_projected_exhaustion(self):
+        """Test the exhaustion date projected from this month's rate of use."""
+        now = datetime(2024, 6, 6, tzinfo=timezone.utc)
+        self.assertIsNone(self.quota.projected_exhaustion('reads', now))
+
+        # 25 reads in 5 days: the other 75 last 15 more days
+        for _ in range(25):
+            self.quota.record(MENTIONS, 'reads', now)
+        self.assertEqual(self.quota.projected_exhaustion('reads', now), datetime(2024, 6, 21, tzinfo=timezone.utc))
+
+        # 5 writes in 5 days last well past the reset
+        for _ in range(5):
+            self.quota.record(TWEETS, 'writes', now)
+        self.assertIsNone(self.quota.projected_exhaustion('writes', now))
+
+        for _ in range(75):
+            self.quota.record(MENTIONS, 'reads', now)
+        self.assertEqual(self.quota.projected_exhaustion('reads', now), now)
+
+    def test_learns_rate_limit_from_headers(self):
+        """Test that an exhausted window blocks requests until it resets."""
+        reset_at = time.time() + 600
+        self.quota.update_rate_limits(TWEETS, {
+            'x-rate-limit-limit': '200', 'x-rate-limit-remaining': '150', 'x-rate-limit-reset': str(int(reset_at)),
+            'x-user-limit-24hour-limit': '17', 'x-user-limit-24hour-remaining': '2',
+            'x-user-limit-24hour-reset': str(int(reset_at + 3600)),
+        })
+
+        # Counted down locally between responses
+        self.assertEqual(self.quota.acquire(TWEETS), 0)
+        self.assertEqual(self.quota.acquire(TWEETS), 0)
+        self.assertAlmostEqual(self.quota.acquire(TWEETS), reset_at + 3600 - time.time(), delta=2)
+        self.assertEqual(self.quota.acquire(MENTIONS), 0)
+
+    def test_expired_and_malformed_windows(self):
+        """Test that expired windows and malformed headers do not block requests."""
+        self.quota.update_rate_limits(MENTIONS, {
+            'x-rate-limit-remaining': '0', 'x-rate-limit-reset': str(int(time.time() - 1))
+        })
+        self.assertEqual(self.quota.acquire(MENTIONS), 0)
+
+        self.quota.update_rate_limits(TWEETS, {'x-rate-limit-remaining': 'n/a', 'x-rate-limit-reset': '0'})
+        self.assertEqual(self.quota.acquire(TWEETS), 0)
+
+    def test_rate_limits_persist(self):
+        """Test that a restart still knows an exhausted window."""
+        self.quota.update_rate_limits(MENTIONS, {
+            'x-rate-limit-limit': '10', 'x-rate-limit-remaining': '0',
+            'x-rate-limit-reset': str(int(time.time() + 900))
+        })
+        self.restart()
+        self.assertGreater(self.quota.acquire(MENTIONS), 800)
+
+if __name__ == '__main__':
+    unittest.main()
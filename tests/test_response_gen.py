@@ -0,0 +1,280 @@
+"""
+Test suite for loanword resolution in the response generator.
+Uses a temporary dictionary and a stub model in place of IndicBERT.
+"""
+
+import os
+import sqlite3
+import unittest
+from pathlib import Path
+import sys
+import tempfile
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.append(str(project_root))
+
+from src.bot.response_gen import ResponseGenerator, LoanwordInfo
+from src.bot.word_cache import WordInfoCache
+from src.data.dict_handler import DictionaryHandler, DictionaryEntry
+
+class StubModel:
+    """Stands in for IndicBertHandler, knowing a single word and one loanword without a label."""
+
+    def __init__(self):
+        self.predicted = []
+        self.failing = False
+
+    def predict(self, word, script_type):
+        self.predicted.append(word)
+        if self.failing:
+            # What IndicBertHandler returns when inference raises
+            return None, None, 0.0, False
+        if word == 'कर्म':
+            return 'कृ', 'action', 0.9, False
+        if word == 'ज्ञान':
+            # Positive class, but missing from the labels file
+            return None, None, 0.8, False
+        return None, None, 0.2, True
+
+    def predict_batch(self, words, script_type):
+        return [self.predict(word, script_type) for word in words]
+
+class TestWordResolution(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+
+        self.dict_handler = DictionaryHandler(str(Path(temp_dir.name) / 'dict.db'), preload=True)
+        self.dict_handler.add_entry(DictionaryEntry('धर्म', 'धृ', 'duty', 'apte'), 'devanagari')
+
+        with patch('src.data.dict_handler.DictionaryHandler', return_value=self.dict_handler):
+            self.generator = ResponseGenerator()
+        self.generator.model = StubModel()
+
+    def test_dictionary_hit_skips_model(self):
+        """Test that words found in the dictionary never reach the model."""
+        info = self.generator._get_word_info('धर्म', 'devanagari')
+
+        self.assertEqual((info.sanskrit_root, info.confidence), ('धृ', 1.0))
+        self.assertEqual(self.generator.model.predicted, [])
+
+    def test_tiers_record_hits(self):
+        """Test that each tier records its lookups and hits."""
+        self.generator._get_word_info('कर्म', 'devanagari')
+        self.generator._get_word_info('कर्म', 'devanagari')
+
+        stats = self.generator.get_tier_statistics()
+        self.assertEqual((stats['cache']['hits'], stats['cache']['lookups']), (1, 2))
+        self.assertEqual((stats['dictionary']['hits'], stats['dictionary']['lookups']), (0, 1))
+        self.assertEqual((stats['model']['hits'], stats['model']['lookups']), (1, 1))
+        self.assertEqual(self.generator.model.predicted, ['कर्म'])
+
+    def test_batched_resolution(self):
+        """Test that whole-tweet resolution only sends dictionary misses to the model."""
+        results = self.generator._get_words_info(['धर्म', 'कर्म', 'और', 'धर्म'], 'devanagari')
+
+        self.assertEqual(results['धर्म'].sanskrit_root, 'धृ')
+        self.assertEqual(results['कर्म'].sanskrit_root, 'कृ')
+        self.assertIsNone(results['और'])
+        self.assertEqual(self.generator.model.predicted, ['कर्म', 'और'])
+
+        # Resolved words are now served from the cache
+        self.generator._get_words_info(['धर्म', 'कर्म'], 'devanagari')
+        self.assertEqual(self.generator.get_tier_statistics()['cache']['hits'], 2)
+
+    def test_non_loanwords_cached(self):
+        """Test that confirmed non-loanwords are not sent to the model again."""
+        self.assertIsNone(self.generator._get_word_info('और', 'devanagari'))
+        self.assertIsNone(self.generator._get_word_info('और', 'devanagari'))
+
+        self.assertEqual(self.generator.model.predicted, ['और'])
+        self.assertEqual(self.generator.word_cache.get_statistics()['negative_hits'], 1)
+
+    def test_model_errors_not_cached(self):
+        """Test that a word the model failed on is tried again instead of cached as a non-loanword."""
+        self.generator.model.failing = True
+        self.assertIsNone(self.generator._get_word_info('कर्म', 'devanagari'))
+        self.assertEqual(self.generator._get_words_info(['कर्म'], 'devanagari'), {'कर्म': None})
+        self.assertEqual(len(self.generator.word_cache), 0)
+
+        self.generator.model.failing = False
+        self.assertEqual(self.generator._get_word_info('कर्म', 'devanagari').sanskrit_root, 'कृ')
+        self.assertEqual(self.generator.model.predicted, ['कर्म'] * 3)
+
+    def test_unlabeled_loanwords_not_cached(self):
+        """Test that a loanword the model has no label for is not cached as a non-loanword."""
+        self.assertIsNone(self.generator._get_word_info('ज्ञान', 'devanagari'))
+        self.assertEqual(self.generator._get_words_info(['ज्ञान'], 'devanagari'), {'ज्ञान': None})
+
+        self.assertEqual(len(self.generator.word_cache), 0)
+        self.assertEqual(self.generator.model.predicted, ['ज्ञान'] * 2)
+
+    def test_index_reload_clears_cache(self):
+        """Test that cached results are dropped when another writer changes the dictionary."""
+        self.assertIsNone(self.generator._get_word_info('योग', 'devanagari'))
+        self.dict_handler.refresh_interval = 0
+
+        conn = sqlite3.connect(self.dict_handler.db_path)
+        conn.execute("INSERT INTO dictionary_entries VALUES ('योग', 'युज्', 'union', 'apte', 'devanagari')")
+        conn.commit()
+        conn.close()
+        # Make sure the change is visible even on coarse mtime filesystems
+        os.utime(self.dict_handler.db_path, ns=(0, os.stat(self.dict_handler.db_path).st_mtime_ns + 1_000_000))
+
+        self.assertEqual(self.generator._get_words_info(['धर्म'], 'devanagari')['धर्म'].meaning, 'duty')
+        self.assertEqual(self.generator._get_word_info('योग', 'devanagari').meaning, 'union')
+
+    def test_add_entry_invalidates_cache(self):
+        """Test that a new dictionary entry replaces a cached result."""
+        self.assertIsNone(self.generator._get_word_info('योग', 'devanagari'))
+
+        self.dict_handler.add_entry(DictionaryEntry('योग', 'युज्', 'union', 'apte'), 'devanagari')
+
+        self.assertEqual(self.generator._get_word_info('योग', 'devanagari').meaning, 'union')
+        self.assertEqual(self.generator.word_cache.get_statistics()['invalidations'], 1)
+
+class TestLazyModelLoading(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+
+        self.dict_handler = DictionaryHandler(str(Path(temp_dir.name) / 'dict.db'), preload=True)
+        self.dict_handler.add_entry(DictionaryEntry('धर्म', 'धृ', 'duty', 'apte'), 'devanagari')
+
+        # Stand-in for the IndicBERT module; loading blocks until released
+        self.release = threading.Event()
+        self.loads = []
+        def load_model(**kwargs):
+            self.loads.append(kwargs)
+            self.release.wait(5)
+            return StubModel()
+        fake_module = SimpleNamespace(IndicBertHandler=load_model)
+
+        patcher = patch.dict(sys.modules, {'src.models.indic_bert_handler': fake_module})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.release.set)
+
+    def _generator(self, **kwargs):
+        with patch('src.data.dict_handler.DictionaryHandler', return_value=self.dict_handler):
+            return ResponseGenerator(**kwargs)
+
+    def test_model_loaded_on_first_use(self):
+        """Test that the model is only loaded when a word reaches the model tier."""
+        self.release.set()
+        generator = self._generator()
+        self.assertEqual(self.loads, [])
+
+        generator._get_word_info('धर्म', 'devanagari')
+        self.assertEqual(self.loads, [])
+
+        self.assertEqual(generator._get_word_info('कर्म', 'devanagari').sanskrit_root, 'कृ')
+        generator._get_word_info('और', 'devanagari')
+        self.assertEqual(len(self.loads), 1)
+        self.assertIn('model', generator.startup_timings)
+
+    def test_warm_up_serves_dictionary_while_loading(self):
+        """Test that replies use the dictionary while the model loads in the background."""
+        generator = self._generator(warm_up=True)
+
+        self.assertEqual(generator._get_word_info('धर्म', 'devanagari').sanskrit_root, 'धृ')
+        self.assertIsNone(generator._get_word_info('कर्म', 'devanagari'))
+        # Unresolved words are not cached as non-loanwords while the model is missing
+        self.assertEqual(len(generator.word_cache), 1)
+
+        self.release.set()
+        generator.warm_up().join(5)
+        self.assertEqual(generator._get_word_info('कर्म', 'devanagari').sanskrit_root, 'कृ')
+        self.assertEqual(len(self.loads), 1)
+
+    def test_no_fallback_while_model_loading(self):
+        """Test that the made-up fallback root is only used after the model failed to load."""
+        with patch('src.data.dict_handler.DictionaryHandler', side_effect=OSError("no dictionary")):
+            generator = ResponseGenerator(warm_up=True)
+        self.assertIsNone(generator._get_word_info('कर्म', 'devanagari'))
+        self.assertEqual(generator._get_words_info(['कर्म'], 'devanagari'), {'कर्म': None})
+
+        # A confirmed load failure still falls back
+        self.release.set()
+        generator.warm_up().join(5)
+        generator.model = None
+        self.assertEqual(generator._get_word_info('कर्म', 'devanagari').sanskrit_root, 'मूल')
+
+    def test_resolved_words_do_not_load_model(self):
+        """Test that batch resolution only loads the model for words still unresolved."""
+        self.release.set()
+        generator = self._generator()
+
+        self.assertEqual(generator._get_words_info(['धर्म', 'धर्म'], 'devanagari')['धर्म'].sanskrit_root, 'धृ')
+        self.assertEqual(generator._get_words_info(['धर्म'], 'devanagari')['धर्म'].sanskrit_root, 'धृ')
+        self.assertEqual(self.loads, [])
+
+        self.assertEqual(generator._get_words_info(['कर्म'], 'devanagari')['कर्म'].sanskrit_root, 'कृ')
+        self.assertEqual(len(self.loads), 1)
+
+    def test_concurrent_first_use_loads_once(self):
+        """Test that threads racing for the model share a single load."""
+        generator = self._generator()
+        models = []
+        threads = [threading.Thread(target=lambda: models.append(generator.model)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        self.release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(len(self.loads), 1)
+        self.assertEqual(len({id(model) for model in models}), 1)
+
+class TestWordInfoCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.cache = WordInfoCache(max_size=2, ttl=10, negative_ttl=5, clock=lambda: self.now)
+
+    def _info(self, word):
+        return LoanwordInfo(word=word, sanskrit_root='धृ', meaning='duty', confidence=1.0)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used word is evicted when full."""
+        self.cache.put('a', 'latin', self._info('a'))
+        self.cache.put('b', 'latin', self._info('b'))
+        self.cache.get('a', 'latin')
+        self.cache.put('c', 'latin', self._info('c'))
+
+        self.assertEqual(self.cache.get('b', 'latin'), (False, None))
+        self.assertTrue(self.cache.get('a', 'latin')[0])
+        self.assertEqual(self.cache.get_statistics()['evictions'], 1)
+
+    def test_ttl_expiry(self):
+        """Test that entries expire, negative ones sooner."""
+        self.cache.put('a', 'latin', self._info('a'))
+        self.cache.put('b', 'latin', None)
+
+        self.now = 6
+        self.assertTrue(self.cache.get('a', 'latin')[0])
+        self.assertEqual(self.cache.get('b', 'latin'), (False, None))
+        self.now = 11
+        self.assertEqual(self.cache.get('a', 'latin'), (False, None))
+        self.assertEqual(self.cache.get_statistics()['expirations'], 2)
+
+    def test_normalized_keys(self):
+        """Test that different spellings share an entry but keep their own word."""
+        self.cache.put('Dharma', 'latin', self._info('Dharma'))
+
+        found, info = self.cache.get(' dharma', 'latin')
+        self.assertTrue(found)
+        self.assertEqual(info.word, ' dharma')
+        self.assertEqual(self.cache.get('dharma', 'devanagari'), (False, None))
+
+    def test_negative_cache_disabled(self):
+        """Test that negative caching can be turned off."""
+        cache = WordInfoCache(negative_ttl=0)
+        cache.put('a', 'latin', None)
+        self.assertEqual(len(cache), 0)
+
+if __name__ == '__main__':
+    unittest.main()
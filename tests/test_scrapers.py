@@ -3,13 +3,23 @@
 import unittest
 from unittest.mock import patch, MagicMock
 import json
+import tempfile
+import threading
+import time
 from pathlib import Path
 from bs4 import BeautifulSoup
 import requests
+import responses
+from responses import matchers
 
 from src.data.scrapers.wiktionary_scraper import WiktionaryScraper
 from src.data.scrapers.sanskrit_dict_scraper import SanskritDictScraper
 from src.data.scrapers.ddsa_scraper import DDSAScraper
+from src.data.scrapers.base_scraper import BaseScraper
+from src.data.scrapers.rate_limiter import TokenBucket, host_rate_limiter
+from src.data.scrapers.http_cache import ResponseCache
+from src.data.scrapers.crawl_state import CrawlStateStore
+from src.data.scrapers.html_parsing import parse_html, resolve_parser
 from config.logging_config import setup_logging
 
 class MockResponse:
@@ -210,5 +220,322 @@ class TestScraperLogging(unittest.TestCase):
             # Verify error logging
             mock_logger.error.assert_called()
 
+class OfflineScraper(BaseScraper):
+    """Scraper that serves canned pages instead of hitting the network."""
+    
+    def __init__(self, base_url, delay, fetch_time=0.0):
+        self.fetch_time = fetch_time
+        self.fetched = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.lock = threading.Lock()
+        with patch.object(BaseScraper, '_setup_robots_parser'):
+            super().__init__(base_url, delay)
+        self.robots_parser = None
+    
+    def _fetch(self, url, cached=None):
+        with self.lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        time.sleep(self.fetch_time)
+        with self.lock:
+            self.in_flight -= 1
+            self.fetched.append((url, time.monotonic()))
+        return f"<html><h1 id='firstHeading'>{url}</h1></html>"
+    
+    def scrape_words(self):
+        return []
+
+class TestRateLimiting(unittest.TestCase):
+    """Test cases for per-host rate limiting and async fetching."""
+    
+    def setUp(self):
+        host_rate_limiter.reset()
+        self.addCleanup(host_rate_limiter.reset)
+    
+    def test_token_bucket_spacing(self):
+        """Test that tokens are handed out at the configured rate."""
+        bucket = TokenBucket(rate=20.0)
+        waits = [bucket.reserve() for _ in range(3)]
+        self.assertEqual(waits[0], 0.0)
+        self.assertAlmostEqual(waits[1], 0.05, delta=0.01)
+        self.assertAlmostEqual(waits[2], 0.10, delta=0.01)
+    
+    def test_rate_shared_across_instances(self):
+        """Test that two scrapers for the same host share one budget."""
+        first = OfflineScraper("https://example.org", delay=0.05)
+        second = OfflineScraper("https://example.org", delay=0.05)
+        
+        start = time.monotonic()
+        for i in range(3):
+            first.get_page(f"https://example.org/a{i}")
+            second.get_page(f"https://example.org/b{i}")
+        
+        # Six requests at 20/s need at least five intervals
+        self.assertGreaterEqual(time.monotonic() - start, 0.24)
+    
+    def test_other_hosts_not_throttled(self):
+        """Test that different hosts get independent buckets."""
+        first = OfflineScraper("https://one.example.org", delay=1.0)
+        second = OfflineScraper("https://two.example.org", delay=1.0)
+        
+        start = time.monotonic()
+        first.get_page("https://one.example.org/x")
+        second.get_page("https://two.example.org/x")
+        self.assertLess(time.monotonic() - start, 0.5)
+    
+    def test_get_pages_overlaps_requests(self):
+        """Test that get_pages runs requests concurrently and keeps order."""
+        scraper = OfflineScraper("https://example.org", delay=0.01, fetch_time=0.1)
+        self.addCleanup(scraper.cleanup)
+        urls = [f"https://example.org/{i}" for i in range(4)]
+        
+        start = time.monotonic()
+        soups = scraper.get_pages(urls)
+        elapsed = time.monotonic() - start
+        
+        self.assertEqual([soup.h1.text for soup in soups], urls)
+        self.assertGreater(scraper.peak_in_flight, 1)
+        self.assertLess(elapsed, 0.35)
+    
+    def test_get_pages_respects_rate(self):
+        """Test that concurrent fetching still starts requests at the host's rate."""
+        scraper = OfflineScraper("https://example.org", delay=0.05)
+        self.addCleanup(scraper.cleanup)
+        
+        scraper.get_pages([f"https://example.org/{i}" for i in range(4)])
+        times = sorted(t for _, t in scraper.fetched)
+        self.assertGreaterEqual(times[-1] - times[0], 0.14)
+
+class CachingScraper(BaseScraper):
+    """Scraper that fetches over (mocked) HTTP through the response cache."""
+    
+    def __init__(self, cache, ttl):
+        self.CACHE_TTL = ttl
+        with patch.object(BaseScraper, '_setup_robots_parser'):
+            super().__init__("https://cache.example.org", delay=0)
+        self.robots_parser = None
+        self.response_cache = cache
+    
+    def scrape_words(self):
+        return []
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for the persistent HTTP response cache."""
+    
+    URL = "https://cache.example.org/wiki/देव"
+    HTML = "<html><h1 id='firstHeading'>देव</h1></html>"
+    
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache = ResponseCache(Path(temp_dir.name) / 'http_cache.db')
+        self.addCleanup(self.cache.close)
+    
+    @responses.activate
+    def test_fresh_entry_served_without_request(self):
+        """Test that entries within the TTL are served from disk."""
+        responses.add(responses.GET, self.URL, body=self.HTML, headers={'ETag': '"v1"'})
+        scraper = CachingScraper(self.cache, ttl=3600)
+        
+        first = scraper.get_page(self.URL)
+        second = scraper.get_page(self.URL)
+        
+        self.assertEqual(first.h1.text, second.h1.text)
+        self.assertEqual(len(responses.calls), 1)
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertEqual(stats['bytes_saved'], len(self.HTML.encode('utf-8')))
+    
+    @responses.activate
+    def test_stale_entry_revalidated(self):
+        """Test that stale entries send validators and reuse the body on 304."""
+        responses.add(responses.GET, self.URL, body=self.HTML,
+                      headers={'ETag': '"v1"', 'Last-Modified': 'Mon, 25 Nov 2024 10:00:00 GMT'})
+        scraper = CachingScraper(self.cache, ttl=None)
+        scraper.get_page(self.URL)
+        
+        responses.replace(
+            responses.GET, self.URL, status=304,
+            match=[matchers.header_matcher({
+                'If-None-Match': '"v1"',
+                'If-Modified-Since': 'Mon, 25 Nov 2024 10:00:00 GMT'
+            })]
+        )
+        soup = scraper.get_page(self.URL)
+        
+        self.assertEqual(soup.h1.text, 'देव')
+        self.assertEqual(self.cache.stats()['revalidated'], 1)
+    
+    @responses.activate
+    def test_changed_page_replaces_entry(self):
+        """Test that a 200 on revalidation replaces the cached body."""
+        responses.add(responses.GET, self.URL, body=self.HTML, headers={'ETag': '"v1"'})
+        scraper = CachingScraper(self.cache, ttl=None)
+        scraper.get_page(self.URL)
+        
+        responses.replace(responses.GET, self.URL, body="<html><h1>new</h1></html>",
+                          headers={'ETag': '"v2"'})
+        self.assertEqual(scraper.get_page(self.URL).h1.text, 'new')
+        self.assertEqual(self.cache.get(self.URL).etag, '"v2"')
+    
+    @responses.activate
+    def test_errors_not_cached(self):
+        """Test that failed responses are not stored."""
+        responses.add(responses.GET, self.URL, status=500)
+        scraper = CachingScraper(self.cache, ttl=3600)
+        
+        self.assertIsNone(scraper.get_page(self.URL))
+        self.assertIsNone(self.cache.get(self.URL))
+
+class TestCrawlCheckpoints(unittest.TestCase):
+    """Test cases for resumable and delta crawls."""
+    
+    BASE = "https://hi.wiktionary.org"
+    
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.state = CrawlStateStore(Path(temp_dir.name) / 'crawl_state.db')
+        self.addCleanup(self.state.close)
+        host_rate_limiter.reset()
+        self.addCleanup(host_rate_limiter.reset)
+    
+    def _scraper(self, mode):
+        with patch.object(BaseScraper, '_setup_robots_parser'):
+            scraper = WiktionaryScraper('hindi')
+        self.addCleanup(scraper.cleanup)
+        scraper.robots_parser = None
+        scraper.delay = 0
+        scraper.crawl_state = self.state
+        scraper.crawl_mode = mode
+        return scraper
+    
+    def _entry(self, title, sanskrit):
+        return (
+            f"<html><h1 id='firstHeading'>{title}</h1><div id='mw-content-text'>"
+            f"<h2>व्युत्पत्ति</h2><p>संस्कृत {sanskrit} (x)</p></div></html>"
+        )
+    
+    def _add_site(self, second_category_status=200):
+        category_url = self.BASE + "/wiki/श्रेणी:संस्कृत_से_हिन्दी"
+        responses.add(responses.GET, category_url, body=(
+            "<html><div class='mw-category'><a href='/wiki/देव'>देव</a></div>"
+            "<a href='/wiki/page2'>अगला</a></html>"
+        ))
+        responses.add(responses.GET, self.BASE + "/wiki/page2", status=second_category_status, body=(
+            "<html><div class='mw-category'><a href='/wiki/धर्म'>धर्म</a></div></html>"
+        ))
+        responses.add(responses.GET, self.BASE + "/wiki/देव", body=self._entry('देव', 'देव'))
+        responses.add(responses.GET, self.BASE + "/wiki/धर्म", body=self._entry('धर्म', 'धर्म'))
+    
+    def _fetched(self):
+        return [requests.utils.unquote(call.request.url) for call in responses.calls]
+    
+    def _interrupted_crawl(self):
+        """Run a crawl that fails on the second category page and never finishes."""
+        self._add_site(second_category_status=500)
+        scraper = self._scraper('full')
+        with patch.object(scraper, 'finish_crawl'):
+            words = scraper.scrape_words()
+        self.assertEqual([w['word'] for w in words], ['देव'])
+        responses.reset()
+    
+    @responses.activate
+    def test_resume_continues_from_checkpoint(self):
+        """Test that a resumed crawl skips finished pages and replays their results."""
+        self._interrupted_crawl()
+        self._add_site()
+        
+        words = self._scraper('resume').scrape_words()
+        
+        self.assertEqual(sorted(w['word'] for w in words), ['देव', 'धर्म'])
+        self.assertEqual(self._fetched(), [self.BASE + "/wiki/page2", self.BASE + "/wiki/धर्म"])
+    
+    @responses.activate
+    def test_full_mode_discards_checkpoint(self):
+        """Test that a full crawl starts over even after an interruption."""
+        self._interrupted_crawl()
+        self._add_site()
+        
+        words = self._scraper('full').scrape_words()
+        
+        self.assertEqual(len(words), 2)
+        self.assertEqual(len(responses.calls), 4)
+    
+    @responses.activate
+    def test_resume_after_finished_crawl_is_full(self):
+        """Test that resuming a completed crawl falls back to a full crawl."""
+        self._add_site()
+        self._scraper('full').scrape_words()
+        responses.calls.reset()
+        
+        words = self._scraper('resume').scrape_words()
+        
+        self.assertEqual(len(words), 2)
+        self.assertEqual(len(responses.calls), 4)
+    
+    @responses.activate
+    def test_delta_only_processes_changed_pages(self):
+        """Test that a delta crawl skips pages whose content is unchanged."""
+        self._add_site()
+        self._scraper('full').scrape_words()
+        
+        self.assertEqual(self._scraper('delta').scrape_words(), [])
+        
+        responses.replace(responses.GET, self.BASE + "/wiki/धर्म",
+                          body=self._entry('धर्म', 'धर्मन्'))
+        words = self._scraper('delta').scrape_words()
+        
+        self.assertEqual([(w['word'], w['sanskrit_word']) for w in words], [('धर्म', 'धर्मन्')])
+
+class TestHTMLParsing(unittest.TestCase):
+    """Test cases for the pluggable parsing backend."""
+    
+    FIXTURES = Path(__file__).parent / 'fixtures' / 'html'
+    
+    def _fixture(self, name):
+        return (self.FIXTURES / name).read_text(encoding='utf-8')
+    
+    def test_resolve_parser(self):
+        """Test backend selection and fallback."""
+        self.assertEqual(resolve_parser('html.parser'), 'html.parser')
+        with self.assertRaises(ValueError):
+            resolve_parser('regex')
+        with patch('src.data.scrapers.html_parsing.available_parsers', return_value=['html.parser']):
+            self.assertEqual(resolve_parser(), 'html.parser')
+            self.assertEqual(resolve_parser('lxml'), 'html.parser')
+    
+    def test_targeted_parse_wiktionary(self):
+        """Test that Wiktionary extraction gives the same result on a targeted parse."""
+        with patch.object(BaseScraper, '_setup_robots_parser'):
+            scraper = WiktionaryScraper('hindi')
+        scraper.current_url = 'https://hi.wiktionary.org/wiki/धर्म'
+        markup = self._fixture('wiktionary_entry.html')
+        
+        full = scraper._extract_word_info(parse_html(markup))
+        targeted_soup = parse_html(markup, parse_only=WiktionaryScraper.ENTRY_PARSE_ONLY)
+        targeted = scraper._extract_word_info(targeted_soup)
+        
+        self.assertEqual(full['sanskrit_word'], 'धर्म')
+        self.assertEqual(targeted, full)
+        self.assertIsNone(targeted_soup.find('footer'))
+    
+    def test_targeted_parse_ddsa(self):
+        """Test that DDSA extraction gives the same result on a targeted parse."""
+        with patch.object(BaseScraper, '_setup_robots_parser'):
+            scraper = DDSAScraper('tamil')
+        scraper.current_url = 'https://dsal.uchicago.edu/dictionaries/tamil/entry'
+        dictionary = scraper.dictionaries['tamil'][0]
+        markup = self._fixture('ddsa_entry.html')
+        
+        full = scraper._extract_word_info(parse_html(markup), dictionary)
+        targeted = scraper._extract_word_info(
+            parse_html(markup, parse_only=DDSAScraper.ENTRY_PARSE_ONLY), dictionary
+        )
+        
+        self.assertEqual((full['word'], full['sanskrit_word']), ('தருமம்', 'धर्म'))
+        self.assertEqual(targeted, full)
+
 if __name__ == '__main__':
     unittest.main()
@@ -6,13 +6,17 @@ from bs4 import BeautifulSoup
 import tempfile
 import json
 from pathlib import Path
+from collections import defaultdict
 import logging
 import sys
+import threading
+import time
 import responses
 
 from src.data.scrapers.wiktionary_scraper import WiktionaryScraper
 from src.data.data_collection import DataCollector
-from src.core.database import Database
+from src.core.database import Database, DatabaseError
+from src.core.word_reconciliation import WordReconciliation
 
 class VerboseLogger:
     """A helper class to capture and print detailed logging information."""
@@ -111,6 +115,12 @@ class TestDataCollector(unittest.TestCase):
         # Mock database
         self.db = MagicMock(spec=Database)
         self.db.add_word.return_value = True
+        self.stored_words = []
+        def mock_add_words_bulk(words, chunk_size=500):
+            words = list(words)
+            self.stored_words.extend(words)
+            return {(w['word'], w['language']): i for i, w in enumerate(words, 1)}
+        self.db.add_words_bulk.side_effect = mock_add_words_bulk
     
     @responses.activate
     @patch('src.data.data_collection.WiktionaryScraper')
@@ -150,12 +160,17 @@ class TestDataCollector(unittest.TestCase):
         # Mock script validation to always return True
         MockScriptUtils.validate_script.return_value = True
         
-        # Mock word reconciliation to return input unchanged
+        # Mock word reconciliation to pass buffered input through unchanged
         mock_reconciliation = MagicMock()
-        def mock_reconcile(words):
-            self.verbose_logger.logger.info(f"Reconciling {len(words)} words")
-            return words
-        mock_reconciliation.reconcile.side_effect = mock_reconcile
+        mock_reconciliation.pending_count = 0
+        pending = []
+        def mock_flush(language=None):
+            flushed = [w for w in pending if language is None or w['language'] == language]
+            self.verbose_logger.logger.info(f"Reconciling {len(flushed)} words")
+            pending[:] = [w for w in pending if w not in flushed]
+            return flushed
+        mock_reconciliation.add.side_effect = pending.append
+        mock_reconciliation.flush.side_effect = mock_flush
         MockReconciliation.return_value = mock_reconciliation
         
         # Mock HTTP responses for external requests
@@ -255,9 +270,20 @@ class TestDataCollector(unittest.TestCase):
         MockWikisource.side_effect = lambda lang: create_mock_instance(lang, 'wikisource')
         MockDDSA.side_effect = lambda lang: create_mock_instance(lang, 'ddsa')
         
-        # Create collector with our mocked classes
+        # Create collector with our mocked classes (SCRAPERS holds direct class references)
         self.verbose_logger.logger.info("\nInitializing DataCollector...")
-        self.collector = DataCollector(self.db, languages=['tamil', 'hindi'])
+        mocked_scrapers = {
+            'wiktionary': MockWiktionary,
+            'sanskrit_dict': MockSanskritDict,
+            'wikisource': MockWikisource,
+            'ddsa': MockDDSA
+        }
+        scraper_config = {
+            scraper_id: dict(DataCollector.SCRAPERS[scraper_id], **{'class': mock_class})
+            for scraper_id, mock_class in mocked_scrapers.items()
+        }
+        with patch.dict(DataCollector.SCRAPERS, scraper_config, clear=True):
+            self.collector = DataCollector(self.db, languages=['tamil', 'hindi'])
         
         # Run the collection process
         self.verbose_logger.logger.info("\nStarting collection process...")
@@ -269,25 +295,237 @@ class TestDataCollector(unittest.TestCase):
             for record in self.verbose_logger.log_capture:
                 print(record)
             
-            self.verbose_logger.logger.info(f"\nWords added to DB: {self.db.add_word.call_count}")
+            self.verbose_logger.logger.info(f"\nWords added to DB: {len(self.stored_words)}")
             
             # We expect 8 words to be added (2 languages * 4 scrapers * 1 word each)
-            self.assertEqual(self.db.add_word.call_count, 8)
+            self.assertEqual(len(self.stored_words), 8)
+            self.db.add_word.assert_not_called()
             
             # Verify words were stored with correct data
+            stored = {(w['word'], w['language']): w for w in self.stored_words}
             for lang in ['tamil', 'hindi']:
                 for scraper_name in scrapers:
                     word_data = mock_words[lang][scraper_name][0]
-                    self.db.add_word.assert_any_call(
-                        word=word_data['word'],
-                        sanskrit_word=word_data['sanskrit_word'],
-                        language=word_data['language'],
-                        confidence=word_data['confidence'],
-                        source_url=word_data['source_url'],
-                        meanings=word_data.get('meanings'),
-                        usage_examples=word_data.get('usage_examples'),
-                        context=word_data.get('context')
-                    )
+                    stored_word = stored[(word_data['word'], word_data['language'])]
+                    self.assertEqual(stored_word['sanskrit_word'], word_data['sanskrit_word'])
+                    self.assertEqual(stored_word['confidence'], word_data['confidence'])
+                    self.assertEqual(stored_word['source_url'], word_data['source_url'])
+
+class FakeScraper:
+    """Offline scraper returning canned words for a language."""
+    WORDS = {
+        'tamil': [
+            ('அகம்', 'अहम्', 0.9, 'ddsa'),
+            ('அகம்', 'अहम्', 0.85, 'wiktionary'),
+            ('தர்மம்', 'धर्म', 0.95, 'ddsa')
+        ],
+        'hindi': [
+            ('आकाश', 'आकाश', 0.9, 'ddsa'),
+            ('कर्म', 'कर्म', 0.5, 'ddsa')  # Below the reconciliation threshold
+        ]
+    }
+    cleaned_up = []
+    base_url = 'https://example.org'
+    
+    def __init__(self, language):
+        self.language = language
+    
+    def scrape_words(self):
+        return [
+            {
+                'word': word,
+                'sanskrit_word': sanskrit_word,
+                'language': self.language,
+                'confidence': confidence,
+                'source_url': f'https://example.org/{word}',
+                'context': {'source': source}
+            }
+            for word, sanskrit_word, confidence, source in self.WORDS[self.language]
+        ]
+    
+    def cleanup(self):
+        self.cleaned_up.append(self.language)
+
+class TestWordReconciliation(unittest.TestCase):
+    """Test cases for incremental reconciliation."""
+    
+    def test_incremental_matches_batch(self):
+        """Test that add()/flush() produce the same result as reconcile()."""
+        entries = FakeScraper('tamil').scrape_words() + FakeScraper('hindi').scrape_words()
+        
+        batch = WordReconciliation().reconcile(entries)
+        
+        incremental = WordReconciliation()
+        for entry in entries:
+            incremental.add(entry)
+        self.assertEqual(incremental.pending_count, 4)  # Low confidence entry dropped
+        
+        tamil = incremental.flush('tamil')
+        self.assertEqual(incremental.pending_count, 1)
+        flushed = tamil + incremental.flush()
+        
+        key = lambda w: (w['language'], w['word'])
+        self.assertEqual(sorted(flushed, key=key), sorted(batch, key=key))
+        self.assertEqual(incremental.pending_count, 0)
+
+class TestStreamingCollection(unittest.TestCase):
+    """Test cases for the streaming collect_and_store pipeline."""
+    
+    def setUp(self):
+        FakeScraper.cleaned_up = []
+        self.batches = []
+        self.db = MagicMock(spec=Database)
+        def mock_add_words_bulk(words, chunk_size=500):
+            ids = {}
+            batch = []
+            for word in words:
+                batch.append(word)
+                if len(batch) == chunk_size:
+                    self.batches.append(batch)
+                    batch = []
+                ids[(word['word'], word['language'])] = len(ids) + 1
+            if batch:
+                self.batches.append(batch)
+            return ids
+        self.db.add_words_bulk.side_effect = mock_add_words_bulk
+        
+        scrapers = {'fake': {'class': FakeScraper, 'weight': 1.0, 'description': 'Fake'}}
+        with patch.dict(DataCollector.SCRAPERS, scrapers, clear=True):
+            self.collector = DataCollector(self.db, languages=['tamil', 'hindi'], scrapers=['fake'])
+    
+    def test_words_streamed_in_batches(self):
+        """Test that reconciled words are written in chunks."""
+        self.collector.collect_and_store(batch_size=1)
+        
+        stored = [word for batch in self.batches for word in batch]
+        self.assertEqual(
+            sorted((w['language'], w['word']) for w in stored),
+            [('hindi', 'आकाश'), ('tamil', 'அகம்'), ('tamil', 'தர்மம்')]
+        )
+        self.assertEqual(len(self.batches), 3)
+        self.assertEqual(FakeScraper.cleaned_up, ['tamil', 'hindi'])
+        
+        merged = next(w for w in stored if w['word'] == 'அகம்')
+        self.assertEqual(merged['context']['source_count'], 2)
+    
+    def test_failed_chunk_is_skipped(self):
+        """Test that a failed chunk neither discards stored chunks nor stops the scrapers."""
+        store = self.db.add_words_bulk.side_effect
+        def flaky_add_words_bulk(words, chunk_size=500):
+            words = list(words)
+            if words[0]['word'] == 'அகம்':
+                raise DatabaseError("disk I/O error")
+            return store(words, chunk_size)
+        self.db.add_words_bulk.side_effect = flaky_add_words_bulk
+        
+        with self.assertLogs('data_collector', level='INFO') as logs:
+            self.collector.collect_and_store(batch_size=1)
+        
+        stored = sorted(w['word'] for batch in self.batches for w in batch)
+        self.assertEqual(stored, ['आकाश', 'தர்மம்'])
+        self.assertEqual(FakeScraper.cleaned_up, ['tamil', 'hindi'])
+        self.assertTrue(any('Successfully stored 2 reconciled entries' in line for line in logs.output))
+        self.assertTrue(any('Failed to store 1 reconciled entries' in line for line in logs.output))
+    
+    def test_max_pending_forces_flush(self):
+        """Test that the memory cap flushes buffered entries early."""
+        with patch.object(WordReconciliation, 'flush', autospec=True,
+                          side_effect=WordReconciliation.flush) as mock_flush:
+            self.collector.collect_and_store(max_pending=1)
+        
+        # One forced flush per buffered entry, plus per-language and final flushes
+        self.assertGreater(mock_flush.call_count, 4)
+        self.assertEqual(len(self.batches[0]), 4)
+
+    def test_batch_confidence_matches_per_word(self):
+        """Test that batched confidence adjustment matches the per-word path."""
+        words = [
+            {'word': 'தர்மம்', 'sanskrit_word': 'धर्म', 'language': 'tamil', 'confidence': 0.9},
+            {'word': 'dharma', 'sanskrit_word': 'धर्म', 'language': 'tamil', 'confidence': 0.9},
+            {'word': 'आकाश', 'sanskrit_word': 'akasha', 'language': 'hindi', 'confidence': 0.8},
+            {'word': 'कर्म', 'sanskrit_word': 'कर्म', 'language': 'hindi', 'confidence': 0.7,
+             'context': {'collection': 'bhagavad_gita'}},
+            {'word': 'x', 'sanskrit_word': 'y', 'language': 'sanskrit', 'confidence': 0.6}
+        ] * 20
+
+        expected = [self.collector._adjust_confidence(dict(word), 0.9)['confidence'] for word in words]
+        adjusted = self.collector._adjust_confidence_batch([dict(word) for word in words], 0.9)
+        self.assertEqual([word['confidence'] for word in adjusted], expected)
+        self.assertAlmostEqual(adjusted[1]['confidence'], 0.9 * 0.9 * 0.8)
+
+class SlowScraper(FakeScraper):
+    """Fake scraper that records how many instances hit its host at once."""
+    lock = threading.Lock()
+    active = defaultdict(int)
+    peak = defaultdict(int)
+    
+    def __init__(self, language, host):
+        super().__init__(language)
+        self.base_url = f'https://{host}'
+    
+    def scrape_words(self):
+        with self.lock:
+            self.active[self.base_url] += 1
+            self.peak[self.base_url] = max(self.peak[self.base_url], self.active[self.base_url])
+        time.sleep(0.05)
+        with self.lock:
+            self.active[self.base_url] -= 1
+        return super().scrape_words()
+
+class TestConcurrentCollection(unittest.TestCase):
+    """Test cases for concurrent scraper execution."""
+    
+    def setUp(self):
+        SlowScraper.active.clear()
+        SlowScraper.peak.clear()
+        FakeScraper.cleaned_up = []
+        self.stored = []
+        self.db = MagicMock(spec=Database)
+        def mock_add_words_bulk(words, chunk_size=500):
+            self.stored.extend(words)
+            return {(w['word'], w['language']): i for i, w in enumerate(self.stored, 1)}
+        self.db.add_words_bulk.side_effect = mock_add_words_bulk
+    
+    def _make_collector(self, **kwargs):
+        scrapers = {
+            'shared': {'class': lambda lang: SlowScraper(lang, 'shared.example.org'),
+                       'weight': 1.0, 'description': 'Shared host'},
+            'own': {'class': lambda lang: SlowScraper(lang, f'{lang}.example.org'),
+                    'weight': 1.0, 'description': 'Per-language host'}
+        }
+        with patch.dict(DataCollector.SCRAPERS, scrapers, clear=True):
+            return DataCollector(self.db, languages=['tamil', 'hindi'],
+                                 scrapers=['shared', 'own'], **kwargs)
+    
+    def test_per_host_limit(self):
+        """Test that scrapers run in parallel but never exceed the per-host limit."""
+        collector = self._make_collector(max_workers=4)
+        collector.collect_and_store()
+        
+        self.assertEqual(SlowScraper.peak['https://shared.example.org'], 1)
+        self.assertEqual(len(self.stored), 3)
+        self.assertEqual(sorted(FakeScraper.cleaned_up), ['hindi', 'hindi', 'tamil', 'tamil'])
+    
+    def test_host_limit_override(self):
+        """Test that a host can be allowed more concurrent scrapers."""
+        collector = self._make_collector(max_workers=4, host_limits={'shared.example.org': 2})
+        collector.collect_and_store()
+        
+        self.assertEqual(SlowScraper.peak['https://shared.example.org'], 2)
+    
+    def test_timings_recorded(self):
+        """Test that every scraper's run time is recorded for the summary."""
+        collector = self._make_collector(max_workers=4)
+        collector.collect_and_store()
+        
+        self.assertEqual(len(collector.scraper_timings), 4)
+        for timing in collector.scraper_timings:
+            self.assertGreaterEqual(timing['seconds'], 0.05)
+            self.assertIsNone(timing['error'])
+        self.assertEqual(
+            {t['host'] for t in collector.scraper_timings},
+            {'shared.example.org', 'tamil.example.org', 'hindi.example.org'}
+        )
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,139 @@
+"""
+Test suite for script detection and validation utilities.
+"""
+
+import unittest
+from pathlib import Path
+import random
+import sys
+from unittest.mock import patch
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.append(str(project_root))
+
+from src.bot.query_handler import QueryHandler
+from src.utils.script_utils import Script, ScriptClassifier, ScriptUtils
+
+class TestScriptClassifier(unittest.TestCase):
+    def test_counts(self):
+        """Test that characters are counted per script and others ignored."""
+        classifier = ScriptClassifier([('a', [(0x61, 0x63)]), ('x', [(0x78, 0x7A)])])
+        self.assertEqual(classifier.counts('abc xyz a 😀'), {'a': 4, 'x': 3})
+        self.assertEqual(classifier.counts(''), {'a': 0, 'x': 0})
+
+    def test_overlapping_ranges_prefer_first_script(self):
+        """Test that a code point in two ranges counts for the first script."""
+        classifier = ScriptClassifier([('latin', [(0x00, 0x7F)]), ('iast', [(0x00, 0x7F), (0x100, 0x17F)])])
+        self.assertEqual(classifier.counts('dharmā'), {'latin': 5, 'iast': 1})
+
+    def test_dominant_ties_and_default(self):
+        """Test that ties go to the first script and the default covers no matches."""
+        classifier = ScriptClassifier([('a', [(0x61, 0x61)]), ('b', [(0x62, 0x62)])])
+        self.assertEqual(classifier.dominant('ab'), 'a')
+        self.assertEqual(classifier.dominant('abb'), 'b')
+        self.assertEqual(classifier.dominant('zz'), 'a')
+        self.assertEqual(classifier.dominant('zz', default='none'), 'none')
+
+class TestScriptDetection(unittest.TestCase):
+    def test_detect_script(self):
+        """Test dominant Indic script detection in tweets."""
+        handler = QueryHandler()
+        self.assertEqual(handler._detect_script('@bot धर्म का अर्थ क्या है?'), 'devanagari')
+        self.assertEqual(handler._detect_script('@bot அன்பு பொருள் என்ன 🙏'), 'tamil')
+        self.assertEqual(handler._detect_script('@bot what is dharma?'), 'latin')
+        self.assertEqual(handler._detect_script('ধর্ম ধর্ম धर्म'), 'bengali')
+
+    def test_get_script(self):
+        """Test dominant script detection across all scripts."""
+        self.assertEqual(ScriptUtils.get_script('ಧರ್ಮ'), Script.KANNADA)
+        self.assertEqual(ScriptUtils.get_script('dharma'), Script.LATIN)
+        self.assertEqual(ScriptUtils.get_script('ṛṣṭḥ'), Script.IAST)
+        self.assertEqual(ScriptUtils.get_script(''), Script.DEVANAGARI)
+
+def range_validate_script(text, script, allow_numerals=True, allow_diacritics=True):
+    """validate_script as a per-character range check, as it was before the tables."""
+    for char in text:
+        if char.isspace():
+            continue
+        if char.isnumeric():
+            if not allow_numerals:
+                return False
+            continue
+        if ord(char) in ScriptUtils.DIACRITICS:
+            if not allow_diacritics:
+                return False
+            continue
+        if not any(start <= ord(char) <= end for start, end in ScriptUtils.SCRIPT_RANGES[script]):
+            return False
+    return True
+
+def range_clean_text(text, script):
+    """clean_text as a per-character range check, as it was before the tables."""
+    return ''.join(
+        char for char in text
+        if char.isspace() or ord(char) in ScriptUtils.DIACRITICS or
+        any(start <= ord(char) <= end for start, end in ScriptUtils.SCRIPT_RANGES[script])
+    )
+
+class TestScriptValidation(unittest.TestCase):
+    def test_validate_script(self):
+        """Test validation of words, numerals and diacritics."""
+        self.assertTrue(ScriptUtils.validate_script('धर्म १२', Script.DEVANAGARI))
+        self.assertFalse(ScriptUtils.validate_script('धर्म १२', Script.DEVANAGARI, allow_numerals=False))
+        self.assertFalse(ScriptUtils.validate_script('संस्कृत', Script.DEVANAGARI, allow_diacritics=False))
+        self.assertFalse(ScriptUtils.validate_script('धर्म-', Script.DEVANAGARI))
+        self.assertTrue(ScriptUtils.validate_script('धर्म\u3000四', Script.DEVANAGARI))
+        self.assertFalse(ScriptUtils.validate_script('धर्म四', Script.DEVANAGARI, allow_numerals=False))
+        self.assertTrue(ScriptUtils.validate_script('', Script.TAMIL))
+
+    def test_clean_text(self):
+        """Test that cleaning keeps script characters, diacritics and whitespace."""
+        self.assertEqual(ScriptUtils.clean_text('धर्म (dharma) 😀\u3000ক', Script.DEVANAGARI), 'धर्म  \u3000')
+        self.assertEqual(ScriptUtils.clean_text('ধর্ম-ং', Script.BENGALI), 'ধর্মং')
+
+    def test_contains_script(self):
+        """Test detection of any character from a script."""
+        self.assertTrue(ScriptUtils.contains_script('dharma धर्म', Script.DEVANAGARI))
+        self.assertFalse(ScriptUtils.contains_script('dharma', Script.TAMIL))
+
+    def test_tables_match_range_checks(self):
+        """Test that the character tables agree with per-character range checks."""
+        rng = random.Random(0)
+        pool = [chr(code) for code in range(0x0000, 0x0D80)] + list(' \u00a0\u3000四٣１😀ḥā')
+        for _ in range(2000):
+            text = ''.join(rng.choice(pool) for _ in range(rng.randint(0, 6)))
+            for script in Script:
+                self.assertEqual(ScriptUtils.clean_text(text, script), range_clean_text(text, script))
+                for allow_numerals in (True, False):
+                    for allow_diacritics in (True, False):
+                        self.assertEqual(
+                            ScriptUtils.validate_script(text, script, allow_numerals, allow_diacritics),
+                            range_validate_script(text, script, allow_numerals, allow_diacritics),
+                            (text, script, allow_numerals, allow_diacritics)
+                        )
+
+class TestValidateBatch(unittest.TestCase):
+    WORDS = ['धर्म', 'dharma', '', 'धर्म १२', 'धर्म四', 'धर्म😀', 'संस्कृत', 'ধর্ম'] * 10
+
+    def _check(self):
+        for allow_numerals in (True, False):
+            for allow_diacritics in (True, False):
+                self.assertEqual(
+                    ScriptUtils.validate_batch(self.WORDS, Script.DEVANAGARI, allow_numerals, allow_diacritics),
+                    [ScriptUtils.validate_script(word, Script.DEVANAGARI, allow_numerals, allow_diacritics)
+                     for word in self.WORDS]
+                )
+
+    def test_matches_validate_script(self):
+        """Test that batch validation agrees with per-word validation."""
+        self._check()
+        self.assertEqual(ScriptUtils.validate_batch([], Script.TAMIL), [])
+
+    def test_matches_validate_script_without_numpy(self):
+        """Test the per-word fallback used when NumPy is not installed."""
+        with patch('src.utils.script_utils.np', None):
+            self._check()
+
+if __name__ == '__main__':
+    unittest.main()
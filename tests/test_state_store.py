@@ -0,0 +1,137 @@
+"""
+Test suite for the bot state store.
+"""
+
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+import sys
+from unittest.mock import patch
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.append(str(project_root))
+
+from src.bot.state_store import BotStateStore
+
+class TestBotStateStore(unittest.TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.dir = Path(temp_dir.name)
+        self.db_path = self.dir / 'bot_state.db'
+        self.store = BotStateStore(self.db_path)
+        self.addCleanup(self.store.close)
+
+    def reopen(self):
+        self.store.close()
+        self.store = BotStateStore(self.db_path)
+        return self.store
+
+    def test_values_persist(self):
+        """Test that state values survive reopening the store."""
+        self.store.set('last_mention_id', '1857447508387250345')
+        self.store.update({'poll_schedule': {'month': '2024-06', 'idle_polls': 3}, 'flag': True})
+        self.store.set('flag', False)
+
+        store = self.reopen()
+        self.assertEqual(store.get('last_mention_id'), '1857447508387250345')
+        self.assertEqual(store.get('missing', 'default'), 'default')
+        self.assertEqual(store.load(), {
+            'last_mention_id': '1857447508387250345',
+            'poll_schedule': {'month': '2024-06', 'idle_polls': 3},
+            'flag': False
+        })
+
+    def test_counters_are_atomic(self):
+        """Test that concurrent increments are never lost."""
+        def work():
+            for _ in range(50):
+                self.store.increment_counter('reads:2024-06')
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.store.increment_counter('reads:2024-06', 0), 200)
+        self.assertEqual(self.reopen().get_counter('reads:2024-06'), 200)
+        self.assertEqual(self.store.get_counter('writes:2024-06'), 0)
+
+    def test_processed_tweets(self):
+        """Test recording and pruning processed tweet IDs."""
+        self.store.mark_processed('101')
+        self.store.mark_processed(102)
+        self.assertTrue(self.store.is_processed('101'))
+        self.assertTrue(self.reopen().is_processed('102'))
+        self.assertFalse(self.store.is_processed('103'))
+
+        self.assertEqual(self.store.prune_processed(60), 0)
+        with patch('src.bot.state_store.time.time', return_value=10 ** 11):
+            self.assertEqual(self.store.prune_processed(60), 2)
+        self.assertFalse(self.store.is_processed('101'))
+
+    def test_pending_mentions(self):
+        """Test that pending mentions are saved together with the state."""
+        mentions = [{'id': '12', 'text': "@bot धर्म"}, {'id': '11', 'text': "@bot कर्म"}]
+        self.store.add_pending_mentions(mentions, {'last_mention_id': '12'})
+        self.store.add_pending_mentions(mentions[:1])
+        self.store.remove_pending_mention('11')
+
+        store = self.reopen()
+        self.assertEqual(store.pending_mentions(), mentions[:1])
+        self.assertEqual(store.get('last_mention_id'), '12')
+
+    def test_context_keeps_recent_entries(self):
+        """Test that each user's context is trimmed to the most recent entries."""
+        for i in range(8):
+            self.store.append_context('alice', {'query': f"q{i}"}, keep=5)
+        self.store.append_context('bob', {'query': "धर्म"}, keep=5)
+
+        self.assertEqual([e['query'] for e in self.store.get_context('alice')], ['q3', 'q4', 'q5', 'q6', 'q7'])
+        self.assertEqual(self.reopen().get_context('bob'), [{'query': "धर्म"}])
+        self.assertEqual(self.store.get_context('carol'), [])
+
+    def test_import_json(self):
+        """Test importing a JSON state file once."""
+        json_path = self.dir / 'bot_state.json'
+        json_path.write_text(json.dumps({
+            'last_mention_id': '42',
+            'last_interaction': None,
+            'conversation_context': {'alice': [{'query': 'q0'}, {'query': 'q1'}]}
+        }))
+
+        self.assertTrue(self.store.import_json(json_path))
+        self.assertEqual(self.store.get('last_mention_id'), '42')
+        self.assertIsNone(self.store.get('last_interaction', 'missing'))
+        self.assertEqual(len(self.store.get_context('alice')), 2)
+
+        # Already imported: the store keeps its own newer state
+        self.store.set('last_mention_id', '43')
+        self.assertFalse(self.store.import_json(json_path))
+        self.assertEqual(self.store.get('last_mention_id'), '43')
+        self.assertFalse(self.store.import_json(self.dir / 'missing.json'))
+
+    def test_import_context_only_once(self):
+        """Test that a file holding only conversation context is not imported again."""
+        json_path = self.dir / 'bot_state.json'
+        json_path.write_text(json.dumps({
+            'conversation_context': {'alice': [{'query': f"q{i}"} for i in range(8)]}
+        }))
+
+        self.assertTrue(self.store.import_json(json_path))
+        self.assertFalse(self.reopen().import_json(json_path))
+        self.assertEqual([e['query'] for e in self.store.get_context('alice')], ['q3', 'q4', 'q5', 'q6', 'q7'])
+
+    def test_import_invalid_json(self):
+        """Test that an unreadable state file is skipped."""
+        json_path = self.dir / 'bot_state.json'
+        json_path.write_text('{"last_mention_id": ')
+        self.assertFalse(self.store.import_json(json_path))
+        self.assertEqual(self.store.load(), {})
+
+if __name__ == '__main__':
+    unittest.main()
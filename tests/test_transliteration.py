@@ -0,0 +1,69 @@
+"""
+Test suite for IAST <-> Indic script transliteration.
+"""
+
+import unittest
+from pathlib import Path
+import sys
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.append(str(project_root))
+
+from src.utils.script_utils import Script, ScriptUtils
+from src.utils.transliteration import BRAHMIC_SCRIPTS, Transliterator, transliterate
+
+class TestTransliteration(unittest.TestCase):
+    def test_iast_to_devanagari(self):
+        """Test conjuncts, vowel signs, final viramas and marks."""
+        cases = {
+            'dharma': 'धर्म',
+            'kṛṣṇa': 'कृष्ण',
+            'saṃskṛtam': 'संस्कृतम्',
+            'jñāna': 'ज्ञान',
+            'aiśvarya': 'ऐश्वर्य',
+            'rāmaḥ': 'रामः',
+            'Bhagavadgītā': 'भगवद्गीता',
+            'yoga 108 ||': 'योग १०८ ॥',
+        }
+        for iast, devanagari in cases.items():
+            self.assertEqual(transliterate(iast, Script.IAST, Script.DEVANAGARI), devanagari)
+
+    def test_decomposed_input(self):
+        """Test that IAST with combining diacritics is read the same as precomposed."""
+        self.assertEqual(transliterate('a\u0304tman', Script.IAST, Script.DEVANAGARI), 'आत्मन्')
+
+    def test_round_trip(self):
+        """Test that scripts with every Sanskrit letter convert back to the same IAST."""
+        words = ['dharma', 'kṛṣṇa', 'saṃskṛtam', 'vidyālaya', 'kauśalya', 'praṇāma', 'saṅgha']
+        for script in (Script.DEVANAGARI, Script.GUJARATI, Script.ODIA, Script.TELUGU,
+                       Script.KANNADA, Script.MALAYALAM):
+            for word in words:
+                converted = transliterate(word, Script.IAST, script)
+                self.assertTrue(ScriptUtils.validate_script(converted, script), (script, converted))
+                self.assertEqual(transliterate(converted, script, Script.IAST), word)
+
+    def test_missing_letters_use_nearest(self):
+        """Test that letters a script lacks fall back to its nearest letter."""
+        self.assertEqual(transliterate('dharma', Script.IAST, Script.TAMIL), 'தர்ம')
+        self.assertEqual(transliterate('vidyā', Script.IAST, Script.BENGALI), 'বিদ্যা')
+        self.assertEqual(transliterate('kṛpā', Script.IAST, Script.GURMUKHI), 'ਕ੍ਰਿਪਾ')
+
+    def test_between_scripts(self):
+        """Test script-to-script conversion and script-specific letters."""
+        self.assertEqual(transliterate('धर्म', Script.DEVANAGARI, Script.KANNADA), 'ಧರ್ಮ')
+        self.assertEqual(transliterate('ധർമ്മം', Script.MALAYALAM, Script.IAST), 'dharmmaṃ')
+        self.assertEqual(transliterate('धर्म', Script.DEVANAGARI, Script.DEVANAGARI), 'धर्म')
+
+    def test_unsupported_script(self):
+        """Test that only IAST and the Brahmic scripts are accepted."""
+        with self.assertRaises(ValueError):
+            Transliterator(Script.LATIN)
+        self.assertEqual(len(BRAHMIC_SCRIPTS), len(Script) - 2)
+
+    def test_convert_iast_to_devanagari(self):
+        """Test the ScriptUtils wrapper."""
+        self.assertEqual(ScriptUtils.convert_iast_to_devanagari('ātman'), 'आत्मन्')
+
+if __name__ == '__main__':
+    unittest.main()
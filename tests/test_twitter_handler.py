@@ -0,0 +1,305 @@
+"""
+Test suite for the Twitter API client.
+Runs the bot against a local stub server in place of the Twitter API.
+"""
+
+import json
+import os
+import socket
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import sys
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+import requests
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parents[1]
+sys.path.append(str(project_root))
+
+from config import bot_config as cfg
+from src.bot import twitter_handler
+from src.bot.mention_pipeline import MentionPipeline
+from src.bot.response_gen import ResponseGenerator
+from src.bot.twitter_handler import TwitterBot
+from src.data.dict_handler import DictionaryEntry, DictionaryHandler
+
+CREDENTIALS = {
+    'TWITTER_API_KEY': 'key',
+    'TWITTER_API_SECRET': 'secret',
+    'TWITTER_ACCESS_TOKEN': 'token',
+    'TWITTER_ACCESS_TOKEN_SECRET': 'token-secret',
+    'BOT_USERNAME': 'sanskrit_bot',
+}
+
+class StubAPIHandler(BaseHTTPRequestHandler):
+    """Answers every request like the Twitter API, counting connections."""
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        # Headers and body are written separately; without this, Nagle's
+        # algorithm stalls every response on a kept-alive connection
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _respond(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in self.server.rate_limit_headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        self.server.authorization.append(self.headers.get('Authorization', ''))
+        if self.path.startswith(cfg.USER_LOOKUP_ENDPOINT):
+            self._respond(200, {'data': {'id': '42', 'username': 'sanskrit_bot'}})
+        else:
+            self._respond(200, {'meta': {'result_count': 0}})
+
+    def do_POST(self):
+        self.server.authorization.append(self.headers.get('Authorization', ''))
+        length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(length))
+        self.server.posted.append(body['text'])
+        self._respond(201, {'data': {'id': '1', 'text': body['text']}})
+
+    def log_message(self, format, *args):
+        pass
+
+class RecordingPipeline:
+    """Stands in for MentionPipeline, keeping queued mentions unanswered."""
+    def __init__(self):
+        self.submitted = []
+        self.requeued = []
+
+    def submit(self, mentions, poll_time=0.0):
+        self.submitted.extend(mentions)
+
+    def requeue(self, mentions):
+        self.requeued.extend(mentions)
+
+class TestTwitterBotSession(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubAPIHandler)
+        cls.server.daemon_threads = True
+        cls.server.lock = threading.Lock()
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.connections = 0
+        self.server.authorization = []
+        self.server.posted = []
+        self.server.rate_limit_headers = {}
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.dir = temp_dir.name
+        patches = [
+            patch.dict(os.environ, CREDENTIALS),
+            patch.object(cfg, 'API_BASE_URL', self.base_url),
+            patch.object(cfg, 'MAX_MONTHLY_READS', 10000),
+            patch.object(twitter_handler, 'STATE_DB', os.path.join(temp_dir.name, 'bot_state.db')),
+            patch.object(twitter_handler, 'STATE_FILE', os.path.join(temp_dir.name, 'bot_state.json')),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        self.bot = TwitterBot()
+        self.addCleanup(self.bot.close)
+
+    def test_requests_are_signed(self):
+        """Test that the session carries the OAuth1 credentials."""
+        self.assertEqual(self.bot.user_id, '42')
+        self.assertIsNotNone(self.bot.reply_to_tweet('7', "hello"))
+        self.assertEqual(len(self.server.authorization), 2)
+        for header in self.server.authorization:
+            self.assertTrue(header.startswith('OAuth '))
+            self.assertIn('oauth_consumer_key="key"', header)
+
+    def test_connections_are_reused(self):
+        """Test that API calls share one kept-alive connection."""
+        for _ in range(20):
+            self.bot.check_mentions()
+        self.bot.reply_to_tweet('7', "hello")
+        self.assertEqual(self.server.connections, 1)
+
+    def test_keep_alive_can_be_disabled(self):
+        """Test that HTTP_KEEP_ALIVE = False opens a connection per call."""
+        with patch.object(cfg, 'HTTP_KEEP_ALIVE', False):
+            self.bot.session.close()
+            self.bot.session = self.bot._create_session()
+        self.server.connections = 0
+        for _ in range(5):
+            self.bot.check_mentions()
+        self.assertEqual(self.server.connections, 5)
+
+    def test_state_survives_restart(self):
+        """Test that API counters and processed tweets are kept across restarts."""
+        self.bot.check_mentions()
+        self.bot.check_mentions()
+        self.bot._post_reply('7', "hello")
+        self.bot.state['last_mention_id'] = '7'
+        self.bot._save_state('last_mention_id')
+        self.bot.close()
+
+        self.bot = TwitterBot()
+        self.addCleanup(self.bot.close)
+        # Two polls and one user ID lookup per start
+        self.assertEqual(self.bot.monthly_reads, 4)
+        self.assertEqual(self.bot.monthly_writes, 1)
+        self.assertEqual(self.bot.state['last_mention_id'], '7')
+        self.assertTrue(self.bot.store.is_processed('7'))
+
+    def test_queued_mentions_survive_restart(self):
+        """Test that mentions still queued when the bot stops are requeued on restart."""
+        mentions = [{'id': str(i), 'text': f"@sanskrit_bot word {i}"} for i in (13, 12, 11)]
+        pipeline = RecordingPipeline()
+        self.bot._queue_mentions(mentions, pipeline)
+        self.assertEqual(pipeline.submitted, mentions)
+
+        # Only the oldest mention was answered before the crash
+        self.bot._post_reply('11', "reply")
+        self.bot._finish_mention(mentions[2])
+        self.bot.close()
+
+        self.bot = TwitterBot()
+        self.addCleanup(self.bot.close)
+        self.assertEqual(self.bot.state['last_mention_id'], '13')
+        pipeline = RecordingPipeline()
+        self.bot._requeue_pending(pipeline)
+        self.assertEqual(pipeline.requeued, mentions[:2])
+
+        # Replied to but not yet dropped from the pending list
+        self.bot._post_reply('12', "reply")
+        self.bot.close()
+        self.bot = TwitterBot()
+        self.addCleanup(self.bot.close)
+        pipeline = RecordingPipeline()
+        self.bot._requeue_pending(pipeline)
+        self.assertEqual(pipeline.requeued, mentions[:1])
+
+        # Polled again, an answered mention is not queued twice
+        self.bot._queue_mentions(mentions[1:], pipeline)
+        self.assertEqual(pipeline.submitted, [])
+        self.assertEqual(self.bot.store.pending_mentions(), mentions[:1])
+
+    def reply_with_generator(self, dict_handler, text):
+        """Reply to one mention through the real response generator and mention pipeline."""
+        with patch('src.data.dict_handler.DictionaryHandler', return_value=dict_handler):
+            self.bot.response_gen = ResponseGenerator()
+        # As after a failed model load
+        self.bot.response_gen.model = None
+
+        pipeline = self.bot._create_pipeline()
+        pipeline.reply_interval = 0
+        pipeline.start()
+        self.bot._queue_mentions([{'id': '21', 'text': text}], pipeline)
+        pipeline.stop(timeout=5)
+        self.assertEqual(pipeline.get_statistics()['post']['processed'], 1)
+        return self.server.posted[-1]
+
+    def test_reply_without_matches(self):
+        """Test that a tweet without loanwords still gets a reply."""
+        dict_handler = DictionaryHandler(os.path.join(self.dir, 'dict.db'), preload=True)
+        reply = self.reply_with_generator(dict_handler, "@sanskrit_bot नमस्ते दुनिया")
+        self.assertEqual(reply, "क्षमा करें, इस ट्वीट में कोई संस्कृत शब्द नहीं मिला।")
+        self.assertTrue(self.bot.store.is_processed('21'))
+
+    def test_placeholder_root_is_not_tweeted(self):
+        """Test that the stand-in result used without dictionary and model is never posted."""
+        reply = self.reply_with_generator(None, "@sanskrit_bot धर्म")
+        self.assertNotIn("मूल", reply)
+
+    def test_reply_fits_in_a_tweet(self):
+        """Test that long analyses are cut to the tweet length limit."""
+        dict_handler = DictionaryHandler(os.path.join(self.dir, 'dict.db'), preload=True)
+        words = [f"शब्द{chr(0x0915 + i)}" for i in range(20)]
+        for word in words:
+            dict_handler.add_entry(DictionaryEntry(word, 'शब्द्', 'word, sound, speech', 'apte'), 'devanagari')
+
+        reply = self.reply_with_generator(dict_handler, "@sanskrit_bot " + " ".join(words))
+        self.assertLessEqual(len(reply), cfg.MAX_TWEET_LENGTH)
+        self.assertTrue(reply.endswith('…'))
+        self.assertIn(words[0], reply)
+
+    def test_known_rate_limit_is_not_sent(self):
+        """Test that a request the API has said it will reject is never sent."""
+        self.server.rate_limit_headers = {
+            'x-rate-limit-limit': '10',
+            'x-rate-limit-remaining': '0',
+            'x-rate-limit-reset': str(int(time.time()) + 3600),
+        }
+        self.bot.check_mentions()
+        self.server.rate_limit_headers = {}
+        requests_sent = len(self.server.authorization)
+
+        self.assertEqual(self.bot.check_mentions(), [])
+        self.assertEqual(len(self.server.authorization), requests_sent)
+        # The user ID lookup and the first mentions poll
+        self.assertEqual(self.bot.monthly_reads, 2)
+        # Replies go to another endpoint with its own window
+        self.assertIsNotNone(self.bot.reply_to_tweet('7', "hello"))
+
+        # The learned window survives a restart
+        self.bot.close()
+        self.bot = TwitterBot()
+        self.addCleanup(self.bot.close)
+        self.assertEqual(self.bot.check_mentions(), [])
+        self.assertEqual(len(self.server.authorization), requests_sent + 2)
+
+    def test_quota_history(self):
+        """Test that requests are recorded per endpoint."""
+        self.bot.check_mentions()
+        self.bot.check_mentions()
+        self.bot.reply_to_tweet('7', "hello")
+        usage = {(row['endpoint'], row['kind']): row['count'] for row in self.bot.quota.history(1)}
+        self.assertEqual(usage, {
+            ('GET /users/me', 'reads'): 1,
+            ('GET /users/:id/mentions', 'reads'): 2,
+            ('POST /tweets', 'writes'): 1
+        })
+
+        # Each restart looks the user ID up again, and that read is counted too
+        self.bot.close()
+        self.bot = TwitterBot()
+        self.addCleanup(self.bot.close)
+        self.assertEqual(self.bot.monthly_reads, 4)
+        usage = {(row['endpoint'], row['kind']): row['count'] for row in self.bot.quota.history(1)}
+        self.assertEqual(usage[('GET /users/me', 'reads')], 2)
+
+    def test_pooled_session_skips_handshakes(self):
+        """Test that the pooled session avoids the connection setup unpooled calls pay for each time.
+
+        Latency numbers are measured by scripts/benchmark_api_latency.py.
+        """
+        url = f"{self.base_url}{cfg.MENTIONS_ENDPOINT.format(user_id='42')}"
+        self.bot.session.get(url)
+
+        self.server.connections = 0
+        for _ in range(10):
+            requests.get(url, auth=self.bot.auth)
+        self.assertEqual(self.server.connections, 10)
+
+        self.server.connections = 0
+        for _ in range(10):
+            self.bot.session.get(url)
+        self.assertEqual(self.server.connections, 0)
+
+if __name__ == '__main__':
+    unittest.main()